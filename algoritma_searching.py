@@ -6,13 +6,18 @@ Developer: Ahmad Rasyid - Teknik Informatika
 Date: 2025-12-15
 """
 
+from bisect import bisect_left
 from typing import List, Tuple, Optional
 from mahasiswa import Mahasiswa
+from instrumentasi import is_instrumented
 
 
 class AlgoritmaSearching:
     """
     Class untuk mengimplementasikan berbagai algoritma searching.
+    
+    Jika instrumentasi dimatikan (instrumentasi.set_instrumented(False)),
+    pencarian berjalan tanpa counter dan jumlah perbandingan = None.
     """
     
     @staticmethod
@@ -52,9 +57,16 @@ class AlgoritmaSearching:
             search_value: Nilai yang dicari (case-insensitive)
         
         Returns:
-            Tuple (index yang ditemukan atau None, jumlah perbandingan)
+            Tuple (index yang ditemukan atau None, jumlah perbandingan
+            atau None di mode produksi)
         """
         search_value_lower = str(search_value).lower()
+        if not is_instrumented():
+            for index, item in enumerate(data):
+                if search_value_lower in str(item.get(search_key, "")).lower():
+                    return index, None
+            return None, None
+        
         comparison_count = 0
         
         for index, item in enumerate(data):
@@ -85,8 +97,15 @@ class AlgoritmaSearching:
             search_value: Nilai yang dicari
         
         Returns:
-            Tuple (index yang ditemukan atau None, jumlah perbandingan)
+            Tuple (index yang ditemukan atau None, jumlah perbandingan
+            atau None di mode produksi)
         """
+        if not is_instrumented():
+            for index, item in enumerate(data):
+                if search_value == str(item.get(search_key, "")):
+                    return index, None
+            return None, None
+        
         comparison_count = 0
         
         for index, item in enumerate(data):
@@ -138,8 +157,19 @@ class AlgoritmaSearching:
             search_value: Nilai yang dicari (exact match)
         
         Returns:
-            Tuple (index yang ditemukan atau None, jumlah perbandingan)
+            Tuple (index yang ditemukan atau None, jumlah perbandingan
+            atau None di mode produksi)
         """
+        if not is_instrumented():
+            # bisect di C; untuk nilai duplikat mengembalikan index paling kiri
+            search_value_str = str(search_value)
+            index = bisect_left(
+                data, search_value_str, key=lambda item: str(item.get(search_key, ""))
+            )
+            if index < len(data) and str(data[index].get(search_key, "")) == search_value_str:
+                return index, None
+            return None, None
+        
         left = 0
         right = len(data) - 1
         comparison_count = 0
@@ -6,16 +6,478 @@ Developer: Ahmad Rasyid - Teknik Informatika
 Date: 2025-12-15
 """
 
-from typing import List, Tuple, Callable
-from mahasiswa import Mahasiswa
+import heapq
+import json
+import os
+import random
+import sys
+import tempfile
+from array import array
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import ShareableList
+from typing import Any, List, Tuple, Callable, Dict, Iterator, TextIO
+from mahasiswa import Mahasiswa, MahasiswaTable
+from crud_manager import CRUDManager
+from instrumentasi import is_instrumented
+
+
+# ========== HELPER UNTUK PARALLEL MERGE SORT ==========
+
+# Run yang lebih pendek dari ini diperpanjang dengan insertion sort
+_MIN_RUN = 32
+
+
+def _copy_records(data) -> List[dict]:
+    """
+    Salinan data sebagai list dict: Mahasiswa objects lewat info(),
+    MahasiswaTable lewat row(), dict disalin agar data asli tidak berubah.
+    """
+    if isinstance(data, MahasiswaTable):
+        return data.to_records()
+    if data and hasattr(data[0], 'info'):
+        return [mahasiswa.info() for mahasiswa in data]
+    return [dict(item) for item in data]
+
+
+def _record_refs(data) -> List:
+    """
+    Record sebagai list tanpa menyalin dict: Mahasiswa objects lewat info(),
+    list dict dipakai apa adanya (hasil sorting berisi referensi dict yang sama).
+    """
+    if data and hasattr(data[0], 'info'):
+        return [mahasiswa.info() for mahasiswa in data]
+    return data
+
+
+def _key_column(data, key: str) -> List:
+    """Nilai kunci setiap record; MahasiswaTable langsung dari kolomnya."""
+    if isinstance(data, MahasiswaTable):
+        return data.column(key)
+    return [
+        getattr(item, key) if hasattr(item, 'info') else item[key]
+        for item in data
+    ]
+
+
+def _sort_builtin(arr: List[dict], key: str, ascending: bool) -> List[dict]:
+    """
+    Jalur cepat mode produksi: Timsort bawaan Python (di C, tanpa counter).
+    reverse=True tetap stabil, sehingga urutan hasil sama dengan algoritma
+    edukasi yang stabil (nilai sama mengikuti urutan data) untuk kedua arah.
+    """
+    arr.sort(key=itemgetter(key), reverse=not ascending)
+    return arr
+
+
+def _merge_sort_indices(
+    keys: List,
+    indices: List[int],
+    ascending: bool
+) -> Tuple[List[int], int]:
+    """
+    Bottom-up merge sort atas daftar index (bukan dict) agar hanya kunci
+    yang dibandingkan dan dipindahkan.
+    
+    Tidak ada rekursi dan slicing per level: run alami dideteksi lebih dulu
+    (run menurun tegas dibalik), run pendek diperpanjang dengan binary
+    insertion sort sampai _MIN_RUN, lalu run di-merge berpasangan dengan bolak-balik
+    (ping-pong) antara dua buffer yang dialokasikan sekali.
+    
+    Args:
+        keys: Nilai kunci, diakses lewat index (list atau dict)
+        indices: Index yang akan diurutkan
+        ascending: True untuk ascending, False untuk descending
+    
+    Returns:
+        Tuple (index terurut, jumlah perbandingan)
+    """
+    src = array('q', indices)
+    n = len(src)
+    comparison_count = 0
+    
+    # ===== Tahap 1: deteksi run alami + insertion sort untuk run pendek =====
+    bounds = [0]
+    start = 0
+    while start < n:
+        end = start + 1
+        if end < n:
+            comparison_count += 1
+            first, second = keys[src[start]], keys[src[end]]
+            end += 1
+            if (second < first) if ascending else (second > first):
+                # Run menurun tegas: perpanjang lalu balik (tetap stabil)
+                while end < n:
+                    comparison_count += 1
+                    current, previous = keys[src[end]], keys[src[end - 1]]
+                    if not ((current < previous) if ascending else (current > previous)):
+                        break
+                    end += 1
+                i, j = start, end - 1
+                while i < j:
+                    src[i], src[j] = src[j], src[i]
+                    i += 1
+                    j -= 1
+            else:
+                while end < n:
+                    comparison_count += 1
+                    current, previous = keys[src[end]], keys[src[end - 1]]
+                    if (current < previous) if ascending else (current > previous):
+                        break
+                    end += 1
+        
+        if end - start < _MIN_RUN and end < n:
+            # Binary insertion sort: posisi sisip dicari dengan O(log run)
+            # perbandingan, disisipkan setelah kunci yang sama (stabil)
+            stop = min(start + _MIN_RUN, n)
+            for i in range(end, stop):
+                item = src[i]
+                item_key = keys[item]
+                left, right = start, i
+                while left < right:
+                    middle = (left + right) // 2
+                    comparison_count += 1
+                    middle_key = keys[src[middle]]
+                    if (item_key < middle_key) if ascending else (item_key > middle_key):
+                        right = middle
+                    else:
+                        left = middle + 1
+                src[left + 1:i + 1] = src[left:i]
+                src[left] = item
+            end = stop
+        
+        bounds.append(end)
+        start = end
+    
+    # ===== Tahap 2: merge run berpasangan, ping-pong antara src dan dst =====
+    dst = array('q', bytes(8 * n))
+    while len(bounds) > 2:
+        new_bounds = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[r], bounds[r + 1]
+            if r + 2 >= len(bounds):
+                # Run sisa tanpa pasangan: salin apa adanya
+                dst[lo:mid] = src[lo:mid]
+                new_bounds.append(mid)
+                continue
+            
+            hi = bounds[r + 2]
+            i, j, out = lo, mid, lo
+            while i < mid and j < hi:
+                comparison_count += 1
+                val_left = keys[src[i]]
+                val_right = keys[src[j]]
+                if (val_left <= val_right) if ascending else (val_left >= val_right):
+                    dst[out] = src[i]
+                    i += 1
+                else:
+                    dst[out] = src[j]
+                    j += 1
+                out += 1
+            
+            # Tambahkan sisa elemen
+            if i < mid:
+                dst[out:hi] = src[i:mid]
+            else:
+                dst[out:hi] = src[j:hi]
+            new_bounds.append(hi)
+        
+        src, dst = dst, src
+        bounds = new_bounds
+    
+    return src, comparison_count
+
+
+def _sort_chunk_worker(
+    shm_name: str,
+    start: int,
+    end: int,
+    ascending: bool
+) -> Tuple[List[int], int]:
+    """
+    Worker process: urutkan potongan [start, end) dari kunci di shared memory.
+    
+    Hanya nama shared memory dan batas potongan yang dikirim ke process lain,
+    sehingga dict mahasiswa tidak perlu di-pickle.
+    """
+    shared_keys = ShareableList(name=shm_name)
+    try:
+        keys = {i: shared_keys[i] for i in range(start, end)}
+        return _merge_sort_indices(keys, list(range(start, end)), ascending)
+    finally:
+        shared_keys.shm.close()
+
+
+class _RunHead:
+    """Kepala satu run pada k-way merge; perbandingan dihitung lewat counter."""
+    
+    __slots__ = ("key", "run", "pos", "ascending", "counter")
+    
+    def __init__(self, key, run: int, ascending: bool, counter: List[int]):
+        self.key = key
+        self.run = run
+        self.pos = 0
+        self.ascending = ascending
+        self.counter = counter
+    
+    def __lt__(self, other: "_RunHead") -> bool:
+        self.counter[0] += 1
+        if self.key == other.key:
+            # Stabil: run yang lebih awal (posisi asli lebih kecil) didahulukan
+            return self.run < other.run
+        if self.ascending:
+            return self.key < other.key
+        return self.key > other.key
+
+
+class _TopKEntry:
+    """
+    Entry untuk bounded heap top-k. Root heap selalu entry "terburuk" yang
+    masih disimpan, sehingga bisa langsung diganti oleh kandidat yang lebih baik.
+    """
+    
+    __slots__ = ("key", "order", "item", "ascending", "counter")
+    
+    def __init__(self, key, order: int, item, ascending: bool, counter: List[int]):
+        self.key = key
+        self.order = order
+        self.item = item
+        self.ascending = ascending
+        self.counter = counter
+    
+    def __lt__(self, other: "_TopKEntry") -> bool:
+        # True jika self lebih buruk (harus keluar lebih dulu) daripada other
+        self.counter[0] += 1
+        if self.key == other.key:
+            # Stabil: record yang muncul belakangan dianggap lebih buruk
+            return self.order > other.order
+        if self.ascending:
+            return self.key > other.key
+        return self.key < other.key
+
+
+# ========== GAP SEQUENCE UNTUK SHELL SORT ==========
+
+# Ciura (2001) - diperoleh secara empiris, diperpanjang dengan faktor 2.25
+_CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701]
+
+# Kompleksitas per gap sequence: (average case, worst case)
+SHELL_GAP_COMPLEXITY = {
+    "shell": ("O(n^1.5)", "O(n²)"),
+    "knuth": ("O(n^1.25)", "O(n^1.5)"),
+    "sedgewick": ("O(n^7/6)", "O(n^4/3)"),
+    "tokuda": ("O(n^1.25) (empiris)", "Belum diketahui"),
+    "ciura": ("O(n^1.25) (empiris)", "Belum diketahui"),
+}
+
+
+def _shell_gaps(n: int, sequence: str) -> List[int]:
+    """
+    Hasilkan gap sequence (menurun, diakhiri 1) untuk array berukuran n.
+    
+    Args:
+        n: Ukuran array
+        sequence: "shell", "knuth", "sedgewick", "tokuda" atau "ciura"
+    
+    Raises:
+        ValueError: Jika nama sequence tidak dikenal
+    """
+    if sequence == "shell":
+        # n/2, n/4, ..., 1 (Shell, 1959)
+        gaps = []
+        gap = n // 2
+        while gap > 0:
+            gaps.append(gap)
+            gap //= 2
+        return gaps
+    
+    if sequence == "knuth":
+        # (3^k - 1) / 2 = 1, 4, 13, 40, ... dengan gap terbesar <= n/3
+        gaps = [1]
+        while gaps[-1] * 3 + 1 <= max(1, n // 3):
+            gaps.append(gaps[-1] * 3 + 1)
+    elif sequence == "sedgewick":
+        # 4^k + 3·2^(k-1) + 1 = 1, 8, 23, 77, 281, ... (Sedgewick, 1986)
+        gaps = [1]
+        k = 1
+        while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+            gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+            k += 1
+    elif sequence == "tokuda":
+        # ceil((9^k - 4^k) / (5·4^(k-1))) = 1, 4, 9, 20, 46, ... (Tokuda, 1992)
+        gaps = [1]
+        k = 2
+        while True:
+            gap = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+            if gap >= n:
+                break
+            gaps.append(gap)
+            k += 1
+    elif sequence == "ciura":
+        gaps = list(_CIURA_GAPS)
+        while int(gaps[-1] * 2.25) < n:
+            gaps.append(int(gaps[-1] * 2.25))
+        gaps = [gap for gap in gaps if gap < n] or [1]
+    else:
+        raise ValueError(
+            f"Gap sequence '{sequence}' tidak dikenal. "
+            f"Pilih salah satu dari: {', '.join(SHELL_GAP_COMPLEXITY)}"
+        )
+    
+    return gaps[::-1]
+
+
+# ========== HELPER UNTUK EXTERNAL MERGE SORT ==========
+
+class _JsonStream:
+    """Buffer baca JSON streaming: decode nilai satu per satu dari file teks."""
+    
+    def __init__(self, f: TextIO, buffer_size: int):
+        self._file = f
+        self._buffer_size = buffer_size
+        self._decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def _isi(self) -> bool:
+        """Tambah satu chunk ke buffer; False jika file sudah habis."""
+        if self.eof:
+            return False
+        chunk = self._file.read(self._buffer_size)
+        self.eof = not chunk
+        self.buffer, self.pos = self.buffer[self.pos:] + chunk, 0
+        return bool(chunk)
+    
+    def peek(self, lewati: str = ' \t\r\n') -> str:
+        """Karakter berikutnya setelah karakter di lewati ('' jika EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in lewati:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._isi():
+                return ''
+    
+    def value(self) -> Any:
+        """Decode satu nilai JSON mulai dari posisi saat ini."""
+        while True:
+            try:
+                value, self.pos = self._decoder.raw_decode(self.buffer, self.pos)
+                return value
+            except json.JSONDecodeError as e:
+                # Nilai terpotong di akhir buffer: baca chunk berikutnya
+                if not self._isi():
+                    raise IOError(f"File JSON corrupt: {str(e)}")
+
+
+def _baca_header_kode(stream: _JsonStream, file_path: str) -> Dict[str, List[str]]:
+    """
+    Baca header file code table CRUDManager (encode_on_disk) sampai awal
+    array "records"; return tabel "kode". Hanya header (format + kode)
+    yang dimuat utuh, record tetap dibaca streaming.
+    
+    Raises:
+        IOError: Jika object bukan format CRUDManager.FORMAT_KODE
+    """
+    header = {}
+    stream.pos += 1  # '{'
+    while stream.peek(' \t\r\n,') == '"':
+        field = stream.value()
+        if stream.peek() != ':':
+            break
+        stream.pos += 1
+        if field == "records":
+            if (header.get("format") == CRUDManager.FORMAT_KODE and "kode" in header
+                    and stream.peek() == '['):
+                return header["kode"]
+            break
+        header[field] = stream.value()
+    raise IOError(
+        f"File {file_path} bukan JSON array atau file code table {CRUDManager.FORMAT_KODE}"
+    )
+
+
+def _iter_json_array(file_path: str, buffer_size: int = 1 << 16) -> Iterator[dict]:
+    """
+    Baca file JSON berisi array object secara streaming, satu record per yield.
+    
+    File tidak pernah dimuat utuh ke memory; hanya buffer berukuran
+    buffer_size (plus satu record yang sedang di-decode).
+    
+    File code table CRUDManager (encode_on_disk=True, format
+    {"format": "kode-v1", "kode": {...}, "records": [...]}) juga diterima:
+    array "records" dibaca streaming dan setiap record di-decode.
+    
+    Raises:
+        IOError: Jika file bukan JSON array / file code table yang valid
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = _JsonStream(f, buffer_size)
+        kode = None
+        awal = stream.peek()
+        if awal == '{':
+            kode = _baca_header_kode(stream, file_path)
+        elif awal != '[':
+            raise IOError(f"File {file_path} bukan JSON array")
+        stream.pos += 1  # '['
+        
+        while True:
+            # Lewati whitespace dan koma antar elemen
+            karakter = stream.peek(' \t\r\n,')
+            if not karakter:
+                raise IOError(f"File JSON {file_path} terpotong")
+            if karakter == ']':
+                return
+            
+            record = stream.value()
+            yield record if kode is None else CRUDManager.decode_record(record, kode)
+
+
+def _estimate_record_size(record: dict) -> int:
+    """Perkiraan kasar memory (byte) yang dipakai satu record dict."""
+    return sys.getsizeof(record) + sum(
+        sys.getsizeof(k) + sys.getsizeof(v) for k, v in record.items()
+    )
+
+
+def _write_run(records: List[dict], temp_dir: str = None) -> str:
+    """Tulis satu run terurut ke file temporary (JSON Lines), return path-nya."""
+    with tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', suffix='.jsonl', dir=temp_dir, delete=False
+    ) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+        return f.name
+
+
+def _read_run(run_path: str) -> Iterator[dict]:
+    """Baca run JSON Lines secara streaming."""
+    with open(run_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
 
 
 class AlgoritmaSorting:
     """
     Class untuk mengimplementasikan berbagai algoritma sorting.
     Setiap metode sorting mencatat jumlah perbandingan untuk analisis.
+    
+    Jika instrumentasi dimatikan (instrumentasi.set_instrumented(False)),
+    metode berbasis perbandingan memakai sorted() bawaan Python dan
+    mengembalikan None sebagai jumlah perbandingan.
     """
     
+    # Batas ukuran data untuk algoritma O(n²) agar session tidak hang
+    BATAS_QUADRATIC = 5_000
+    
+    # Ambang keputusan untuk auto_sort
+    AUTO_DATA_KECIL = 16
+    AUTO_RASIO_INVERSI = 0.005
+    AUTO_SAMPEL_INVERSI = 256
+    AUTO_MAX_CARDINALITY = 64
+    
     @staticmethod
     def bubble_sort(
         data: List,
@@ -47,13 +509,23 @@ class AlgoritmaSorting:
             ascending: True untuk ascending, False untuk descending
         
         Returns:
-            Tuple (data terurut, jumlah perbandingan)
+            Tuple (data terurut, jumlah perbandingan atau None di mode produksi)
+        
+        Raises:
+            ValueError: Jika jumlah data melebihi BATAS_QUADRATIC (mode edukasi)
         """
+        instrumented = is_instrumented()
+        if instrumented and len(data) > AlgoritmaSorting.BATAS_QUADRATIC:
+            raise ValueError(
+                f"Bubble Sort O(n²) dibatasi maksimal "
+                f"{AlgoritmaSorting.BATAS_QUADRATIC} data (diberikan {len(data)}). "
+                f"Gunakan Merge Sort atau mode Auto"
+            )
+        
         # Copy data - handle both Mahasiswa objects and dicts
-        if data and hasattr(data[0], 'info'):
-            arr = [mahasiswa.info() for mahasiswa in data]
-        else:
-            arr = [dict(item) for item in data]
+        arr = _copy_records(data)
+        if not instrumented:
+            return _sort_builtin(arr, key, ascending), None
         n = len(arr)
         comparison_count = 0
         
@@ -92,87 +564,658 @@ class AlgoritmaSorting:
         
         ===== ANALISIS MERGE SORT =====
         Time Complexity:
-        - Best Case: O(n log n) - selalu sama, terlepas dari kondisi data
+        - Best Case: O(n) - data sudah terurut menjadi satu run alami
         - Average Case: O(n log n) - konsisten untuk semua kasus
         - Worst Case: O(n log n) - bahkan data terbalik
         
-        Space Complexity: O(n) - memerlukan array tambahan untuk merge
+        Space Complexity: O(n) - dua buffer index yang dialokasikan sekali;
+                          dict record tidak disalin, hasil berisi referensi
+                          dict yang sama dengan data (jangan diubah)
         
-        Cara Kerja (Divide & Conquer):
-        1. Divide: Bagi array menjadi 2 bagian sampai ukuran 1 elemen
-        2. Conquer: Merge array yang sudah terurut dengan membandingkan
-        3. Combine: Gabungkan subarray yang sudah terurut
+        Cara Kerja (Bottom-Up, tanpa rekursi):
+        1. Divide: Deteksi run yang sudah terurut (run alami); run pendek
+           diperpanjang dengan binary insertion sort sampai 32 elemen
+        2. Conquer: Merge run yang bersebelahan dengan membandingkan kunci
+        3. Combine: Ulangi merge per level, bolak-balik antara dua buffer,
+           sampai tersisa satu run
         
         Keuntungan: Stabil (urutan relatif sama) dan O(n log n) konsisten
         Kerugian: Memerlukan memory tambahan O(n)
         
         Args:
-            data: List mahasiswa yang akan diurutkan (bisa Mahasiswa objects atau dicts)
+            data: List mahasiswa yang akan diurutkan (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut untuk sorting ("nama" atau "nim")
+            ascending: True untuk ascending, False untuk descending
+        
+        Returns:
+            Tuple (data terurut, jumlah perbandingan atau None di mode produksi)
+        """
+        if isinstance(data, MahasiswaTable) and is_instrumented():
+            # Kolumnar: urutkan kolom kunci, baris diwujudkan sesuai urutan hasil
+            order, comparison_count = _merge_sort_indices(
+                data.column(key), range(len(data)), ascending
+            )
+            return [data.row(i) for i in order], comparison_count
+        
+        arr = _record_refs(data)
+        if not is_instrumented():
+            return sorted(arr, key=itemgetter(key), reverse=not ascending), None
+        
+        # Sorting dilakukan atas index; referensi dict hanya disusun sekali di akhir
+        keys = [item[key] for item in arr]
+        order, comparison_count = _merge_sort_indices(keys, range(len(arr)), ascending)
+        return [arr[i] for i in order], comparison_count
+    
+    @staticmethod
+    def parallel_merge_sort(
+        data: List,
+        key: str = "nama",
+        ascending: bool = True,
+        workers: int = None,
+        min_chunk_size: int = 50_000
+    ) -> Tuple[List, int]:
+        """
+        Parallel Merge Sort - Merge Sort yang dibagi ke beberapa process.
+        
+        ===== ANALISIS PARALLEL MERGE SORT =====
+        Time Complexity:
+        - Sort per chunk: O((n/p) log(n/p)) dikerjakan paralel oleh p process
+        - K-way merge: O(n log p) menggunakan heap
+        
+        Space Complexity: O(n) - list index dan kunci di shared memory
+        
+        Cara Kerja:
+        1. Ambil kunci sorting saja, simpan di shared memory (ShareableList)
+        2. Bagi kunci menjadi p chunk, urutkan setiap chunk di ProcessPoolExecutor
+        3. Setiap worker hanya mengembalikan index terurut + jumlah perbandingan
+        4. Gabungkan semua run dengan k-way merge berbasis heap (stabil)
+        
+        Untuk data kecil (kurang dari min_chunk_size per worker) overhead process
+        lebih besar dari keuntungannya, sehingga sorting dilakukan di process ini.
+        
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
             key: Atribut untuk sorting ("nama" atau "nim")
             ascending: True untuk ascending, False untuk descending
+            workers: Jumlah process (default: jumlah CPU)
+            min_chunk_size: Ukuran minimal chunk per worker
+        
+        Returns:
+            Tuple (data terurut, jumlah perbandingan total atau None di mode produksi)
+        """
+        arr = _copy_records(data)
+        if not is_instrumented():
+            # Timsort di C lebih cepat daripada overhead process pool
+            return _sort_builtin(arr, key, ascending), None
+        n = len(arr)
+        keys = [item[key] for item in arr]
+        
+        workers = workers or os.cpu_count() or 1
+        workers = max(1, min(workers, n // max(1, min_chunk_size)))
+        
+        if workers == 1:
+            order, comparisons = _merge_sort_indices(keys, list(range(n)), ascending)
+            return [arr[i] for i in order], comparisons
+        
+        # Batas chunk: [bounds[i], bounds[i + 1])
+        bounds = [n * i // workers for i in range(workers + 1)]
+        shared_keys = ShareableList(keys)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _sort_chunk_worker, shared_keys.shm.name,
+                        bounds[i], bounds[i + 1], ascending
+                    )
+                    for i in range(workers)
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            shared_keys.shm.close()
+            shared_keys.shm.unlink()
+        
+        runs = [run for run, _ in results]
+        comparison_count = [sum(count for _, count in results)]
+        
+        # K-way merge dengan heap
+        heap = [
+            _RunHead(keys[run[0]], run_index, ascending, comparison_count)
+            for run_index, run in enumerate(runs) if run
+        ]
+        heapq.heapify(heap)
+        result = []
+        while heap:
+            head = heap[0]
+            run = runs[head.run]
+            result.append(arr[run[head.pos]])
+            head.pos += 1
+            if head.pos < len(run):
+                head.key = keys[run[head.pos]]
+                heapq.heapreplace(heap, head)
+            else:
+                heapq.heappop(heap)
+        
+        return result, comparison_count[0]
+    
+    @staticmethod
+    def external_merge_sort(
+        file_path: str,
+        output: TextIO,
+        key: str = "nama",
+        ascending: bool = True,
+        memory_limit: int = 32 * 1024 * 1024,
+        max_fan_in: int = 64,
+        predicate: Callable[[dict], bool] = None,
+        temp_dir: str = None
+    ) -> Dict[str, int]:
+        """
+        External Merge Sort - sorting data yang lebih besar dari memory.
+        
+        ===== ANALISIS EXTERNAL MERGE SORT =====
+        Time Complexity: O(n log n) perbandingan
+        I/O: O(n) per pass, jumlah pass = 1 + ceil(log_F(jumlah run))
+        
+        Space Complexity: O(M) - M = memory_limit, bukan O(n)
+        
+        Cara Kerja:
+        1. Run generation: baca record secara streaming dari file JSON,
+           kumpulkan sampai memory_limit, urutkan, tulis ke file temporary
+        2. Merge pass: gabungkan maksimal max_fan_in run sekaligus dengan
+           heapq.merge (k-way merge, stabil)
+        3. Ulangi merge pass sampai tersisa satu output
+        
+        Args:
+            file_path: Path file JSON sumber (array of dict, atau file code
+                       table CRUDManager dengan encode_on_disk=True)
+            output: Stream teks tujuan; hasil ditulis sebagai JSON Lines
+            key: Atribut untuk sorting
+            ascending: True untuk ascending, False untuk descending
+            memory_limit: Batas perkiraan memory (byte) untuk satu run
+            max_fan_in: Jumlah run maksimal yang di-merge dalam satu pass
+            predicate: Filter opsional, contoh: lambda m: m["status"] == "lulus"
+            temp_dir: Direktori untuk file run (default: temp sistem)
+        
+        Returns:
+            Dictionary berisi jumlah_record, jumlah_run dan jumlah_pass
+        """
+        sort_key = lambda record: record[key]
+        run_paths = []
+        total_record = 0
+        
+        try:
+            # ===== Pass 1: Run generation =====
+            buffer = []
+            buffer_size = 0
+            for record in _iter_json_array(file_path):
+                if predicate is not None and not predicate(record):
+                    continue
+                buffer.append(record)
+                buffer_size += _estimate_record_size(record)
+                total_record += 1
+                
+                if buffer_size >= memory_limit:
+                    buffer.sort(key=sort_key, reverse=not ascending)
+                    run_paths.append(_write_run(buffer, temp_dir))
+                    buffer = []
+                    buffer_size = 0
+            
+            if buffer or not run_paths:
+                buffer.sort(key=sort_key, reverse=not ascending)
+                run_paths.append(_write_run(buffer, temp_dir))
+            
+            jumlah_run = len(run_paths)
+            jumlah_pass = 1
+            
+            # ===== Pass 2..k: Merge sampai run muat dalam satu fan-in =====
+            fan_in = max(2, max_fan_in)
+            while len(run_paths) > fan_in:
+                merged_paths = []
+                for i in range(0, len(run_paths), fan_in):
+                    group = run_paths[i:i + fan_in]
+                    merged = heapq.merge(
+                        *[_read_run(path) for path in group],
+                        key=sort_key, reverse=not ascending
+                    )
+                    merged_paths.append(_write_run(merged, temp_dir))
+                    for path in group:
+                        os.remove(path)
+                run_paths = merged_paths
+                jumlah_pass += 1
+            
+            # ===== Pass terakhir: Merge ke output stream =====
+            merged = heapq.merge(
+                *[_read_run(path) for path in run_paths],
+                key=sort_key, reverse=not ascending
+            )
+            for record in merged:
+                output.write(json.dumps(record, ensure_ascii=False))
+                output.write('\n')
+            jumlah_pass += 1
+        
+        finally:
+            for path in run_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+        
+        return {
+            "jumlah_record": total_record,
+            "jumlah_run": jumlah_run,
+            "jumlah_pass": jumlah_pass
+        }
+    
+    @staticmethod
+    def radix_sort(
+        data: List,
+        key: str = "nim",
+        ascending: bool = True
+    ) -> Tuple[List, Dict[str, int]]:
+        """
+        LSD Radix Sort - sorting tanpa perbandingan untuk kunci berupa angka.
+        
+        ===== ANALISIS RADIX SORT =====
+        Time Complexity:
+        - Best/Average/Worst Case: O(d·n) - d = jumlah digit (NIM: 8-12)
+        
+        Space Complexity: O(n + k) - k = 11 bucket (sentinel + digit 0-9)
+        
+        Cara Kerja (Least Significant Digit):
+        1. Samakan panjang kunci: NIM string di-pad kanan dengan sentinel
+           (urutan leksikografis, sama dengan algoritma lain), angka int
+           di-pad kiri dengan '0' (urutan numerik)
+        2. Mulai dari digit paling kanan, distribusikan index ke bucket
+           dengan counting sort yang stabil
+        3. Ulangi untuk setiap digit sampai digit paling kiri
+        
+        Keuntungan: Tidak ada perbandingan antar elemen, linear terhadap n
+        Kerugian: Hanya untuk kunci berupa angka dengan panjang terbatas
+        
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut untuk sorting (biasanya "nim" atau "tahun_masuk")
+            ascending: True untuk ascending, False untuk descending
         
         Returns:
-            Tuple (data terurut, jumlah perbandingan)
+            Tuple (data terurut, {"jumlah_pass": d, "operasi_bucket": d·n})
+        
+        Raises:
+            ValueError: Jika ada kunci yang bukan angka
         """
-        # Handle both Mahasiswa objects and dicts
-        if data and hasattr(data[0], 'info'):
-            arr = [mahasiswa.info() for mahasiswa in data]
+        arr = _copy_records(data)
+        n = len(arr)
+        keys = [item[key] for item in arr]
+        
+        if not keys:
+            return arr, {"jumlah_pass": 0, "operasi_bucket": 0}
+        
+        # Normalisasi kunci menjadi string digit dengan panjang sama.
+        # '/' (ASCII 47) tepat sebelum '0', sehingga ord(c) - 47 memberi
+        # bucket 0 untuk sentinel dan 1-10 untuk digit 0-9.
+        if all(isinstance(k, int) and not isinstance(k, bool) and k >= 0 for k in keys):
+            width = len(str(max(keys)))
+            padded = [str(k).zfill(width) for k in keys]
+        elif all(isinstance(k, str) and k.isascii() and k.isdigit() for k in keys):
+            # isascii(): isdigit() saja juga menerima digit Unicode ('８', '²')
+            # yang tidak punya bucket
+            width = max(len(k) for k in keys)
+            padded = [k.ljust(width, '/') for k in keys]
         else:
-            arr = [dict(item) for item in data]
-        comparison_count = [0]  # Gunakan list agar bisa dimodifikasi di nested function
-        
-        def merge_sort_recursive(arr_segment: List[dict]) -> List[dict]:
-            """Rekursi untuk merge sort."""
-            # Base case: array dengan 1 elemen sudah terurut
-            if len(arr_segment) <= 1:
-                return arr_segment
+            raise ValueError(f"Radix sort hanya untuk kunci berupa angka (key: {key})")
+        
+        bucket_count = 11
+        bucket_order = range(bucket_count) if ascending else range(bucket_count - 1, -1, -1)
+        order = array('q', range(n))
+        output = array('q', bytes(8 * n))
+        
+        for position in range(width - 1, -1, -1):
+            digits = array('B', [ord(k[position]) - 47 for k in padded])
+            
+            # Hitung isi setiap bucket
+            counts = [0] * bucket_count
+            for digit in digits:
+                counts[digit] += 1
             
-            # Divide: bagi array menjadi 2 bagian
-            mid = len(arr_segment) // 2
-            left = arr_segment[:mid]
-            right = arr_segment[mid:]
+            # Posisi awal setiap bucket (urutan bucket dibalik untuk descending)
+            starts = [0] * bucket_count
+            total = 0
+            for bucket in bucket_order:
+                starts[bucket] = total
+                total += counts[bucket]
             
-            # Conquer: urutkan kedua bagian secara rekursif
-            left = merge_sort_recursive(left)
-            right = merge_sort_recursive(right)
+            # Distribusi stabil: urutan dari pass sebelumnya dipertahankan
+            for index in order:
+                digit = digits[index]
+                output[starts[digit]] = index
+                starts[digit] += 1
             
-            # Combine: merge kedua bagian yang sudah terurut
-            return merge(left, right)
+            order, output = output, order
+        
+        return [arr[i] for i in order], {
+            "jumlah_pass": width,
+            # Setiap pass memindahkan tepat n index
+            "operasi_bucket": width * n
+        }
+    
+    @staticmethod
+    def is_low_cardinality(data: List, key: str, max_cardinality: int = 64) -> bool:
+        """
+        Cek apakah kunci hanya memiliki sedikit nilai berbeda (jurusan, status, dll).
+        Berhenti lebih awal begitu jumlah nilai berbeda melewati batas.
+        
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut yang dicek
+            max_cardinality: Batas jumlah nilai berbeda
+        
+        Returns:
+            True jika jumlah nilai berbeda <= max_cardinality
+        """
+        if isinstance(data, MahasiswaTable) and key in data.KOLOM_KODE:
+            # Kolom dictionary-encoded: jumlah kategori sudah diketahui
+            return len(data.codes(key)[1]) <= max_cardinality
+        
+        distinct = set()
+        for item in data:
+            distinct.add(getattr(item, key) if hasattr(item, 'info') else item[key])
+            if len(distinct) > max_cardinality:
+                return False
+        return True
+    
+    @staticmethod
+    def counting_sort(
+        data: List,
+        key: str = "jurusan",
+        ascending: bool = True,
+        value_counts: Dict = None
+    ) -> Tuple[List, Dict[str, int]]:
+        """
+        Counting Sort - bucketing untuk kunci dengan sedikit nilai berbeda.
+        
+        ===== ANALISIS COUNTING SORT =====
+        Time Complexity:
+        - Best/Average/Worst Case: O(n + k log k) - k = jumlah nilai berbeda
+          (hanya k nilai berbeda yang dibandingkan, bukan n record)
+        
+        Space Complexity: O(n + k)
+        
+        Cara Kerja:
+        1. Hitung jumlah record per nilai kunci (atau pakai value_counts yang
+           sudah ada, contoh: get_statistik()["total_per_jurusan"])
+        2. Urutkan k nilai berbeda, hitung posisi awal setiap bucket
+        3. Satu pass: letakkan setiap record di posisi bucket-nya (stabil)
+        
+        Cocok untuk: jurusan, status, tahun_masuk
         
-        def merge(left: List[dict], right: List[dict]) -> List[dict]:
-            """Merge dua array yang sudah terurut."""
-            result = []
-            i = j = 0
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut untuk sorting
+            ascending: True untuk ascending, False untuk descending
+            value_counts: Jumlah record per nilai kunci (opsional); diabaikan
+                jika tidak cocok dengan data
+        
+        Returns:
+            Tuple (data terurut, {"jumlah_bucket": k, "operasi_bucket": n})
+        """
+        arr = _copy_records(data)
+        n = len(arr)
+        
+        # Coba penempatan langsung memakai value_counts yang sudah tersedia
+        if value_counts and sum(value_counts.values()) == n:
+            distinct = sorted(value_counts, reverse=not ascending)
+            starts = {}
+            total = 0
+            for value in distinct:
+                starts[value] = total
+                total += value_counts[value]
+            expected_end = {value: starts[value] + value_counts[value] for value in distinct}
             
-            # Bandingkan elemen dari left dan right
-            while i < len(left) and j < len(right):
-                comparison_count[0] += 1
+            output = [None] * n
+            try:
+                for item in arr:
+                    position = starts[item[key]]
+                    output[position] = item
+                    starts[item[key]] = position + 1
+            except (KeyError, IndexError):
+                pass
+            else:
+                if starts == expected_end:
+                    return output, {"jumlah_bucket": len(distinct), "operasi_bucket": n}
+        
+        # Bucketing satu pass (dict mempertahankan urutan masuk = stabil)
+        buckets: Dict = {}
+        for item in arr:
+            value = item[key]
+            bucket = buckets.get(value)
+            if bucket is None:
+                buckets[value] = [item]
+            else:
+                bucket.append(item)
+        
+        result = []
+        for value in sorted(buckets, reverse=not ascending):
+            result.extend(buckets[value])
+        
+        return result, {"jumlah_bucket": len(buckets), "operasi_bucket": n}
+    
+    @staticmethod
+    def top_k(
+        data: List,
+        key: str,
+        k: int,
+        ascending: bool = False,
+        group_by: str = None
+    ) -> Tuple[object, int]:
+        """
+        Top-K (partial sort) menggunakan bounded heap berukuran k.
+        
+        ===== ANALISIS TOP-K =====
+        Time Complexity: O(n log k) - setiap record paling banyak satu operasi heap
+        Space Complexity: O(k) per grup - hanya k record terbaik yang disimpan
+        
+        Cara Kerja:
+        1. Simpan k record terbaik dalam heap; root = record terburuk di antaranya
+        2. Untuk setiap record baru, bandingkan dengan root; jika lebih baik,
+           ganti root (heapreplace)
+        3. Urutkan k record akhir (O(k log k))
+        
+        Hasilnya sama dengan sorting penuh (stabil) lalu diambil k teratas,
+        contoh: "50 IPK tertinggi" = top_k(data, "ipk", 50, ascending=False).
+        
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut untuk ranking; record tanpa atribut ini dilewati
+            k: Jumlah record teratas yang diambil
+            ascending: False untuk nilai terbesar, True untuk nilai terkecil
+            group_by: Atribut pengelompokan opsional (contoh: "jurusan");
+                setiap grup mendapat top-k sendiri dalam satu pass
+        
+        Returns:
+            Tuple (list top-k, atau dict {grup: list top-k} jika group_by diisi,
+            jumlah perbandingan atau None di mode produksi)
+        """
+        if not is_instrumented():
+            return AlgoritmaSorting._top_k_builtin(data, key, k, ascending, group_by), None
+        
+        comparison_count = [0]
+        heaps: Dict = {}
+        
+        if k > 0:
+            for order, item in enumerate(data):
+                record = item.info() if hasattr(item, 'info') else item
+                if key not in record:
+                    continue
                 
-                val_left = left[i][key]
-                val_right = right[j][key]
+                group = record.get(group_by) if group_by else None
+                heap = heaps.get(group)
+                if heap is None:
+                    heap = heaps[group] = []
                 
-                if (val_left <= val_right and ascending) or \
-                   (val_left >= val_right and not ascending):
-                    result.append(left[i])
-                    i += 1
-                else:
-                    result.append(right[j])
-                    j += 1
-            
-            # Tambahkan sisa elemen
-            result.extend(left[i:])
-            result.extend(right[j:])
-            
-            return result
+                entry = _TopKEntry(record[key], order, record, ascending, comparison_count)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif heap[0] < entry:
+                    heapq.heapreplace(heap, entry)
         
-        arr = merge_sort_recursive(arr)
-        return arr, comparison_count[0]
+        # Urutkan hasil: entry terbaik di depan; hanya k record yang disalin
+        result = {
+            group: [dict(entry.item) for entry in sorted(heap, reverse=True)]
+            for group, heap in heaps.items()
+        }
+        
+        if group_by:
+            return result, comparison_count[0]
+        return result.get(None, []), comparison_count[0]
     
     @staticmethod
-    def shell_sort(
+    def _top_k_builtin(
+        data: List,
+        key: str,
+        k: int,
+        ascending: bool,
+        group_by: str
+    ) -> object:
+        """
+        Top-K mode produksi dengan heapq.nsmallest / nlargest (perbandingan
+        di C). Keduanya dijamin sama dengan sorted(...)[:k] yang stabil,
+        sehingga urutan hasil sama dengan jalur edukasi.
+        """
+        if k <= 0:
+            return {} if group_by else []
+        
+        records = (item.info() if hasattr(item, 'info') else item for item in data)
+        records = (record for record in records if key in record)
+        select = heapq.nsmallest if ascending else heapq.nlargest
+        
+        if not group_by:
+            return [dict(record) for record in select(k, records, key=itemgetter(key))]
+        
+        groups: Dict = {}
+        for record in records:
+            groups.setdefault(record.get(group_by), []).append(record)
+        return {
+            group: [dict(record) for record in select(k, rows, key=itemgetter(key))]
+            for group, rows in groups.items()
+        }
+    
+    @staticmethod
+    def analisis_presortedness(
+        data: List,
+        key: str,
+        ascending: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Ukur sinyal murah tentang seberapa terurut data untuk auto_sort.
+        
+        - jumlah_run: jumlah run menaik (sesuai arah sorting), satu pass O(n)
+        - rasio_inversi: perkiraan proporsi pasangan terbalik dari sampel
+          AUTO_SAMPEL_INVERSI pasangan acak (seed tetap agar hasil konsisten)
+        - low_cardinality: apakah kunci hanya punya sedikit nilai berbeda
+        
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut untuk sorting
+            ascending: Arah sorting yang diinginkan
+        
+        Returns:
+            Dictionary berisi n, jumlah_run, rasio_inversi, low_cardinality
+        """
+        keys = _key_column(data, key)
+        n = len(keys)
+        
+        jumlah_run = 1 if n else 0
+        for i in range(1, n):
+            if (keys[i] < keys[i - 1]) if ascending else (keys[i] > keys[i - 1]):
+                jumlah_run += 1
+        
+        inversi = 0
+        sampel = 0
+        if n > 1:
+            rng = random.Random(n)
+            sampel = min(AlgoritmaSorting.AUTO_SAMPEL_INVERSI, n * (n - 1) // 2)
+            for _ in range(sampel):
+                i, j = sorted(rng.sample(range(n), 2))
+                if (keys[j] < keys[i]) if ascending else (keys[j] > keys[i]):
+                    inversi += 1
+        
+        distinct = set()
+        low_cardinality = True
+        for value in keys:
+            distinct.add(value)
+            if len(distinct) > AlgoritmaSorting.AUTO_MAX_CARDINALITY:
+                low_cardinality = False
+                break
+        
+        return {
+            "n": n,
+            "jumlah_run": jumlah_run,
+            "rasio_inversi": round(inversi / sampel, 4) if sampel else 0.0,
+            "low_cardinality": low_cardinality
+        }
+    
+    @staticmethod
+    def auto_sort(
         data: List,
         key: str = "nama",
         ascending: bool = True
+    ) -> Tuple[List, int, Dict[str, Any]]:
+        """
+        Auto Sort - pilih engine sorting tercepat berdasarkan ukuran dan
+        keterurutan data (lihat analisis_presortedness).
+        
+        Aturan pemilihan (tidak pernah memilih engine O(n²)):
+        1. n <= AUTO_DATA_KECIL: Merge Sort (sinyal lain tidak bermakna)
+        2. Kunci dengan sedikit nilai berbeda: Counting Sort O(n + k)
+        3. Selain itu: Merge Sort bottom-up dengan deteksi run alami;
+           data terurut / hampir terurut selesai dalam ~n perbandingan.
+           Bubble Sort tidak dipakai karena sampel inversi tidak bisa
+           mendeteksi elemen "turtle" (misal satu nilai kecil di akhir
+           data terurut) yang membuatnya O(n²)
+        
+        Args:
+            data: List mahasiswa (Mahasiswa objects, dicts atau MahasiswaTable)
+            key: Atribut untuk sorting
+            ascending: True untuk ascending, False untuk descending
+        
+        Returns:
+            Tuple (data terurut, jumlah perbandingan atau None di mode
+            produksi, keputusan) dengan keputusan berisi engine, alasan
+            dan sinyal yang diukur
+        """
+        sinyal = AlgoritmaSorting.analisis_presortedness(data, key, ascending)
+        n = sinyal["n"]
+        
+        if n <= AlgoritmaSorting.AUTO_DATA_KECIL:
+            engine = "merge_sort"
+            alasan = f"Data sangat kecil (n = {n}), Merge Sort cukup beberapa perbandingan"
+        elif sinyal["low_cardinality"]:
+            engine = "counting_sort"
+            alasan = (f"Kolom '{key}' hanya memiliki sedikit nilai berbeda, "
+                      f"Counting Sort cukup satu pass O(n + k)")
+        elif sinyal["rasio_inversi"] <= AlgoritmaSorting.AUTO_RASIO_INVERSI:
+            engine = "merge_sort"
+            alasan = (f"Data hampir terurut ({sinyal['jumlah_run']} run, "
+                      f"rasio inversi {sinyal['rasio_inversi']}), Merge Sort "
+                      f"menggabungkan run alami dalam ~n perbandingan")
+        else:
+            engine = "merge_sort"
+            alasan = (f"Data besar/acak (n = {n}, {sinyal['jumlah_run']} run), "
+                      f"Merge Sort O(n log n) dengan deteksi run alami")
+        
+        if engine == "counting_sort":
+            result, _ = AlgoritmaSorting.counting_sort(data, key, ascending)
+            comparisons = 0 if is_instrumented() else None
+        else:
+            result, comparisons = AlgoritmaSorting.merge_sort(data, key, ascending)
+        
+        keputusan = {"engine": engine, "alasan": alasan}
+        keputusan.update(sinyal)
+        return result, comparisons, keputusan
+    
+    @staticmethod
+    def shell_sort(
+        data: List,
+        key: str = "nama",
+        ascending: bool = True,
+        gap_sequence: str = "shell"
     ) -> Tuple[List, int]:
         """
         Shell Sort - Algoritma sorting yang generalisasi dari Insertion Sort.
@@ -180,41 +1223,50 @@ class AlgoritmaSorting:
         ===== ANALISIS SHELL SORT =====
         Time Complexity:
         - Best Case: O(n log n) - gap sequence yang optimal
-        - Average Case: O(n^1.3) hingga O(n log² n) - tergantung gap sequence
-        - Worst Case: O(n²) - jika gap sequence buruk
+        - Average Case: O(n^1.25) hingga O(n^1.5) - tergantung gap sequence
+        - Worst Case: O(n²) untuk sequence Shell, O(n^4/3) untuk Sedgewick
         
         Space Complexity: O(1) - sorting in-place
         
+        Gap Sequence:
+        - shell: n/2, n/4, ..., 1 (sequence asli, worst case O(n²))
+        - knuth: 1, 4, 13, 40, 121, ...
+        - sedgewick: 1, 8, 23, 77, 281, ...
+        - tokuda: 1, 4, 9, 20, 46, 103, ...
+        - ciura: 1, 4, 10, 23, 57, 132, 301, 701, ... (terbaik secara empiris)
+        
         Cara Kerja:
-        1. Mulai dengan gap yang besar (setengah dari ukuran array)
+        1. Mulai dengan gap terbesar dari gap sequence yang dipilih
         2. Urutkan elemen yang berjarak gap menggunakan insertion sort
-        3. Kurangi gap (biasanya gap = gap // 2) dan ulangi
+        3. Pindah ke gap berikutnya yang lebih kecil dan ulangi
         4. Ketika gap = 1, sama seperti regular insertion sort
         
         Keuntungan: Lebih cepat dari bubble sort, lebih simple dari merge sort
         Kerugian: Time complexity tergantung gap sequence
         
         Args:
-            data: List mahasiswa yang akan diurutkan (bisa Mahasiswa objects atau dicts)
+            data: List mahasiswa yang akan diurutkan (Mahasiswa objects, dicts atau MahasiswaTable)
             key: Atribut untuk sorting ("nama" atau "nim")
             ascending: True untuk ascending, False untuk descending
+            gap_sequence: "shell", "knuth", "sedgewick", "tokuda" atau "ciura"
         
         Returns:
-            Tuple (data terurut, jumlah perbandingan)
+            Tuple (data terurut, jumlah perbandingan atau None di mode produksi)
+        
+        Raises:
+            ValueError: Jika gap_sequence tidak dikenal
         """
-        # Handle both Mahasiswa objects and dicts
-        if data and hasattr(data[0], 'info'):
-            arr = [mahasiswa.info() for mahasiswa in data]
-        else:
-            arr = [dict(item) for item in data]
+        arr = _copy_records(data)
         n = len(arr)
+        gaps = _shell_gaps(n, gap_sequence)
+        if not is_instrumented():
+            # Shell Sort tidak stabil: urutan nilai sama tidak dijamin, jadi
+            # hasil stabil dari sorted() juga merupakan hasil yang valid
+            return _sort_builtin(arr, key, ascending), None
         comparison_count = 0
         
-        # Mulai dengan gap setengah dari panjang array
-        gap = n // 2
-        
-        # Terus kurangi gap sampai 1
-        while gap > 0:
+        # Gap dari yang terbesar sampai 1
+        for gap in gaps:
             # Lakukan insertion sort untuk elemen yang berjarak gap
             for i in range(gap, n):
                 # Simpan elemen di index i
@@ -237,19 +1289,19 @@ class AlgoritmaSorting:
                 
                 # Letakkan elemen temp di posisi yang benar
                 arr[j] = temp
-            
-            # Kurangi gap untuk iterasi berikutnya
-            gap //= 2
         
         return arr, comparison_count
     
     @staticmethod
-    def get_big_o_notation(algoritma: str) -> dict:
+    def get_big_o_notation(algoritma: str, gap_sequence: str = "shell") -> dict:
         """
         Mengembalikan informasi Big O Notation untuk algoritma tertentu.
         
         Args:
-            algoritma: Nama algoritma ("bubble_sort", "merge_sort", "shell_sort")
+            algoritma: Nama algoritma ("bubble_sort", "merge_sort",
+                "parallel_merge_sort", "external_merge_sort", "radix_sort",
+                "counting_sort", "top_k", "sorted_view", "shell_sort")
+            gap_sequence: Gap sequence untuk "shell_sort" (lihat shell_sort)
         
         Returns:
             Dictionary dengan informasi Big O untuk berbagai case
@@ -266,18 +1318,73 @@ class AlgoritmaSorting:
             },
             "merge_sort": {
                 "nama": "Merge Sort",
-                "best_case": "O(n log n)",
+                "best_case": "O(n)",
                 "average_case": "O(n log n)",
                 "worst_case": "O(n log n)",
                 "space_complexity": "O(n)",
                 "tipe": "Divide & Conquer",
                 "stabil": "Ya"
             },
+            "parallel_merge_sort": {
+                "nama": "Parallel Merge Sort",
+                "best_case": "O((n/p) log(n/p) + n log p)",
+                "average_case": "O((n/p) log(n/p) + n log p)",
+                "worst_case": "O((n/p) log(n/p) + n log p)",
+                "space_complexity": "O(n)",
+                "tipe": "Divide & Conquer (multi-process)",
+                "stabil": "Ya"
+            },
+            "external_merge_sort": {
+                "nama": "External Merge Sort",
+                "best_case": "O(n log n)",
+                "average_case": "O(n log n)",
+                "worst_case": "O(n log n)",
+                "space_complexity": "O(M) memory + O(n) disk",
+                "tipe": "External / K-way Merge",
+                "stabil": "Ya"
+            },
+            "radix_sort": {
+                "nama": "Radix Sort (LSD)",
+                "best_case": "O(d·n)",
+                "average_case": "O(d·n)",
+                "worst_case": "O(d·n)",
+                "space_complexity": "O(n + k)",
+                "tipe": "Non-comparison (Digit Bucketing)",
+                "stabil": "Ya"
+            },
+            "counting_sort": {
+                "nama": "Counting Sort",
+                "best_case": "O(n + k)",
+                "average_case": "O(n + k)",
+                "worst_case": "O(n + k log k)",
+                "space_complexity": "O(n + k)",
+                "tipe": "Non-comparison (Bucketing)",
+                "stabil": "Ya"
+            },
+            "top_k": {
+                "nama": "Top-K (Bounded Heap)",
+                "best_case": "O(n)",
+                "average_case": "O(n log k)",
+                "worst_case": "O(n log k)",
+                "space_complexity": "O(k)",
+                "tipe": "Partial Sort (Heap)",
+                "stabil": "Ya"
+            },
+            "sorted_view": {
+                "nama": "Sorted View (Materialized)",
+                "best_case": "O(n) baca",
+                "average_case": "O(log n) insert/delete",
+                "worst_case": "O(n) baca",
+                "space_complexity": "O(n)",
+                "tipe": "Incremental Index (Chunked Sorted List)",
+                "stabil": "Ya"
+            },
             "shell_sort": {
-                "nama": "Shell Sort",
+                "nama": "Shell Sort" if gap_sequence == "shell"
+                        else f"Shell Sort ({gap_sequence.capitalize()})",
                 "best_case": "O(n log n)",
-                "average_case": "O(n^1.3)",
-                "worst_case": "O(n²)",
+                "average_case": SHELL_GAP_COMPLEXITY.get(gap_sequence, ("-", "-"))[0],
+                "worst_case": SHELL_GAP_COMPLEXITY.get(gap_sequence, ("-", "-"))[1],
                 "space_complexity": "O(1)",
                 "tipe": "Insertion Sort variant",
                 "stabil": "Tidak"
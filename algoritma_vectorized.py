@@ -0,0 +1,185 @@
+"""
+Module untuk engine Sorting & Searching vectorized berbasis NumPy/Pandas.
+Hasilnya sama dengan algoritma edukasi di algoritma_sorting.py dan
+algoritma_searching.py, tetapi loop Python diganti operasi kolom.
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class AlgoritmaVectorized:
+    """
+    Engine vectorized yang menyimpan data mahasiswa sebagai kolom.
+
+    Kolom dibangun sekali (lazy, per atribut) lalu dipakai ulang:
+    - Kolom dengan sedikit nilai berbeda (jurusan, status) disimpan sebagai
+      pandas Categorical sehingga sorting cukup atas kode integer
+    - Kolom lain disimpan sebagai NumPy array
+
+    Record yang dikembalikan adalah dict asli (tidak disalin), jadi
+    perlakukan sebagai read-only.
+    """
+
+    KOLOM_KATEGORI = ("jurusan", "status")
+
+    def __init__(self, data: List):
+        """
+        Inisialisasi engine dari list mahasiswa.
+
+        Args:
+            data: List mahasiswa (bisa Mahasiswa objects atau dicts)
+        """
+        if data and hasattr(data[0], 'info'):
+            self._records = [mahasiswa.info() for mahasiswa in data]
+        else:
+            self._records = list(data)
+        self._ranks: Dict[str, np.ndarray] = {}
+        self._sorted_strings: Dict[str, tuple] = {}
+        self._lower_strings: Dict[str, pd.Series] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # ========== KOLOM ==========
+
+    def _rank_column(self, key: str) -> np.ndarray:
+        """
+        Rank padat (0..k-1) setiap record untuk atribut key, sesuai urutan
+        perbandingan Python. Rank memungkinkan sort descending yang tetap
+        stabil, termasuk untuk kolom string.
+        """
+        if key not in self._ranks:
+            values = [record[key] for record in self._records]
+            if key in self.KOLOM_KATEGORI:
+                # Categorical: kategori terurut, codes = rank
+                ranks = pd.Categorical(values).codes.astype(np.int64)
+            else:
+                _, ranks = np.unique(np.asarray(values), return_inverse=True)
+            self._ranks[key] = ranks.astype(np.int64, copy=False)
+        return self._ranks[key]
+
+    def _string_column(self, key: str) -> tuple:
+        """
+        Kolom str(nilai) yang sudah terurut beserta permutasinya, untuk
+        exact search dengan searchsorted (sama seperti linear_search_exact
+        yang membandingkan str(item.get(key, ""))).
+        """
+        if key not in self._sorted_strings:
+            values = np.asarray(
+                [str(record.get(key, "")) for record in self._records], dtype=str
+            )
+            order = np.argsort(values, kind="stable")
+            self._sorted_strings[key] = (values[order], order)
+        return self._sorted_strings[key]
+
+    # ========== SORTING ==========
+
+    def sort_indices(self, key: str = "nama", ascending: bool = True) -> np.ndarray:
+        """
+        Permutasi index terurut (argsort stabil).
+
+        ===== ANALISIS =====
+        Time Complexity: O(n log n) di C (sekali per kolom untuk rank),
+        O(n log n) argsort integer untuk setiap permintaan sort
+
+        Args:
+            key: Atribut untuk sorting
+            ascending: True untuk ascending, False untuk descending
+
+        Returns:
+            NumPy array index record dalam urutan hasil
+        """
+        ranks = self._rank_column(key)
+        if ascending:
+            return np.argsort(ranks, kind="stable")
+        # Negasi rank: nilai terbesar di depan, nilai sama tetap urutan asli
+        return np.argsort(-ranks, kind="stable")
+
+    def sort(self, key: str = "nama", ascending: bool = True) -> List[Dict]:
+        """
+        Sorting vectorized; hasil sama dengan AlgoritmaSorting.merge_sort.
+
+        Args:
+            key: Atribut untuk sorting
+            ascending: True untuk ascending, False untuk descending
+
+        Returns:
+            List record terurut
+        """
+        records = self._records
+        return [records[i] for i in self.sort_indices(key, ascending).tolist()]
+
+    # ========== SEARCHING ==========
+
+    def search_exact(self, key: str, value: str) -> Optional[int]:
+        """
+        Exact search dengan searchsorted (binary search di C).
+        Hasil sama dengan AlgoritmaSearching.linear_search_exact: index
+        record pertama (urutan data asli) yang nilainya sama persis.
+
+        Args:
+            key: Atribut yang dicari
+            value: Nilai yang dicari (exact match)
+
+        Returns:
+            Index record atau None jika tidak ditemukan
+        """
+        sorted_values, order = self._string_column(key)
+        position = int(np.searchsorted(sorted_values, str(value), side="left"))
+        if position < len(sorted_values) and sorted_values[position] == str(value):
+            # Sort stabil: posisi paling kiri = index asli terkecil
+            return int(order[position])
+        return None
+
+    def search_substring(self, key: str, value: str) -> Optional[int]:
+        """
+        Substring search case-insensitive dengan str.contains.
+        Hasil sama dengan AlgoritmaSearching.linear_search.
+
+        Args:
+            key: Atribut yang dicari
+            value: Potongan teks yang dicari
+
+        Returns:
+            Index record pertama yang cocok atau None
+        """
+        matches = self.search_substring_all(key, value)
+        return int(matches[0]) if len(matches) else None
+
+    def search_substring_all(self, key: str, value: str) -> np.ndarray:
+        """Semua index record yang mengandung value (case-insensitive)."""
+        if key not in self._lower_strings:
+            values = [str(record.get(key, "")) for record in self._records]
+            try:
+                # Arrow string array: str.contains berjalan di C++
+                series = pd.Series(values, dtype="string[pyarrow]")
+            except ImportError:
+                series = pd.Series(values, dtype=object)
+            self._lower_strings[key] = series.str.lower()
+        mask = self._lower_strings[key].str.contains(
+            str(value).lower(), regex=False
+        ).to_numpy(dtype=bool, na_value=False)
+        return np.flatnonzero(mask)
+
+    def get_record(self, index: int) -> Dict:
+        """Ambil record berdasarkan index asli."""
+        return self._records[index]
+
+    @staticmethod
+    def get_big_o_notation() -> dict:
+        """Informasi Big O untuk engine vectorized."""
+        return {
+            "nama": "Vectorized (NumPy/Pandas)",
+            "best_case": "O(n log n) sort, O(log n) exact search",
+            "average_case": "O(n log n) sort, O(n) substring search",
+            "worst_case": "O(n log n) sort, O(n) substring search",
+            "space_complexity": "O(n) per kolom",
+            "tipe": "Columnar / SIMD-friendly",
+            "stabil": "Ya"
+        }
@@ -3,7 +3,7 @@ Aplikasi Web Manajemen Data Mahasiswa menggunakan Streamlit.
 
 Fitur:
 - CRUD operations (Create, Read, Update, Delete)
-- Multiple sorting algorithms (Bubble Sort, Merge Sort, Shell Sort)
+- Multiple sorting algorithms (Bubble Sort, Merge Sort, Shell Sort, Radix Sort)
 - Multiple searching algorithms (Linear Search, Binary Search)
 - Data validation dengan Regex
 - File I/O dengan JSON
@@ -19,13 +19,43 @@ import streamlit as st
 import pandas as pd
 from typing import List, Dict
 from crud_manager import CRUDManager
+from mahasiswa import MahasiswaLama
 from algoritma_sorting import AlgoritmaSorting
 from algoritma_searching import AlgoritmaSearching
 from auth_manager import AuthManager
+from sort_cache import SortCache
+from dataframe_cache import DataFrameCache
+from instrumentasi import is_instrumented, set_instrumented
+from aset import Aset, muat_aset
 
 
 # ========== KONFIGURASI STREAMLIT ==========
 
+PATH_BACKGROUND = "assets/background.jpg"
+PATH_LOGO = "assets/logo.png"
+
+# Lebar varian gambar: background selebar viewport desktop umum, logo 2x
+# lebar tampilan terbesar (150 px) agar tetap tajam di layar HiDPI
+LEBAR_BACKGROUND = 1920
+LEBAR_LOGO = 300
+
+
+def sumber_aset(aset: Aset, relatif: bool = False) -> str:
+    """
+    URL gambar untuk st.image / CSS: URL static file serving jika aktif
+    (server.enableStaticServing) dan varian tersedia, selain itu data URI.
+
+    Args:
+        aset: Aset hasil muat_aset
+        relatif: True untuk CSS ("app/static/..." di-resolve terhadap URL
+                 halaman sehingga tetap benar dengan server.baseUrlPath);
+                 st.image butuh bentuk "/app/static/..."
+    """
+    if aset.url is not None and st.get_option("server.enableStaticServing"):
+        return aset.url.lstrip("/") if relatif else aset.url
+    return aset.data_uri
+
+
 def configure_streamlit():
     """Konfigurasi awal untuk Streamlit."""
     st.set_page_config(
@@ -35,30 +65,21 @@ def configure_streamlit():
         initial_sidebar_state="expanded"
     )
     
-    # Load background image jika ada dan convert ke base64
-    import os
-    import base64
-    
-    bg_image_path = "assets/background.jpg"
+    # Background diproses sekali per process (lihat aset.py); CSS hanya
+    # berisi URL static/ yang pendek, atau data URI hasil cache sebagai fallback
     bg_css = ""
-    
-    if os.path.exists(bg_image_path):
-        try:
-            with open(bg_image_path, "rb") as img_file:
-                img_data = base64.b64encode(img_file.read()).decode()
-                bg_css = f"""
+    background = muat_aset(PATH_BACKGROUND, lebar_maks=LEBAR_BACKGROUND)
+    if background is not None:
+        bg_css = f"""
                 [data-testid="stAppViewContainer"] {{
                     background-image: 
                         linear-gradient(rgba(255, 255, 255, 0.98), rgba(255, 255, 255, 0.65)),
-                        url('data:image/jpeg;base64,{img_data}');
+                        url('{sumber_aset(background, relatif=True)}');
                     background-size: cover;
                     background-position: center;
                     background-attachment: fixed;
                 }}
                 """
-        except Exception as e:
-            print(f"Warning: Could not load background image: {e}")
-            bg_css = ""
     
     # Custom CSS dengan Background dan Logo - Warna Soft/Pastel
     st.markdown(f"""
@@ -219,16 +240,54 @@ def configure_streamlit():
 
 # ========== INISIALISASI SESSION STATE ==========
 
+@st.cache_resource
+def get_crud_manager() -> CRUDManager:
+    """
+    Satu CRUDManager untuk seluruh process: dataset in-memory, sorted view
+    dan tabel kolumnar dimuat sekali lalu dipakai bersama semua session,
+    sehingga perubahan dari satu session langsung terlihat di session lain.
+    """
+    return CRUDManager()
+
+
+@st.cache_resource
+def get_auth_manager() -> AuthManager:
+    """Satu AuthManager untuk seluruh process (lihat get_crud_manager)."""
+    return AuthManager()
+
+
+@st.cache_resource
+def get_sort_cache() -> SortCache:
+    """Sort cache bersama: hasil sorting satu session dipakai session lain."""
+    return SortCache()
+
+
+@st.cache_resource
+def get_dataframe_cache() -> DataFrameCache:
+    """Snapshot DataFrame bersama: dibangun sekali per dataset version."""
+    return DataFrameCache()
+
+
 def init_session_state():
-    """Inisialisasi session state untuk Streamlit."""
+    """
+    Inisialisasi session state untuk Streamlit.
+    Manager, sort cache dan DataFrame cache adalah object bersama
+    (st.cache_resource); session hanya menyimpan referensinya.
+    """
     if 'crud_manager' not in st.session_state:
-        st.session_state.crud_manager = CRUDManager()
+        st.session_state.crud_manager = get_crud_manager()
     
     if 'last_action' not in st.session_state:
         st.session_state.last_action = None
     
+    if 'sort_cache' not in st.session_state:
+        st.session_state.sort_cache = get_sort_cache()
+    
+    if 'dataframe_cache' not in st.session_state:
+        st.session_state.dataframe_cache = get_dataframe_cache()
+    
     if 'auth_manager' not in st.session_state:
-        st.session_state.auth_manager = AuthManager()
+        st.session_state.auth_manager = get_auth_manager()
     
     if 'logged_in' not in st.session_state:
         st.session_state.logged_in = False
@@ -241,17 +300,15 @@ def init_session_state():
 
 def ui_login_page():
     """UI untuk halaman login."""
-    import os
-    
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
         # Display logo jika ada - dengan centering column
-        logo_path = "assets/logo.png"
-        if os.path.exists(logo_path):
+        logo = muat_aset(PATH_LOGO, lebar_maks=LEBAR_LOGO)
+        if logo is not None:
             col_l, col_logo, col_r = st.columns([0.2, 0.6, 0.2])
             with col_logo:
-                st.image(logo_path, width=150)
+                st.image(sumber_aset(logo), width=150)
         
         st.markdown('<div class="header-title">🎓 Manajemen Data Mahasiswa</div>', 
                     unsafe_allow_html=True)
@@ -431,6 +488,18 @@ def ui_sidebar_menu():
         
         st.divider()
         
+        # Mode edukasi: algoritma menghitung perbandingan (lebih lambat)
+        mode_edukasi = st.toggle(
+            "🎓 Mode Edukasi",
+            value=True,
+            key="mode_edukasi",
+            help="Aktif: tampilkan jumlah perbandingan. "
+                 "Nonaktif: jalur cepat tanpa counter (mode produksi)."
+        )
+        set_instrumented(mode_edukasi)
+        
+        st.divider()
+        
         # Main menu
         menu = st.radio(
             "Pilih Menu:",
@@ -464,14 +533,12 @@ def ui_sidebar_menu():
 
 def ui_dashboard():
     """Dashboard utama aplikasi."""
-    import os
-    
     # Display logo di dashboard
     col1, col2, col3 = st.columns([0.2, 0.6, 0.2])
     with col2:
-        logo_path = "assets/logo.png"
-        if os.path.exists(logo_path):
-            st.image(logo_path, width=120)
+        logo = muat_aset(PATH_LOGO, lebar_maks=LEBAR_LOGO)
+        if logo is not None:
+            st.image(sumber_aset(logo), width=120)
     
     st.markdown('<div class="header-title">🎓 MANAJEMEN DATA MAHASISWA</div>', 
                 unsafe_allow_html=True)
@@ -589,21 +656,41 @@ def ui_tambah_mahasiswa():
                 st.error(message)
 
 
+PILIHAN_UKURAN_HALAMAN = [25, 50, 100, 250, 500]
+
+# Label kolom urutan -> kolom sorted view CRUDManager (None = urutan data)
+PILIHAN_URUTAN = {
+    "Urutan Input": None,
+    "Nama": "nama",
+    "NIM": "nim",
+    "Jurusan": "jurusan",
+    "Email": "email",
+    "Status": "status",
+    "Tahun Masuk": "tahun_masuk",
+}
+
+
 def ui_lihat_data():
-    """UI untuk melihat semua data mahasiswa."""
+    """
+    UI untuk melihat data mahasiswa per halaman.
+    
+    Filter, urutan, dan pemotongan halaman dijalankan di CRUDManager
+    (query_mahasiswa); hanya record pada halaman aktif yang dijadikan
+    DataFrame dan dikirim ke browser.
+    """
     st.markdown('<div class="section-title">📋 LIHAT DATA MAHASISWA</div>', 
                 unsafe_allow_html=True)
     
     crud = st.session_state.crud_manager
-    data = crud.read_all_mahasiswa()
     
-    if not data:
+    # Pilihan filter diambil dari statistik (nilai unik per kolom)
+    statik = crud.get_statistik()
+    
+    # get_statistik mengembalikan {} jika file data tidak bisa dibaca
+    if not statik.get('total_mahasiswa'):
         st.warning("📭 Belum ada data mahasiswa. Tambahkan mahasiswa baru terlebih dahulu.")
         return
     
-    # Konversi ke DataFrame untuk ditampilkan
-    df = pd.DataFrame(data)
-    
     # Pilih kolom yang ditampilkan
     st.subheader("📊 Tabel Data Mahasiswa")
     
@@ -612,28 +699,84 @@ def ui_lihat_data():
     with col1:
         jurusan_filter = st.multiselect(
             "Filter by Jurusan",
-            options=df['jurusan'].unique(),
+            options=list(statik.get('total_per_jurusan', {})),
             help="Kosongkan untuk menampilkan semua"
         )
     
     with col2:
         status_filter = st.multiselect(
             "Filter by Status",
-            options=df['status'].unique(),
+            options=list(statik.get('total_per_status', {})),
             help="Kosongkan untuk menampilkan semua"
         )
     
-    # Apply filters
-    filtered_df = df.copy()
-    if jurusan_filter:
-        filtered_df = filtered_df[filtered_df['jurusan'].isin(jurusan_filter)]
-    if status_filter:
-        filtered_df = filtered_df[filtered_df['status'].isin(status_filter)]
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        urutan = st.selectbox("Urutkan berdasarkan", options=list(PILIHAN_URUTAN))
+    with col2:
+        arah = st.radio("Arah", options=["Ascending", "Descending"], horizontal=True)
+    with col3:
+        ukuran_halaman = st.selectbox("Baris per halaman", options=PILIHAN_UKURAN_HALAMAN)
+    
+    # Query berubah: kembali ke halaman pertama (sebelum widget halaman dibuat)
+    query = (tuple(jurusan_filter), tuple(status_filter), urutan, arah, ukuran_halaman)
+    if st.session_state.get("lihat_query") != query:
+        st.session_state.lihat_query = query
+        st.session_state.lihat_halaman = 1
+    halaman = st.session_state.get("lihat_halaman", 1)
+    
+    # Filter (kode integer) dan urutan (sorted view) dievaluasi di CRUDManager.
+    # Versi dibaca sebelum query: jika data berubah di antaranya, versi tidak
+    # cocok dengan snapshot dan baris ditampilkan langsung dari records
+    def ambil_halaman(nomor: int):
+        dataset_version = crud.get_dataset_version()
+        data, total = crud.query_mahasiswa(
+            jurusan=jurusan_filter or None,
+            status=status_filter or None,
+            sort_key=PILIHAN_URUTAN[urutan],
+            ascending=(arah == "Ascending"),
+            offset=(nomor - 1) * ukuran_halaman,
+            limit=ukuran_halaman
+        )
+        return data, total, dataset_version
     
-    # Tampilkan tabel
-    st.dataframe(filtered_df, use_container_width=True)
+    data, total, dataset_version = ambil_halaman(halaman)
+    jumlah_halaman = max(1, -(-total // ukuran_halaman))
+    if halaman > jumlah_halaman:
+        # Data berkurang sejak halaman dipilih: tampilkan halaman terakhir
+        halaman = st.session_state.lihat_halaman = jumlah_halaman
+        data, total, dataset_version = ambil_halaman(halaman)
     
-    st.info(f"Total: {len(filtered_df)} mahasiswa")
+    # Tampilkan tabel (hanya halaman aktif, diambil dari snapshot DataFrame)
+    snapshot = st.session_state.dataframe_cache.get(crud)
+    st.dataframe(snapshot.baris(data, dataset_version), use_container_width=True)
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.number_input(
+            f"Halaman (1-{jumlah_halaman})",
+            min_value=1,
+            max_value=jumlah_halaman,
+            step=1,
+            key="lihat_halaman"
+        )
+    with col2:
+        awal = (halaman - 1) * ukuran_halaman
+        st.info(f"Total: {total} mahasiswa · baris {awal + 1 if data else 0}-{awal + len(data)} "
+                f"(halaman {halaman} dari {jumlah_halaman})")
+
+
+def versi_dirender(state_key: str, nim: str, versi_terbaru: int) -> int:
+    """
+    Versi record saat pertama kali ditampilkan di halaman ini, disimpan di
+    session sampai NIM lain dipilih atau perubahan selesai. Versi inilah
+    yang dikirim ke update/delete, sehingga perubahan orang lain di antara
+    render dan klik tombol terdeteksi sebagai konflik.
+    """
+    rendered = st.session_state.get(state_key)
+    if rendered is None or rendered[0] != nim:
+        rendered = st.session_state[state_key] = (nim, versi_terbaru)
+    return rendered[1]
 
 
 def ui_edit_mahasiswa():
@@ -652,11 +795,15 @@ def ui_edit_mahasiswa():
     nim_list = [m['nim'] for m in data]
     nim_selected = st.selectbox("Pilih Mahasiswa (berdasarkan NIM)", options=nim_list)
     
-    # Tampilkan data mahasiswa yang dipilih
-    mahasiswa = crud.read_mahasiswa_by_nim(nim_selected)
+    # Tampilkan data mahasiswa yang dipilih (proxy: object model dibuat bila perlu)
+    mahasiswa = crud.get_mahasiswa(nim_selected)
     
     if mahasiswa:
-        st.info(f"📌 Mengedit: **{mahasiswa['nama']}** (NIM: {mahasiswa['nim']})")
+        versi_edit = versi_dirender("edit_versi", nim_selected, crud.get_versi(mahasiswa))
+        st.info(f"📌 Mengedit: **{mahasiswa['nama']}** (NIM: {mahasiswa['nim']}, "
+                f"versi {versi_edit})")
+        if crud.get_versi(mahasiswa) != versi_edit:
+            st.warning("⚠️ Data ini sudah diubah pengguna lain sejak Anda membukanya.")
         
         col1, col2 = st.columns(2)
         
@@ -677,6 +824,8 @@ def ui_edit_mahasiswa():
         if 'ipk' in mahasiswa:
             new_ipk = st.number_input("IPK", min_value=0.0, max_value=4.0, 
                                       value=mahasiswa['ipk'], step=0.1)
+            if isinstance(mahasiswa.hydrate(), MahasiswaLama):
+                st.caption(f"🏆 Keterangan IPK: {mahasiswa.get_keterangan_ipk()}")
         
         # Tombol submit
         if st.button("💾 Simpan Perubahan", type="primary", use_container_width=True):
@@ -686,9 +835,15 @@ def ui_edit_mahasiswa():
                 jurusan=new_jurusan,
                 email=new_email,
                 status=new_status,
-                ipk=new_ipk
+                ipk=new_ipk,
+                expected_versi=versi_edit
             )
             
+            # Berhasil atau konflik: render berikutnya memakai versi terbaru.
+            # Gagal validasi (misal email salah): versi yang dirender tetap
+            # dipakai, agar perubahan orang lain sebelum dicoba ulang terdeteksi
+            if success or message.startswith(CRUDManager.PESAN_KONFLIK):
+                st.session_state.pop("edit_versi", None)
             if success:
                 st.success(message)
                 st.rerun()
@@ -714,11 +869,16 @@ def ui_hapus_mahasiswa():
     nim_list = [f"{m['nim']} - {m['nama']}" for m in data]
     selected = st.selectbox("Pilih Mahasiswa untuk Dihapus", options=nim_list)
     nim_to_delete = selected.split(" - ")[0]
+    mahasiswa = crud.get_mahasiswa(nim_to_delete)
+    versi_hapus = versi_dirender("hapus_versi", nim_to_delete,
+                                 crud.get_versi(mahasiswa) if mahasiswa else None)
     
     # Konfirmasi
     if st.button("❌ Hapus Mahasiswa", type="secondary", use_container_width=True):
-        success, message = crud.delete_mahasiswa(nim_to_delete)
+        success, message = crud.delete_mahasiswa(nim_to_delete, expected_versi=versi_hapus)
         
+        if success or message.startswith(CRUDManager.PESAN_KONFLIK):
+            st.session_state.pop("hapus_versi", None)
         if success:
             st.success(message)
             st.rerun()
@@ -732,7 +892,7 @@ def ui_cari_mahasiswa():
                 unsafe_allow_html=True)
     
     crud = st.session_state.crud_manager
-    data = crud.read_all_mahasiswa()
+    data, dataset_version = crud.read_snapshot()
     
     if not data:
         st.warning("📭 Belum ada data mahasiswa.")
@@ -779,11 +939,14 @@ def ui_cari_mahasiswa():
             with col4:
                 st.metric("Space", big_o['space_complexity'])
             
-            st.info(f"📊 Jumlah Perbandingan: {comparisons}")
+            if comparisons is not None:
+                st.info(f"📊 Jumlah Perbandingan: {comparisons}")
             
             if index is not None:
                 st.success("✅ Data Ditemukan!")
-                st.dataframe(pd.DataFrame([data[index]]), use_container_width=True)
+                snapshot = st.session_state.dataframe_cache.get(crud)
+                st.dataframe(snapshot.baris([data[index]], dataset_version),
+                             use_container_width=True)
             else:
                 st.warning("❌ Data tidak ditemukan")
         
@@ -807,23 +970,42 @@ def ui_cari_mahasiswa():
             with col4:
                 st.metric("Space", big_o['space_complexity'])
             
-            st.info(f"📊 Jumlah Perbandingan: {comparisons} | "
-                   f"ℹ️ Data di-sorting otomatis sebelum pencarian")
+            if comparisons is not None:
+                st.info(f"📊 Jumlah Perbandingan: {comparisons} | "
+                       f"ℹ️ Data di-sorting otomatis sebelum pencarian")
+            else:
+                st.info("ℹ️ Data di-sorting otomatis sebelum pencarian")
             
             if index is not None:
                 st.success("✅ Data Ditemukan!")
-                st.dataframe(pd.DataFrame([sorted_data[index]]), use_container_width=True)
+                snapshot = st.session_state.dataframe_cache.get(crud)
+                st.dataframe(snapshot.baris([sorted_data[index]], dataset_version),
+                             use_container_width=True)
             else:
                 st.warning("❌ Data tidak ditemukan")
 
 
+# Nama algoritma di cache & engine default untuk menampilkan Big O
+CACHE_ALGORITMA = {
+    "Auto (Adaptif)": "auto",
+    "Bubble Sort": "bubble_sort",
+    "Merge Sort": "merge_sort",
+    "Radix Sort (NIM)": "radix_sort",
+    "Counting Sort": "counting_sort",
+}
+DEFAULT_ALGO_KEY = {**CACHE_ALGORITMA, "Auto (Adaptif)": "merge_sort",
+                    "Shell Sort": "shell_sort"}
+
+
 def ui_sorting():
     """UI untuk sorting data."""
     st.markdown('<div class="section-title">📊 SORTING DATA</div>', 
                 unsafe_allow_html=True)
     
     crud = st.session_state.crud_manager
-    data = crud.read_all_mahasiswa()
+    # Data & versi dari satu snapshot: sort cache dipakai bersama semua
+    # session, permutasi harus disimpan dengan versi data yang diurutkan
+    data, dataset_version = crud.read_snapshot()
     
     if not data:
         st.warning("📭 Belum ada data mahasiswa.")
@@ -835,13 +1017,14 @@ def ui_sorting():
     with col1:
         algoritma = st.selectbox(
             "Pilih Algoritma Sorting:",
-            options=["Bubble Sort", "Merge Sort", "Shell Sort"]
+            options=["Auto (Adaptif)", "Bubble Sort", "Merge Sort", "Shell Sort",
+                     "Radix Sort (NIM)", "Counting Sort", "Sorted View (Index)"]
         )
     
     with col2:
         sort_key = st.selectbox(
             "Urutkan Berdasarkan:",
-            options=["nama", "nim", "jurusan", "email"]
+            options=["nama", "nim", "jurusan", "email", "status", "tahun_masuk"]
         )
     
     with col3:
@@ -853,25 +1036,128 @@ def ui_sorting():
     
     ascending = sort_order == "Ascending ↑"
     
+    gap_sequence = "shell"
+    if algoritma == "Shell Sort":
+        gap_sequence = st.selectbox(
+            "Gap Sequence:",
+            options=["shell", "knuth", "sedgewick", "tokuda", "ciura"],
+            help="Shell: n/2, n/4, ... | Ciura: terbaik secara empiris"
+        )
+    
     # Pilih metode algoritma
     sorting = AlgoritmaSorting()
+    instrumented = is_instrumented()
+    
+    if instrumented and algoritma == "Bubble Sort" and len(data) > sorting.BATAS_QUADRATIC:
+        st.warning(f"⚠️ Bubble Sort O(n²) dibatasi maksimal {sorting.BATAS_QUADRATIC} data. "
+                   f"Gunakan mode Auto atau Merge Sort.")
+    
+    low_cardinality = sorting.is_low_cardinality(data, sort_key)
+    if low_cardinality and algoritma not in ("Counting Sort", "Auto (Adaptif)",
+                                             "Sorted View (Index)"):
+        st.info(f"💡 Kolom '{sort_key}' hanya memiliki sedikit nilai berbeda. "
+                f"Counting Sort dapat mengurutkannya dalam satu pass O(n + k).")
     
     if st.button("▶️ Jalankan Sorting", type="primary", use_container_width=True):
+        # Cek cache permutasi: data & parameter sama tidak perlu disorting ulang
+        sort_cache = st.session_state.sort_cache
+        cache_name = CACHE_ALGORITMA.get(algoritma)
+        if algoritma == "Shell Sort":
+            cache_name = f"shell_sort:{gap_sequence}"
+            if not instrumented:
+                cache_name += ":produksi"
+        # Mode produksi memakai sorted() yang stabil untuk semua algoritma
+        stable = algoritma != "Shell Sort" or not instrumented
+        cached = None
+        if cache_name is not None:
+            # Radix Sort hanya valid untuk kunci angka: jangan pinjam hasil lain
+            reuse = stable and algoritma != "Radix Sort (NIM)"
+            cached = sort_cache.get(cache_name, sort_key, ascending,
+                                    dataset_version, data, reuse)
+        
         # Jalankan sorting
-        if algoritma == "Bubble Sort":
-            sorted_data, comparisons = sorting.bubble_sort(data, sort_key, ascending)
+        bucket_metric = None
+        if cached is not None:
+            sorted_data, cache_info = cached
+            metric = cache_info["metric"] or {}
+            comparisons = metric.get("comparisons", 0)
+            bucket_metric = metric.get("bucket_metric")
+            algo_key = metric.get("algo_key", DEFAULT_ALGO_KEY.get(algoritma, "merge_sort"))
+            st.info(f"♻️ Hasil diambil dari cache ({cache_info['sumber']}): "
+                    f"permutasi O(n) diterapkan tanpa sorting ulang.")
+        elif algoritma == "Sorted View (Index)":
+            # Urutan dipelihara incremental oleh CRUDManager: cukup dibaca O(n)
+            sorted_data = crud.get_sorted(sort_key, ascending)
+            comparisons = 0
+            algo_key = "sorted_view"
+        elif algoritma == "Auto (Adaptif)":
+            sorted_data, comparisons, keputusan = sorting.auto_sort(data, sort_key, ascending)
+            algo_key = keputusan["engine"]
+            st.info(f"🤖 Engine terpilih: **{algo_key}** — {keputusan['alasan']}")
+        elif algoritma == "Bubble Sort":
+            try:
+                sorted_data, comparisons = sorting.bubble_sort(data, sort_key, ascending)
+            except ValueError as e:
+                st.error(f"❌ {str(e)}")
+                return
             algo_key = "bubble_sort"
         elif algoritma == "Merge Sort":
             sorted_data, comparisons = sorting.merge_sort(data, sort_key, ascending)
             algo_key = "merge_sort"
-        else:  # Shell Sort
-            sorted_data, comparisons = sorting.shell_sort(data, sort_key, ascending)
+        elif algoritma == "Shell Sort":
+            sorted_data, comparisons = sorting.shell_sort(
+                data, sort_key, ascending, gap_sequence
+            )
             algo_key = "shell_sort"
+        elif algoritma == "Counting Sort":
+            # Pakai jumlah per nilai dari statistik jika tersedia untuk kolom ini
+            statik = crud.get_statistik()
+            value_counts = {
+                "jurusan": statik.get("total_per_jurusan"),
+                "status": statik.get("total_per_status"),
+            }.get(sort_key)
+            sorted_data, bucket_metric = sorting.counting_sort(
+                data, sort_key, ascending, value_counts
+            )
+            algo_key = "counting_sort"
+        else:  # Radix Sort
+            try:
+                sorted_data, bucket_metric = sorting.radix_sort(data, sort_key, ascending)
+            except ValueError as e:
+                st.error(f"❌ {str(e)}. Pilih 'nim' sebagai kunci untuk Radix Sort.")
+                return
+            algo_key = "radix_sort"
+        
+        if cached is None and cache_name is not None:
+            sort_cache.put_result(
+                cache_name, sort_key, ascending, dataset_version, data, sorted_data,
+                stable, {"comparisons": comparisons if bucket_metric is None else 0,
+                         "bucket_metric": bucket_metric, "algo_key": algo_key}
+            )
         
         # Tampilkan Big O Notation
-        big_o = sorting.get_big_o_notation(algo_key)
+        big_o = sorting.get_big_o_notation(algo_key, gap_sequence)
         
-        st.success(f"✅ Sorting Selesai! Dibutuhkan {comparisons} perbandingan.")
+        if cached is not None:
+            asal = ""
+            if comparisons and bucket_metric is None:
+                asal = f" (saat dihitung: {comparisons} perbandingan)"
+            st.success(f"✅ Sorting Selesai! Hasil dari cache tanpa perbandingan{asal}.")
+        elif not instrumented:
+            st.success("✅ Sorting Selesai! (Mode produksi: perbandingan tidak dihitung)")
+        elif bucket_metric is not None and "jumlah_pass" in bucket_metric:
+            # Radix sort tidak membandingkan elemen: tampilkan pass & operasi bucket
+            st.success(
+                f"✅ Sorting Selesai! {bucket_metric['jumlah_pass']} pass digit, "
+                f"{bucket_metric['operasi_bucket']} operasi bucket (tanpa perbandingan)."
+            )
+        elif bucket_metric is not None:
+            st.success(
+                f"✅ Sorting Selesai! {bucket_metric['jumlah_bucket']} bucket, "
+                f"{bucket_metric['operasi_bucket']} operasi bucket (tanpa perbandingan)."
+            )
+        else:
+            st.success(f"✅ Sorting Selesai! Dibutuhkan {comparisons} perbandingan.")
         
         # Tampilkan tabel Big O
         col1, col2, col3, col4 = st.columns(4)
@@ -893,7 +1179,8 @@ def ui_sorting():
         
         # Tampilkan hasil
         st.subheader("📋 Hasil Sorting:")
-        st.dataframe(pd.DataFrame(sorted_data), use_container_width=True)
+        snapshot = st.session_state.dataframe_cache.get(crud)
+        st.dataframe(snapshot.baris(sorted_data, dataset_version), use_container_width=True)
 
 
 def ui_statistik():
@@ -903,9 +1190,9 @@ def ui_statistik():
     
     crud = st.session_state.crud_manager
     statik = crud.get_statistik()
-    data = crud.read_all_mahasiswa()
     
-    if not data:
+    # get_statistik mengembalikan {} jika file data tidak bisa dibaca
+    if not statik.get('total_mahasiswa'):
         st.warning("📭 Belum ada data mahasiswa.")
         return
     
@@ -963,6 +1250,13 @@ def ui_statistik():
         
         with col2:
             st.bar_chart(status_data)
+    
+    # Penghematan memory dari dictionary encoding kolom berulang
+    report = crud.get_encoding_report()
+    st.caption(
+        f"💾 Dictionary encoding ({', '.join(report['per_kolom'])}) menghemat "
+        f"{report['byte_dihemat'] / 1024:.1f} KB memory"
+    )
 
 
 # ========== MAIN FUNCTION ==========
@@ -0,0 +1,142 @@
+"""
+Module untuk pipeline aset gambar aplikasi (background & logo).
+
+Sebelumnya setiap rerun Streamlit membaca file gambar dari disk dan
+meng-encode-nya ke base64 (~930 KB CSS untuk background 699 KB). Sekarang:
+- Setiap aset dibaca, diperkecil/dikompres ulang, dan di-encode sekali per
+  process; cache memakai key (path, mtime) sehingga file yang diganti
+  otomatis dimuat ulang
+- Varian hasil kompres ditulis ke folder static/ dan disajikan lewat
+  static file serving Streamlit (server.enableStaticServing di
+  .streamlit/config.toml), sehingga CSS hanya berisi URL pendek dan browser
+  bisa meng-cache gambarnya
+- Pillow (dependensi Streamlit) dipakai untuk memperkecil gambar; jika tidak
+  tersedia atau gambar tidak bisa dibuka, bytes asli yang dipakai
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+import base64
+import io
+import mimetypes
+import os
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from sinkronisasi import tulis_file_atomik
+
+# Folder static/ di samping app.py, disajikan Streamlit di URL /app/static/
+FOLDER_STATIC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+URL_STATIC = "/app/static"
+
+# Format simpan varian ditentukan ekstensi file, bukan isi file sumber
+# (misal PNG yang dinamai .jpg dikompres ulang menjadi JPEG sungguhan)
+FORMAT_PER_EKSTENSI = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG"}
+
+KUALITAS_JPEG = 80
+
+
+class Aset(NamedTuple):
+    """Aset gambar yang sudah diproses (hasil cache, jangan diubah)."""
+    data: bytes                 # Bytes varian (atau asli jika tidak diperkecil)
+    mime: str                   # Misal "image/jpeg"
+    data_uri: str               # "data:<mime>;base64,..." untuk fallback inline
+    nama_file: Optional[str]    # Nama file varian di FOLDER_STATIC (None jika gagal ditulis)
+    versi: int                  # mtime_ns file sumber, untuk cache busting URL
+
+    @property
+    def url(self) -> Optional[str]:
+        """URL static file serving (/app/static/...), atau None jika varian tidak ada di static/."""
+        if self.nama_file is None:
+            return None
+        return f"{URL_STATIC}/{self.nama_file}?v={self.versi}"
+
+
+def muat_aset(path: str, lebar_maks: Optional[int] = None,
+              kualitas: int = KUALITAS_JPEG) -> Optional[Aset]:
+    """
+    Ambil aset gambar dari cache process, memprosesnya jika belum ada atau
+    file sumber sudah berubah (mtime berbeda).
+
+    ===== ANALISIS =====
+    Time Complexity: O(1) os.stat jika cache hit; O(ukuran gambar) saat
+                     pertama kali / setelah file berubah
+    Space Complexity: O(ukuran varian) per entri cache
+
+    Args:
+        path: Path file gambar sumber
+        lebar_maks: Lebar maksimal varian dalam pixel (None = ukuran asli,
+                    hanya dikompres ulang)
+        kualitas: Kualitas JPEG varian (1-95)
+
+    Returns:
+        Aset, atau None jika file tidak ada atau tidak bisa dibaca
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _proses_aset(os.path.abspath(path), mtime_ns, lebar_maks, kualitas)
+
+
+@lru_cache(maxsize=16)
+def _proses_aset(path: str, mtime_ns: int, lebar_maks: Optional[int],
+                 kualitas: int) -> Optional[Aset]:
+    """Baca, perkecil, encode, dan tulis varian ke static/ (di-cache per mtime)."""
+    try:
+        with open(path, "rb") as f:
+            asli = f.read()
+    except OSError as e:
+        # Misal file dihapus setelah os.stat atau tidak ada izin baca
+        print(f"Warning: Could not read asset {path}: {e}")
+        return None
+    data, mime = _perkecil(asli, path, lebar_maks, kualitas)
+
+    nama, ekstensi = os.path.splitext(os.path.basename(path))
+    nama_file: Optional[str] = f"{nama}-{lebar_maks or 'asli'}{ekstensi}"
+    try:
+        os.makedirs(FOLDER_STATIC, exist_ok=True)
+        tulis_file_atomik(os.path.join(FOLDER_STATIC, nama_file), data)
+    except OSError as e:
+        print(f"Warning: Could not write static asset {nama_file}: {e}")
+        nama_file = None
+
+    data_uri = f"data:{mime};base64,{base64.b64encode(data).decode()}"
+    return Aset(data, mime, data_uri, nama_file, mtime_ns)
+
+
+def _perkecil(asli: bytes, path: str, lebar_maks: Optional[int],
+              kualitas: int) -> Tuple[bytes, str]:
+    """
+    Perkecil gambar ke lebar_maks (rasio dipertahankan) dan kompres ulang
+    dengan format sesuai ekstensi. Hasil hanya dipakai jika lebih kecil dari asli.
+    """
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    format_simpan = FORMAT_PER_EKSTENSI.get(os.path.splitext(path)[1].lower())
+    if format_simpan is None:
+        return asli, mime
+    try:
+        from PIL import Image
+    except ImportError:
+        return asli, mime
+
+    try:
+        with Image.open(io.BytesIO(asli)) as img:
+            img.load()
+            if lebar_maks and img.width > lebar_maks:
+                tinggi = max(1, round(img.height * lebar_maks / img.width))
+                img = img.resize((lebar_maks, tinggi), Image.LANCZOS)
+
+            buffer = io.BytesIO()
+            if format_simpan == "JPEG":
+                img.convert("RGB").save(buffer, "JPEG", quality=kualitas,
+                                        optimize=True, progressive=True)
+            else:
+                img.save(buffer, "PNG", optimize=True)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not resize image {path}: {e}")
+        return asli, mime
+
+    hasil = buffer.getvalue()
+    return (hasil, mime) if len(hasil) < len(asli) else (asli, mime)
@@ -11,6 +11,11 @@ import hashlib
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 
+from sinkronisasi import (
+    ReadWriteLock, dengan_lock_baca, dengan_lock_tulis, tulis_file_atomik
+)
+import validasi
+
 
 class AuthManager:
     """
@@ -25,8 +30,12 @@ class AuthManager:
             file_path: Path untuk file JSON penyimpanan user credentials
         """
         self.file_path = file_path
+        # Dipakai bersama semua session (dan worker process): login berjalan
+        # bersamaan, baca-ubah-tulis file users satu per satu
+        self._rwlock = ReadWriteLock(f"{file_path}.lock")
         self._ensure_users_file_exists()
     
+    @dengan_lock_tulis
     def _ensure_users_file_exists(self) -> None:
         """
         Memastikan file users JSON ada dengan default users.
@@ -105,17 +114,18 @@ class AuthManager:
     
     def _save_users(self, users: list) -> None:
         """
-        Simpan users ke file JSON.
+        Simpan users ke file JSON (atomik: file sementara + os.replace).
         
         Args:
             users: List dari user dictionaries
         """
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(users, f, ensure_ascii=False, indent=2)
+            tulis_file_atomik(self.file_path,
+                              json.dumps(users, ensure_ascii=False, indent=2))
         except IOError as e:
             raise IOError(f"Error saat menyimpan users: {str(e)}")
     
+    @dengan_lock_baca
     def login(self, username: str, password: str) -> Tuple[bool, str, Optional[Dict]]:
         """
         Autentikasi user dengan username dan password.
@@ -149,6 +159,7 @@ class AuthManager:
         
         return False, "❌ Username tidak ditemukan", None
     
+    @dengan_lock_tulis
     def register(
         self,
         username: str,
@@ -171,16 +182,17 @@ class AuthManager:
             Tuple (success: bool, message: str)
         """
         # Validasi input
-        if not username or len(username) < 3:
+        if not validasi.nama_valid(username):
             return False, "❌ Username minimal 3 karakter"
         
         if not password or len(password) < 6:
             return False, "❌ Password minimal 6 karakter"
         
-        if not nama_lengkap or len(nama_lengkap) < 3:
+        if not validasi.nama_valid(nama_lengkap):
             return False, "❌ Nama lengkap minimal 3 karakter"
         
-        if not email or '@' not in email:
+        # Aturan email sama dengan data mahasiswa (pola terkompilasi)
+        if not validasi.email_valid(email):
             return False, "❌ Email format tidak valid"
         
         # Check duplicate username
@@ -206,6 +218,7 @@ class AuthManager:
         
         return True, f"✅ User '{username}' berhasil didaftarkan"
     
+    @dengan_lock_baca
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """
         Get user info berdasarkan username.
@@ -228,6 +241,7 @@ class AuthManager:
                 }
         return None
     
+    @dengan_lock_tulis
     def change_password(
         self,
         username: str,
@@ -267,6 +281,7 @@ class AuthManager:
         
         return False, "❌ User tidak ditemukan"
     
+    @dengan_lock_baca
     def get_all_users(self) -> list:
         """
         Get semua users (untuk admin dashboard).
@@ -286,6 +301,7 @@ class AuthManager:
             for u in users
         ]
     
+    @dengan_lock_tulis
     def delete_user(self, username: str) -> Tuple[bool, str]:
         """
         Delete user (admin only).
@@ -0,0 +1,491 @@
+"""
+File untuk benchmark performa aplikasi Manajemen Data Mahasiswa.
+Menggunakan data sintetis sehingga tidak menyentuh data_mahasiswa.json.
+
+Jalankan semua benchmark:
+    python benchmark_aplikasi.py
+Atau satu benchmark dengan ukuran data tertentu:
+    python benchmark_aplikasi.py parallel_merge_sort 1000000
+Argumen ketiga (opsional) adalah jumlah worker untuk parallel_merge_sort:
+    python benchmark_aplikasi.py parallel_merge_sort 1000000 4
+
+Developer: Ahmad Rasyid - Teknik Informatika
+"""
+
+import gc
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from algoritma_searching import AlgoritmaSearching
+from algoritma_sorting import AlgoritmaSorting, SHELL_GAP_COMPLEXITY
+from algoritma_vectorized import AlgoritmaVectorized
+from mahasiswa import Mahasiswa, MahasiswaLama
+import validasi
+
+
+JURUSAN_LIST = [
+    "Teknik Informatika", "Teknik Elektro", "Teknik Sipil", "Teknik Mesin",
+    "Akuntansi", "Manajemen", "Sistem Informasi", "Lainnya"
+]
+STATUS_LIST = ["aktif", "tidak aktif", "lulus", "cuti"]
+
+
+def generate_data(n: int, seed: int = 42) -> List[Dict]:
+    """Buat n record mahasiswa sintetis dengan NIM unik."""
+    rng = random.Random(seed)
+    nims = rng.sample(range(10_000_000, 99_999_999), n)
+    data = []
+    for i, nim in enumerate(nims):
+        data.append({
+            "nama": f"Mahasiswa {rng.randint(0, n):07d}",
+            "nim": f"{nim:08d}",
+            "jurusan": rng.choice(JURUSAN_LIST),
+            "email": f"mhs{i}@example.com",
+            "tahun_masuk": rng.randint(2015, 2025),
+            "status": rng.choice(STATUS_LIST),
+            "tanggal_dibuat": "2025-12-15 00:00:00"
+        })
+    return data
+
+
+def timed(func: Callable, *args, **kwargs):
+    """Jalankan func dan kembalikan (hasil, detik)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def bench_parallel_merge_sort(n: int = 1_000_000, workers: int = None,
+                              min_chunk_size: int = 50_000):
+    """Bandingkan merge_sort dengan parallel_merge_sort pada `workers` process."""
+    cpu = os.cpu_count() or 1
+    workers = workers or cpu
+    # Sama dengan pembatasan di parallel_merge_sort: minimal min_chunk_size per worker
+    efektif = max(1, min(workers, n // min_chunk_size))
+    print("=" * 60)
+    print(f"BENCHMARK: Parallel Merge Sort (n = {n:,}, workers = {workers}, CPU = {cpu})")
+    print("=" * 60)
+    if efektif == 1:
+        print("  ⚠ 1 worker efektif: parallel_merge_sort berjalan di process ini")
+    elif efektif > cpu:
+        print(f"  ⚠ {efektif} process di {cpu} CPU: process berbagi core, speedup tidak diharapkan")
+
+    data = generate_data(n)
+
+    (serial, serial_cmp), serial_time = timed(
+        AlgoritmaSorting.merge_sort, data, "nama", True
+    )
+    print(f"  merge_sort          : {serial_time:8.2f} s | {serial_cmp:,} perbandingan")
+
+    (parallel, parallel_cmp), parallel_time = timed(
+        AlgoritmaSorting.parallel_merge_sort, data, "nama", True,
+        workers=workers, min_chunk_size=min_chunk_size
+    )
+    print(f"  parallel_merge_sort : {parallel_time:8.2f} s | {parallel_cmp:,} perbandingan "
+          f"({efektif} process)")
+
+    print(f"  Hasil identik       : {serial == parallel}")
+    print(f"  Speedup vs merge_sort: {serial_time / parallel_time:.2f}x\n")
+
+
+def legacy_recursive_merge_sort(
+    data: List[Dict], key: str, ascending: bool
+) -> Tuple[List[Dict], int]:
+    """Merge sort rekursif versi lama (slicing per level), sebagai pembanding."""
+    comparison_count = [0]
+
+    def merge_sort_recursive(arr_segment):
+        if len(arr_segment) <= 1:
+            return arr_segment
+        mid = len(arr_segment) // 2
+        left = merge_sort_recursive(arr_segment[:mid])
+        right = merge_sort_recursive(arr_segment[mid:])
+        result = []
+        i = j = 0
+        while i < len(left) and j < len(right):
+            comparison_count[0] += 1
+            if (left[i][key] <= right[j][key] and ascending) or \
+               (left[i][key] >= right[j][key] and not ascending):
+                result.append(left[i])
+                i += 1
+            else:
+                result.append(right[j])
+                j += 1
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return result
+
+    arr = merge_sort_recursive([dict(item) for item in data])
+    return arr, comparison_count[0]
+
+
+def measure_memory(func: Callable, *args, **kwargs):
+    """
+    Jalankan func dan ukur waktu, jumlah garbage collection yang terpicu,
+    lalu jalankan ulang di bawah tracemalloc untuk peak memory (tracemalloc
+    memperlambat eksekusi, sehingga waktu diukur pada run pertama).
+    """
+    collections = [0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    try:
+        result, seconds = timed(func, *args, **kwargs)
+    finally:
+        gc.callbacks.remove(on_gc)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak, collections[0]
+
+
+def bench_merge_sort_memory(n: int = 200_000):
+    """Bandingkan merge sort rekursif lama dengan bottom-up merge sort."""
+    print("=" * 60)
+    print(f"BENCHMARK: Merge Sort Memory & GC (n = {n:,})")
+    print("=" * 60)
+
+    data = generate_data(n)
+    # Input terurut dibuat sekali di awal agar kedua versi menerima data yang sama
+    data_terurut = sorted(data, key=lambda m: m["nama"])
+    for label, func in [
+        ("rekursif (lama)", legacy_recursive_merge_sort),
+        ("bottom-up (baru)", AlgoritmaSorting.merge_sort),
+    ]:
+        for order, rows in [("random", data), ("sorted", data_terurut)]:
+            (result, comparisons), seconds, peak, collections = measure_memory(
+                func, rows, "nama", True
+            )
+            print(f"  {label:17}| {order:7}| {seconds:6.2f} s | "
+                  f"peak {peak / 2**20:7.1f} MiB | {collections:4} GC | "
+                  f"{comparisons:,} perbandingan")
+    print()
+
+
+def bench_shell_gap_sequences(n: int = 20_000):
+    """Bandingkan gap sequence Shell Sort pada data random, terurut dan terbalik."""
+    print("=" * 60)
+    print(f"BENCHMARK: Shell Sort Gap Sequence (n = {n:,})")
+    print("=" * 60)
+
+    data = generate_data(n)
+    inputs = {
+        "random": data,
+        "sorted": sorted(data, key=lambda m: m["nim"]),
+        "reversed": sorted(data, key=lambda m: m["nim"], reverse=True),
+    }
+
+    for sequence in SHELL_GAP_COMPLEXITY:
+        big_o = AlgoritmaSorting.get_big_o_notation("shell_sort", sequence)
+        print(f"  {big_o['nama']} | avg {big_o['average_case']}")
+        for label, rows in inputs.items():
+            (_, comparisons), seconds = timed(
+                AlgoritmaSorting.shell_sort, rows, "nim", True, sequence
+            )
+            print(f"    {label:9}| {seconds:6.2f} s | {comparisons:>12,} perbandingan")
+    print()
+
+
+def bench_vectorized(n: int = 1_000_000):
+    """Bandingkan engine edukasi (loop Python) dengan engine vectorized."""
+    print("=" * 60)
+    print(f"BENCHMARK: Vectorized Engine vs Pure Python (n = {n:,})")
+    print("=" * 60)
+
+    data = generate_data(n)
+    target = data[-1]
+
+    engine, build_time = timed(AlgoritmaVectorized, data)
+    print(f"  Build engine                : {build_time:8.3f} s")
+
+    cases = [
+        ("sort nama", lambda: AlgoritmaSorting.merge_sort(data, "nama", True)[0],
+         lambda: engine.sort("nama", True)),
+        ("sort jurusan desc", lambda: AlgoritmaSorting.merge_sort(data, "jurusan", False)[0],
+         lambda: engine.sort("jurusan", False)),
+        ("exact search nim", lambda: AlgoritmaSearching.linear_search_exact(
+            data, "nim", target["nim"])[0],
+         lambda: engine.search_exact("nim", target["nim"])),
+        ("substring search email", lambda: AlgoritmaSearching.linear_search(
+            data, "email", target["email"].upper())[0],
+         lambda: engine.search_substring("email", target["email"].upper())),
+    ]
+    for label, python_func, vector_func in cases:
+        python_result, python_time = timed(python_func)
+        vector_result, first_time = timed(vector_func)
+        _, warm_time = timed(vector_func)
+        print(f"  {label:28}: python {python_time:7.3f} s | vectorized "
+              f"{first_time:7.3f} s (cache {warm_time:7.4f} s) | "
+              f"{python_time / max(warm_time, 1e-9):8.0f}x | "
+              f"sama: {python_result == vector_result}")
+    print()
+
+
+class LegacyMahasiswa:
+    """
+    Representasi lama MahasiswaLama: atribut privat di __dict__ per object,
+    __init__ sama seperti versi lama, sebagai pembanding.
+    """
+    
+    def __init__(self, nama, nim, jurusan, email, tahun_masuk=None, ipk=0.0, status="aktif"):
+        self.__nama = nama
+        self.__nim = nim
+        self.__jurusan = jurusan
+        self.__email = email
+        self.__tahun_masuk = tahun_masuk or datetime.now().year
+        self.__status = status
+        self.__tanggal_dibuat = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._ipk = ipk
+
+
+def measure_allocation(func: Callable):
+    """Jalankan func di bawah tracemalloc; kembalikan (hasil, detik, MiB yang masih dipakai)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result, seconds = timed(func)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, seconds, current / 2**20
+
+
+def bench_mahasiswa_memory(n: int = 1_000_000):
+    """Bandingkan memori object Mahasiswa berbasis __dict__ dan __slots__."""
+    print("=" * 60)
+    print(f"BENCHMARK: Mahasiswa __dict__ vs __slots__ (n = {n:,})")
+    print("=" * 60)
+    
+    rows = [
+        (item["nama"], item["nim"], item["jurusan"], item["email"],
+         item["tahun_masuk"], 3.25, item["status"])
+        for item in generate_data(n)
+    ]
+    
+    legacy, seconds, mib = measure_allocation(
+        lambda: [LegacyMahasiswa(*row) for row in rows]
+    )
+    print(f"  __dict__ (lama)     : {mib:8.1f} MiB | {seconds:6.2f} s | "
+          f"{mib * 2**20 / n:5.0f} byte/object")
+    del legacy
+    
+    compact, seconds, mib = measure_allocation(
+        lambda: [MahasiswaLama(*row) for row in rows]
+    )
+    print(f"  __slots__ (baru)    : {mib:8.1f} MiB | {seconds:6.2f} s | "
+          f"{mib * 2**20 / n:5.0f} byte/object")
+    
+    sample = compact[:100_000]
+    infos, seconds, mib = measure_allocation(lambda: [m.info() for m in sample])
+    print(f"  info() x {len(sample):,}    : {mib:8.1f} MiB | {seconds:6.2f} s (dict baru)")
+    del infos
+    views, seconds, mib = measure_allocation(lambda: [m.view() for m in sample])
+    print(f"  view() x {len(sample):,}    : {mib:8.1f} MiB | {seconds:6.2f} s (zero-copy)")
+    print()
+
+
+def bench_batch_factory(n: int = 500_000):
+    """Bandingkan pembuatan object satu per satu dengan Mahasiswa.from_records."""
+    print("=" * 60)
+    print(f"BENCHMARK: Batch Factory from_records (n = {n:,})")
+    print("=" * 60)
+    
+    records = [
+        MahasiswaLama.new_record(item["nama"], item["nim"], item["jurusan"],
+                                 item["email"], item["tahun_masuk"], 3.25,
+                                 item["status"])
+        for item in generate_data(n)
+    ]
+    for record in records:
+        del record["tanggal_dibuat"]
+    
+    cases = [
+        ("__init__ per object", lambda: [
+            MahasiswaLama(r["nama"], r["nim"], r["jurusan"], r["email"],
+                          r["tahun_masuk"], r["ipk"], r["status"]) for r in records]),
+        ("from_dict per object", lambda: [Mahasiswa.from_dict(r) for r in records]),
+        ("from_records (validasi)", lambda: list(Mahasiswa.from_records(records))),
+        ("from_records (tanpa)", lambda: list(Mahasiswa.from_records(records, validate=False))),
+    ]
+    for label, func in cases:
+        objects, seconds = timed(func)
+        print(f"  {label:24}: {seconds:6.2f} s | {type(objects[0]).__name__}")
+        del objects
+    print()
+
+
+def bench_batch_validation(n: int = 1_000_000):
+    """Bandingkan validasi per nilai (re.match) dengan validasi batch per kolom."""
+    print("=" * 60)
+    print(f"BENCHMARK: Batch Validation NIM & Email (n = {n:,})")
+    print("=" * 60)
+    
+    data = generate_data(n)
+    # Sebagian data dibuat tidak valid
+    for item in data[::10]:
+        item["nim"] = item["nim"][:4] + "ab"
+        item["email"] = item["email"].replace(".com", "")
+    columns = {key: [item[key] for item in data] for key in ("nim", "email")}
+    
+    for key, pattern in [("nim", r'^\d{8,12}$'),
+                         ("email", r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')]:
+        values = columns[key]
+        old, old_time = timed(lambda: [not re.match(pattern, v.strip()) for v in values])
+        scalar = getattr(validasi, f"{key}_valid")
+        compiled, compiled_time = timed(lambda: [not scalar(v) for v in values])
+        mask, batch_time = timed(validasi.validasi_kolom, key, values)
+        print(f"  {key:6}| re.match {old_time:6.2f} s | terkompilasi {compiled_time:6.2f} s | "
+              f"batch {batch_time:6.2f} s | {int(mask.sum()):,} error | "
+              f"sama: {old == compiled == mask.tolist()}")
+    print()
+
+
+def bench_parallel_import(n: int = 300_000):
+    """Bandingkan import satu process dengan import ber-process pool."""
+    import tempfile
+    from crud_manager import CRUDManager
+    
+    print("=" * 60)
+    print(f"BENCHMARK: Parallel Import Pipeline (n = {n:,}, CPU = {os.cpu_count()})")
+    print("=" * 60)
+    
+    rows = generate_data(n)
+    for item in rows[::100]:
+        item["email"] = "tidak-valid"
+    
+    pool = max(2, os.cpu_count() or 1)
+    for label, workers in [("1 process", 1), (f"{pool} process", pool)]:
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        os.remove(path)
+        try:
+            crud = CRUDManager(path, encode_on_disk=True)
+            (ok, msg, errors), seconds = timed(
+                crud.import_mahasiswa, rows, workers=workers, skip_invalid=True
+            )
+            print(f"  {label:12}: {seconds:6.2f} s | {len(errors):,} error | {msg}")
+        finally:
+            for leftover in (path, f"{path}.lock"):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+    print()
+
+
+def bench_paginated_view(n: int = 100_000):
+    """Bandingkan halaman Lihat Data lama (DataFrame semua baris) dengan query berhalaman."""
+    import tempfile
+    import pandas as pd
+    from crud_manager import CRUDManager
+    
+    print("=" * 60)
+    print(f"BENCHMARK: Lihat Data - Semua Baris vs Halaman (n = {n:,})")
+    print("=" * 60)
+    
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    os.remove(path)
+    try:
+        crud = CRUDManager(path)
+        crud.import_mahasiswa(generate_data(n), workers=1)
+        jurusan = [JURUSAN_LIST[0], JURUSAN_LIST[4]]
+        crud.register_sorted_view("nama")
+        
+        def semua_baris():
+            data = crud.filter_mahasiswa(jurusan)
+            return pd.DataFrame(data).sort_values("nama", kind="stable")
+        
+        def satu_halaman():
+            data, total = crud.query_mahasiswa(jurusan, sort_key="nama", offset=50, limit=50)
+            return pd.DataFrame(data)
+        
+        for label, func in [("DataFrame semua", semua_baris), ("1 halaman (50)", satu_halaman)]:
+            df, seconds = timed(func)
+            print(f"  {label:16}: {seconds * 1000:8.1f} ms | {len(df):,} baris dikirim ke browser")
+    finally:
+        for leftover in (path, f"{path}.lock"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+    print()
+
+
+def bench_dataframe_snapshot(n: int = 100_000):
+    """Bandingkan pd.DataFrame(list dict) per klik dengan snapshot DataFrame bersama."""
+    import tempfile
+    import pandas as pd
+    from crud_manager import CRUDManager
+    from dataframe_cache import DataFrameCache
+    
+    print("=" * 60)
+    print(f"BENCHMARK: DataFrame per Render vs Snapshot (n = {n:,})")
+    print("=" * 60)
+    
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    os.remove(path)
+    try:
+        crud = CRUDManager(path)
+        crud.import_mahasiswa(generate_data(n), workers=1)
+        dataset_version = crud.get_dataset_version()
+        sorted_data = crud.get_sorted("nama")
+        cache = DataFrameCache()
+        
+        snapshot, seconds = timed(cache.get, crud)
+        print(f"  Bangun snapshot     : {seconds * 1000:8.1f} ms | {snapshot.nbytes / 2**20:.1f} MiB "
+              f"(sekali per dataset version)")
+        
+        _, seconds = timed(lambda: pd.DataFrame(sorted_data))
+        print(f"  pd.DataFrame(dict)  : {seconds * 1000:8.1f} ms per klik (hasil sorting)")
+        _, seconds = timed(lambda: cache.get(crud).baris(sorted_data, dataset_version))
+        print(f"  snapshot.baris()    : {seconds * 1000:8.1f} ms per klik (hasil sorting)")
+        halaman = sorted_data[:50]
+        _, seconds = timed(lambda: cache.get(crud).baris(halaman, dataset_version))
+        print(f"  snapshot.baris(50)  : {seconds * 1000:8.1f} ms per klik (satu halaman)")
+    finally:
+        for leftover in (path, f"{path}.lock"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+    print()
+
+
+BENCHMARKS = {
+    "parallel_merge_sort": bench_parallel_merge_sort,
+    "merge_sort_memory": bench_merge_sort_memory,
+    "shell_gap_sequences": bench_shell_gap_sequences,
+    "vectorized": bench_vectorized,
+    "mahasiswa_memory": bench_mahasiswa_memory,
+    "batch_factory": bench_batch_factory,
+    "batch_validation": bench_batch_validation,
+    "parallel_import": bench_parallel_import,
+    "paginated_view": bench_paginated_view,
+    "dataframe_snapshot": bench_dataframe_snapshot,
+}
+
+
+def main():
+    """Jalankan benchmark sesuai argumen command line."""
+    names = [sys.argv[1]] if len(sys.argv) > 1 else list(BENCHMARKS)
+    kwargs = {"n": int(sys.argv[2])} if len(sys.argv) > 2 else {}
+    if len(sys.argv) > 3:
+        kwargs["workers"] = int(sys.argv[3])
+
+    for name in names:
+        BENCHMARKS[name](**kwargs)
+
+
+if __name__ == "__main__":
+    main()
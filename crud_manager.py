@@ -7,31 +7,172 @@ Date: 2025-12-15
 """
 
 import json
-import re
-from typing import List, Optional, Dict, Any
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime
-from mahasiswa import Mahasiswa, MahasiswaBaru, MahasiswaLama
+
+import numpy as np
+
+from mahasiswa import Mahasiswa, MahasiswaBaru, MahasiswaLama, MahasiswaProxy, MahasiswaTable
+from sorted_view import SortedView
+from sinkronisasi import ReadWriteLock, dengan_lock_tulis, tulis_file_atomik
+import validasi
+
+
+# Kategori pada input import -> class mahasiswa
+KELAS_IMPORT = {"umum": Mahasiswa, "baru": MahasiswaBaru, "lama": MahasiswaLama}
+
+
+def _transform_chunk_worker(
+    start: int,
+    rows: List[Dict],
+    tanggal_dibuat: str
+) -> Tuple[List[Tuple[int, Dict]], List[Tuple[int, str]]]:
+    """
+    Worker import: validasi satu chunk baris lalu bentuk record tersimpan.
+    
+    Berjalan di process lain (atau di process ini untuk import kecil);
+    hanya membaca argumen, tidak menyentuh file maupun state CRUDManager.
+    Keunikan NIM tidak dicek di sini karena butuh seluruh dataset.
+    
+    Args:
+        start: Nomor baris pertama chunk (0-based pada input import)
+        rows: Baris input (dict dengan field seperti create_mahasiswa)
+        tanggal_dibuat: Timestamp yang dipakai semua record import
+    
+    Returns:
+        Tuple (list (nomor baris, record) yang valid,
+               list (nomor baris, pesan error)), keduanya urut nomor baris
+    """
+    # Aturan kolom (termasuk tahun masuk dan IPK) sama dengan Mahasiswa.validate_batch
+    columns = validasi.kolom_dari_records(rows)
+    kategori_kolom = [row.get("kategori") or "umum" for row in rows]
+    # IPK hanya dipakai (dan divalidasi) untuk mahasiswa lama
+    columns["ipk"] = [
+        row.get("ipk", 0.0) if kategori == "lama" else None
+        for row, kategori in zip(rows, kategori_kolom)
+    ]
+    masks = validasi.validasi_batch(columns)
+    pesan_kolom = (
+        ("nama", "Nama minimal 3 karakter"),
+        ("nim", "NIM harus format angka 8-12 digit"),
+        ("email", "Email format tidak valid (contoh: user@domain.com)"),
+        ("jurusan", "Jurusan tidak boleh kosong"),
+        ("status", f"Status harus: {', '.join(validasi.STATUS_VALID)}"),
+        ("tahun_masuk", "Tahun masuk harus angka antara 1990 dan tahun sekarang"),
+    )
+    
+    nomor_valid, record_valid, errors = [], [], []
+    for i, row in enumerate(rows):
+        pesan = [teks for field, teks in pesan_kolom if masks[field][i]]
+        kategori = kategori_kolom[i]
+        if kategori not in KELAS_IMPORT:
+            pesan.append("Kategori harus: umum, baru, lama")
+        elif masks["ipk"][i] or (kategori == "lama" and columns["ipk"][i] is None):
+            pesan.append("IPK harus antara 0.0 - 4.0")
+        
+        if pesan:
+            errors.append((start + i, "; ".join(pesan)))
+            continue
+        
+        record = {field: columns[field][i] for field in ("nama", "nim", "jurusan", "email",
+                                                          "tahun_masuk", "status")}
+        record["tanggal_dibuat"] = tanggal_dibuat
+        if kategori == "baru":
+            # Mahasiswa baru selalu berstatus aktif
+            record["status"] = "aktif"
+            record["program_orientasi"] = row.get("program_orientasi", True)
+        elif kategori == "lama":
+            record["ipk"] = round(columns["ipk"][i], 2)
+        if kategori != "umum":
+            record["kategori"] = KELAS_IMPORT[kategori].kategori
+        nomor_valid.append(start + i)
+        record_valid.append(record)
+    
+    # Object dibangun lewat batch factory (subclass dipilih dari kategori)
+    records = []
+    objects = Mahasiswa.from_records(record_valid, validate=False)
+    for nomor, mahasiswa in zip(nomor_valid, objects):
+        record = mahasiswa.info()
+        record["versi"] = CRUDManager.VERSI_AWAL
+        records.append((nomor, record))
+    return records, errors
 
 
 class CRUDManager:
     """
     Class untuk mengelola CRUD operations (Create, Read, Update, Delete)
     dengan penyimpanan file JSON.
+    
+    Data disimpan di memory setelah dibaca pertama kali dan hanya dibaca
+    ulang jika file berubah dari luar (mtime/ukuran berbeda). Setiap
+    perubahan menaikkan dataset version dan memperbarui sorted view.
+    
+    Thread-safe: satu instance bisa dipakai bersama oleh semua session.
+    Pembacaan berjalan bersamaan, perubahan dijalankan satu per satu
+    (ReadWriteLock) dan juga dikunci antar process dengan fcntl.flock
+    pada file "<file_path>.lock", sehingga beberapa worker process bisa
+    memakai file yang sama tanpa kehilangan perubahan.
     """
     
-    def __init__(self, file_path: str = "data_mahasiswa.json"):
+    # Kolom yang selalu ada di setiap record sehingga bisa dijadikan sorted view
+    KOLOM_SORTED_VIEW = ("nama", "nim", "jurusan", "email", "status", "tahun_masuk")
+    
+    # Kolom dengan sedikit nilai berbeda: satu objek string per nilai unik
+    KOLOM_KODE = ("jurusan", "status", "kategori", "keterangan_ipk")
+    
+    # Penanda format file dengan code table (lihat encode_on_disk)
+    FORMAT_KODE = "kode-v1"
+    
+    # Versi record baru; naik 1 setiap update (optimistic concurrency).
+    # Record lama tanpa field "versi" dianggap versi ini.
+    VERSI_AWAL = 1
+    
+    # Awal pesan update/delete yang gagal karena konflik versi
+    PESAN_KONFLIK = "❌ Konflik:"
+    
+    def __init__(self, file_path: str = "data_mahasiswa.json", encode_on_disk: bool = False):
         """
         Inisialisasi CRUD Manager.
         
         Args:
             file_path: Path untuk file JSON penyimpanan data
+            encode_on_disk: Simpan file sebagai code table + kode integer
+                (KOLOM_KODE dan domain email). File list JSON biasa tetap
+                bisa dibaca di kedua mode.
         """
         self.file_path = file_path
+        self.encode_on_disk = encode_on_disk
+        # Kamus nilai per kolom: nilai -> objek string kanonik yang dipakai bersama
+        self._kamus: Dict[str, Dict[str, str]] = {field: {} for field in self.KOLOM_KODE}
+        self._data: Optional[List[Dict]] = None
+        self._file_stamp = None
+        self._dataset_version = 0
+        # seq: nomor urut record (stabil saat update), dipakai sorted view
+        self._seq_by_nim: Dict[str, int] = {}
+        self._next_seq = 0
+        self._sorted_views: Dict[str, SortedView] = {}
+        self._table: Optional[MahasiswaTable] = None
+        self._table_version = None
+        # (dataset version, laporan) terakhir dari get_encoding_report
+        self._encoding_report: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Manager dipakai bersama banyak session (thread) dan process:
+        # reload dan perubahan data memegang lock tulis. List data tidak
+        # pernah diubah di tempat (_commit memasang list baru), jadi pembaca
+        # yang memegang list lama tetap aman tanpa lock.
+        self._rwlock = ReadWriteLock(f"{file_path}.lock")
         self._ensure_file_exists()
     
+    @dengan_lock_tulis
     def _ensure_file_exists(self) -> None:
         """
         Memastikan file JSON ada. Jika tidak, buat file dengan data kosong.
+        Dijalankan di bawah lock tulis agar tidak menimpa file yang baru
+        dibuat process lain.
         """
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
@@ -46,6 +187,8 @@ class CRUDManager:
     def _save_to_file(self, data: List[Dict]) -> None:
         """
         Simpan data ke file JSON dengan indentation untuk readability.
+        File ditulis atomik (file sementara + os.replace), sehingga pembaca
+        tidak pernah melihat file yang baru setengah tertulis.
         
         Args:
             data: List dari dictionary mahasiswa
@@ -54,8 +197,14 @@ class CRUDManager:
             IOError: Jika ada error saat menulis file
         """
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if self.encode_on_disk:
+                # Format code table ditujukan untuk ukuran, bukan dibaca manusia.
+                # json.dumps tanpa indent memakai encoder C (json.dump ke file tidak)
+                isi = json.dumps(self._encode_for_disk(data), ensure_ascii=False,
+                                 separators=(",", ":"))
+            else:
+                isi = json.dumps(data, ensure_ascii=False, indent=2)
+            tulis_file_atomik(self.file_path, isi)
         except IOError as e:
             raise IOError(f"Error saat menyimpan file: {str(e)}")
     
@@ -72,7 +221,13 @@ class CRUDManager:
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return data if isinstance(data, list) else []
+            if isinstance(data, dict) and data.get("format") == self.FORMAT_KODE:
+                data = self._decode_from_disk(data)
+            if not isinstance(data, list):
+                return []
+            for mahasiswa in data:
+                self._intern_record(mahasiswa)
+            return data
         except FileNotFoundError:
             return []
         except json.JSONDecodeError as e:
@@ -80,13 +235,310 @@ class CRUDManager:
         except IOError as e:
             raise IOError(f"Error saat membaca file: {str(e)}")
     
+    # ========== DICTIONARY ENCODING ==========
+    
+    def _intern_record(self, mahasiswa: Dict) -> Dict:
+        """
+        Ganti nilai KOLOM_KODE dengan objek string kanonik dari kamus,
+        sehingga nilai yang sama di ribuan record hanya disimpan sekali
+        (perbandingan == pada objek yang sama cukup cek identitas).
+        """
+        for field in self.KOLOM_KODE:
+            value = mahasiswa.get(field)
+            if isinstance(value, str):
+                mahasiswa[field] = self._kamus[field].setdefault(value, value)
+        return mahasiswa
+    
+    def _encode_for_disk(self, data: List[Dict]) -> Dict[str, Any]:
+        """
+        Encode data menjadi code table + record berisi kode integer.
+        Email disimpan sebagai [local, kode_domain].
+        """
+        kode: Dict[str, List[str]] = {field: [] for field in self.KOLOM_KODE + ("email_domain",)}
+        index: Dict[str, Dict[str, int]] = {field: {} for field in kode}
+        
+        def code_of(field: str, value: str) -> int:
+            code = index[field].get(value)
+            if code is None:
+                code = index[field][value] = len(kode[field])
+                kode[field].append(value)
+            return code
+        
+        records = []
+        for mahasiswa in data:
+            encoded = dict(mahasiswa)
+            for field in self.KOLOM_KODE:
+                if isinstance(encoded.get(field), str):
+                    encoded[field] = code_of(field, encoded[field])
+            email = encoded.get("email")
+            if isinstance(email, str) and "@" in email:
+                local, domain = email.rsplit("@", 1)
+                encoded["email"] = [local, code_of("email_domain", domain)]
+            records.append(encoded)
+        
+        return {"format": self.FORMAT_KODE, "kode": kode, "records": records}
+    
+    def _decode_from_disk(self, payload: Dict[str, Any]) -> List[Dict]:
+        """Kebalikan _encode_for_disk: kode integer diganti nilai dari code table."""
+        kode = payload.get("kode", {})
+        return [self.decode_record(encoded, kode) for encoded in payload.get("records", [])]
+    
+    @classmethod
+    def decode_record(cls, encoded: Dict, kode: Dict[str, List[str]]) -> Dict:
+        """
+        Decode satu record file code table (in-place) memakai tabel "kode".
+        Dipakai juga oleh pembaca streaming (AlgoritmaSorting.external_merge_sort).
+        """
+        for field in cls.KOLOM_KODE:
+            if isinstance(encoded.get(field), int):
+                encoded[field] = kode[field][encoded[field]]
+        email = encoded.get("email")
+        if isinstance(email, list):
+            local, domain_code = email
+            encoded["email"] = f"{local}@{kode['email_domain'][domain_code]}"
+        return encoded
+    
+    def get_encoding_report(self) -> Dict[str, Any]:
+        """
+        Laporan penghematan memory dari dictionary encoding KOLOM_KODE.
+        Dihitung sekali per dataset version (scan O(n)), lalu dipakai ulang.
+        
+        Returns:
+            Dictionary {"per_kolom": {kolom: {"nilai", "unik", "byte_tanpa_encoding",
+            "byte_dengan_encoding"}}, "byte_dihemat": total} (jangan dimodifikasi)
+        
+        Raises:
+            IOError: Jika ada error saat membaca file
+        """
+        self._get_data()
+        # Dataset tidak pernah diubah di tempat: list versi ini aman dibaca tanpa lock
+        with self._rwlock.baca():
+            data, dataset_version = self._data, self._dataset_version
+        cached = self._encoding_report
+        if cached is not None and cached[0] == dataset_version:
+            return cached[1]
+        
+        per_kolom = {}
+        total = 0
+        for field in self.KOLOM_KODE:
+            values = [m[field] for m in data if isinstance(m.get(field), str)]
+            unique = {id(value): value for value in values}
+            tanpa = sum(sys.getsizeof(value) for value in values)
+            dengan = sum(sys.getsizeof(value) for value in unique.values())
+            per_kolom[field] = {
+                "nilai": len(values),
+                "unik": len(unique),
+                "byte_tanpa_encoding": tanpa,
+                "byte_dengan_encoding": dengan
+            }
+            total += tanpa - dengan
+        report = {"per_kolom": per_kolom, "byte_dihemat": total}
+        self._encoding_report = (dataset_version, report)
+        return report
+    
+    def _get_file_stamp(self):
+        """
+        Tanda versi file di disk: (mtime_ns, size, inode), atau None jika
+        tidak ada. Inode berubah setiap kali file diganti os.replace.
+        """
+        try:
+            stat = os.stat(self.file_path)
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except OSError:
+            return None
+    
+    def _get_data(self) -> List[Dict]:
+        """
+        Ambil dataset in-memory, baca ulang dari file hanya jika file berubah.
+        Jalur umum (file tidak berubah) tidak memegang lock; reload memegang
+        lock tulis lalu mengecek ulang tanda file.
+        
+        Returns:
+            List dictionary mahasiswa (milik manager, jangan dimodifikasi)
+        
+        Raises:
+            IOError: Jika ada error saat membaca file
+        """
+        if self._data is not None and self._get_file_stamp() == self._file_stamp:
+            return self._data
+        with self._rwlock.tulis():
+            self._reload_if_changed()
+        return self._data
+    
+    def _reload_if_changed(self) -> None:
+        """Baca ulang file jika berubah; dipanggil di bawah lock tulis."""
+        stamp = self._get_file_stamp()
+        if self._data is None or stamp != self._file_stamp:
+            self._data = self._load_from_file()
+            self._file_stamp = stamp
+            self._dataset_version += 1
+            self._seq_by_nim = {}
+            for seq, mahasiswa in enumerate(self._data):
+                self._seq_by_nim[mahasiswa.get("nim")] = seq
+            self._next_seq = len(self._data)
+            for view in self._sorted_views.values():
+                self._build_view(view)
+    
+    def _commit(self, data: List[Dict]) -> None:
+        """
+        Simpan dataset baru ke file, lalu jadikan dataset in-memory.
+        Memory hanya diperbarui jika penyimpanan berhasil.
+        """
+        self._save_to_file(data)
+        self._data = data
+        self._file_stamp = self._get_file_stamp()
+        self._dataset_version += 1
+    
+    def get_dataset_version(self) -> int:
+        """
+        Versi dataset: naik setiap kali data berubah (lewat manager ini
+        atau karena file diubah dari luar). Cocok sebagai kunci cache.
+        """
+        self._get_data()
+        return self._dataset_version
+    
+    def read_snapshot(self) -> Tuple[List[Dict], int]:
+        """
+        Read: Semua data mahasiswa beserta dataset version-nya, diambil
+        bersamaan sehingga pasangan (data, versi) selalu konsisten.
+        
+        Gunakan ini jika hasil turunan data (misal permutasi sorting)
+        disimpan di cache dengan kunci dataset version: versi yang dibaca
+        terpisah bisa sudah lebih baru daripada data yang diproses.
+        
+        Returns:
+            Tuple (list dictionary mahasiswa, dataset version)
+        """
+        try:
+            self._get_data()
+        except IOError:
+            return [], self._dataset_version
+        # _data dan _dataset_version hanya diganti di bawah lock tulis
+        with self._rwlock.baca():
+            return list(self._data), self._dataset_version
+    
+    def get_table(self) -> MahasiswaTable:
+        """
+        Dataset dalam bentuk kolumnar (MahasiswaTable) untuk analitik.
+        Dibangun sekali per dataset version lalu dipakai ulang.
+        
+        Returns:
+            MahasiswaTable (jangan dimodifikasi)
+        """
+        self._get_data()
+        table = self._table
+        if table is None or self._table_version != self._dataset_version:
+            with self._rwlock.tulis():
+                self._reload_if_changed()
+                if self._table is None or self._table_version != self._dataset_version:
+                    self._table = MahasiswaTable.from_records(self._data)
+                    self._table_version = self._dataset_version
+                table = self._table
+        return table
+    
+    def _data_dan_tabel(self) -> Tuple[List[Dict], MahasiswaTable, int]:
+        """
+        Dataset in-memory, MahasiswaTable dan dataset version yang sama,
+        sehingga baris tabel ke-i selalu record data[i]. Jika ada penulis
+        di antara pembangunan tabel dan pengecekan, tabel dibangun ulang.
+        
+        Raises:
+            IOError: Jika ada error saat membaca file
+        """
+        while True:
+            table = self.get_table()
+            with self._rwlock.baca():
+                if self._table is table and self._table_version == self._dataset_version:
+                    return self._data, table, self._dataset_version
+    
+    def read_table_snapshot(self) -> Tuple[MahasiswaTable, int]:
+        """
+        MahasiswaTable beserta dataset version tempat tabel itu dibangun
+        (seperti read_snapshot, untuk cache turunan tabel).
+        
+        Returns:
+            Tuple (MahasiswaTable, dataset version)
+        
+        Raises:
+            IOError: Jika ada error saat membaca file
+        """
+        _, table, dataset_version = self._data_dan_tabel()
+        return table, dataset_version
+    
+    # ========== SORTED VIEW ==========
+    
+    def _build_view(self, view: SortedView) -> None:
+        """Bangun ulang satu sorted view dari dataset in-memory."""
+        view.build(
+            (self._seq_by_nim[mahasiswa.get("nim")], mahasiswa)
+            for mahasiswa in self._data
+        )
+    
+    def register_sorted_view(self, key: str) -> None:
+        """
+        Daftarkan materialized sorted view untuk satu kolom.
+        Setelah terdaftar, create/update/delete memperbarui view secara
+        incremental (O(log n)) tanpa sorting ulang seluruh data.
+        
+        View yang sudah terdaftar hanya dicek di bawah lock baca; lock tulis
+        (dan flock antar process) hanya diambil saat view harus dibangun.
+        
+        Args:
+            key: Kolom untuk view (lihat KOLOM_SORTED_VIEW)
+        
+        Raises:
+            ValueError: Jika kolom tidak didukung
+        """
+        if key not in self.KOLOM_SORTED_VIEW:
+            raise ValueError(
+                f"Sorted view hanya untuk kolom: {', '.join(self.KOLOM_SORTED_VIEW)}"
+            )
+        with self._rwlock.baca():
+            if key in self._sorted_views:
+                return
+        self._bangun_sorted_view(key)
+    
+    @dengan_lock_tulis
+    def _bangun_sorted_view(self, key: str) -> None:
+        """Bangun dan simpan sorted view (dicek ulang: thread lain mungkin sudah membangunnya)."""
+        if key not in self._sorted_views:
+            self._get_data()
+            view = SortedView(key)
+            self._build_view(view)
+            self._sorted_views[key] = view
+    
+    def get_sorted(
+        self,
+        key: str,
+        ascending: bool = True,
+        offset: int = 0,
+        limit: int = None
+    ) -> List[Dict]:
+        """
+        Baca data terurut dari sorted view (didaftarkan otomatis jika belum).
+        
+        Args:
+            key: Kolom urutan
+            ascending: Arah urutan
+            offset: Jumlah record yang dilewati (pagination)
+            limit: Jumlah record maksimal (None = semua)
+        
+        Returns:
+            List dictionary mahasiswa terurut
+        """
+        self._get_data()
+        self.register_sorted_view(key)
+        # View diubah di tempat oleh create/update/delete (lock tulis)
+        with self._rwlock.baca():
+            return self._sorted_views[key].page(offset, limit, ascending)
+    
     # ========== VALIDASI INPUT ==========
     
     @staticmethod
     def validasi_nim(nim: str) -> bool:
         """
-        Validasi format NIM menggunakan Regex.
-        Format: hanya angka, minimal 8 digit.
+        Validasi format NIM menggunakan Regex (pola terkompilasi di validasi.py).
+        Format: hanya angka, 8-12 digit.
         
         Args:
             nim: String NIM yang akan divalidasi
@@ -94,14 +546,12 @@ class CRUDManager:
         Returns:
             True jika valid, False jika tidak
         """
-        # Pattern: hanya angka, 8-12 digit
-        pattern = r'^\d{8,12}$'
-        return bool(re.match(pattern, nim.strip()))
+        return validasi.nim_valid(nim)
     
     @staticmethod
     def validasi_email(email: str) -> bool:
         """
-        Validasi format Email menggunakan Regex.
+        Validasi format Email menggunakan Regex (pola terkompilasi di validasi.py).
         Requirements: ada @, ada domain, ada TLD (top-level domain).
         
         Args:
@@ -110,12 +560,7 @@ class CRUDManager:
         Returns:
             True jika valid, False jika tidak
         """
-        # Pattern email: username@domain.tld
-        # Username: alfanumerik, titik, underscore, hyphen
-        # Domain: alfanumerik, hyphen
-        # TLD: minimal 2 karakter
-        pattern = r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email.strip()))
+        return validasi.email_valid(email)
     
     @staticmethod
     def validasi_nama(nama: str) -> bool:
@@ -128,7 +573,7 @@ class CRUDManager:
         Returns:
             True jika valid, False jika tidak
         """
-        return len(nama.strip()) >= 3
+        return validasi.nama_valid(nama)
     
     @staticmethod
     def validasi_jurusan(jurusan: str) -> bool:
@@ -143,8 +588,37 @@ class CRUDManager:
         """
         return len(jurusan.strip()) > 0
     
+    @staticmethod
+    def validasi_batch(records: List[Dict]) -> Dict[str, Any]:
+        """
+        Validasi banyak record sekaligus, per kolom (lihat validasi.validasi_batch).
+        Aturan sama dengan validasi_nama/nim/email/jurusan, status, tahun
+        masuk dan IPK (aturan yang juga dipakai Mahasiswa.validate_batch).
+        
+        ===== ANALISIS =====
+        Time Complexity: O(n) operasi kolom, pola regex dikompilasi sekali
+        
+        Args:
+            records: List dict mahasiswa
+        
+        Returns:
+            Dict berisi:
+            - "per_kolom": mask error per kolom (True = tidak valid)
+            - "baris_error": index record yang tidak valid di kolom mana pun
+        """
+        per_kolom = validasi.validasi_batch(validasi.kolom_dari_records(records))
+        
+        gabungan = np.zeros(len(records), dtype=bool)
+        for mask in per_kolom.values():
+            gabungan |= mask
+        return {
+            "per_kolom": per_kolom,
+            "baris_error": np.flatnonzero(gabungan).tolist()
+        }
+    
     # ========== CREATE OPERATION ==========
     
+    @dengan_lock_tulis
     def create_mahasiswa(
         self,
         nama: str,
@@ -187,37 +661,196 @@ class CRUDManager:
                 return False, "❌ Jurusan tidak boleh kosong"
             
             # Load data existing
-            data = self._load_from_file()
+            data = self._get_data()
             
             # Cek apakah NIM sudah ada
-            for mahasiswa in data:
-                if mahasiswa.get("nim") == nim:
-                    return False, f"❌ NIM {nim} sudah terdaftar"
+            if nim in self._seq_by_nim:
+                return False, f"❌ NIM {nim} sudah terdaftar"
             
-            # Buat object mahasiswa berdasarkan kategori
+            # Buat record sesuai kategori; object model tidak perlu dibuat
+            # hanya untuk info() (lihat MahasiswaProxy untuk hydration)
             if kategori == "baru":
-                mahasiswa_obj = MahasiswaBaru(nama, nim, jurusan, email, tahun_masuk)
-                info = mahasiswa_obj.info()
+                info = MahasiswaBaru.new_record(nama, nim, jurusan, email, tahun_masuk)
             elif kategori == "lama":
-                mahasiswa_obj = MahasiswaLama(
+                info = MahasiswaLama.new_record(
                     nama, nim, jurusan, email, tahun_masuk, ipk, status
                 )
-                info = mahasiswa_obj.info()
             else:
-                mahasiswa_obj = Mahasiswa(nama, nim, jurusan, email, tahun_masuk, status)
-                info = mahasiswa_obj.info()
-            
-            # Tambah ke data
-            data.append(info)
+                info = Mahasiswa.new_record(nama, nim, jurusan, email, tahun_masuk, status)
+            info["versi"] = self.VERSI_AWAL
             
-            # Simpan ke file
-            self._save_to_file(data)
+            # Simpan ke file, lalu tambahkan ke data in-memory dan sorted view
+            self._intern_record(info)
+            self._commit(data + [info])
+            seq = self._next_seq
+            self._next_seq += 1
+            self._seq_by_nim[nim] = seq
+            for view in self._sorted_views.values():
+                view.insert(seq, info)
             
             return True, f"✅ Mahasiswa '{nama}' berhasil ditambahkan"
         
         except Exception as e:
             return False, f"❌ Error: {str(e)}"
     
+    # ========== IMPORT OPERATION ==========
+    
+    def _iter_import_chunks(
+        self,
+        rows: Iterable[Dict],
+        workers: int,
+        chunk_size: int
+    ) -> Iterator[Tuple[List[Tuple[int, Dict]], List[Tuple[int, str]]]]:
+        """
+        Jalankan _transform_chunk_worker untuk setiap chunk, hasil di-yield
+        sesuai urutan chunk. Dengan workers > 1 chunk dikerjakan di
+        ProcessPoolExecutor; paling banyak 2 x workers chunk yang sedang
+        diproses sehingga input tidak perlu dimuat seluruhnya.
+        """
+        tanggal_dibuat = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        iterator = iter(rows)
+        
+        def chunks() -> Iterator[Tuple[int, List[Dict]]]:
+            start = 0
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    return
+                yield start, chunk
+                start += len(chunk)
+        
+        if workers == 1:
+            for start, chunk in chunks():
+                yield _transform_chunk_worker(start, chunk, tanggal_dibuat)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start, chunk in chunks():
+                pending.append(executor.submit(
+                    _transform_chunk_worker, start, chunk, tanggal_dibuat
+                ))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def import_mahasiswa(
+        self,
+        rows: Iterable[Dict],
+        workers: int = None,
+        chunk_size: int = 20_000,
+        skip_invalid: bool = False,
+        on_error: Callable[[int, str], None] = None
+    ) -> Tuple[bool, str, List[Tuple[int, str]]]:
+        """
+        Import banyak mahasiswa sekaligus (misal dari file intake).
+        
+        ===== ANALISIS IMPORT PIPELINE =====
+        1. Validasi + pembentukan record per chunk, paralel di process pool
+           (CPU-bound, tidak butuh state manager)
+        2. Hasil chunk diterima sesuai urutan input; error langsung
+           diteruskan ke on_error dengan nomor barisnya
+        3. Keunikan NIM dicek di process ini terhadap data yang ada (lock
+           baca singkat per chunk) dan baris sebelumnya dalam import
+        4. Lock tulis hanya untuk satu _commit seluruh import (single
+           writer); NIM dicek ulang jika data berubah selama validasi
+        
+        Langkah 1-3 berjalan tanpa lock tulis, sehingga pembaca lain tidak
+        menunggu selama import besar divalidasi.
+        
+        Time Complexity: O(n / p) per worker + O(n) commit
+        Space Complexity: O(n) record yang di-import
+        
+        Args:
+            rows: Iterable dict dengan field seperti create_mahasiswa
+                (nama, nim, jurusan, email, tahun_masuk, status, kategori,
+                ipk, program_orientasi)
+            workers: Jumlah process (default: jumlah CPU; 1 = tanpa process pool)
+            chunk_size: Jumlah baris per chunk
+            skip_invalid: True untuk tetap menyimpan baris valid jika ada
+                error; False (default) untuk membatalkan seluruh import
+            on_error: Callback (nomor baris 0-based, pesan) untuk setiap error
+        
+        Returns:
+            Tuple (success, message, list (nomor baris, pesan) semua error)
+        """
+        if chunk_size < 1:
+            return False, "❌ chunk_size minimal 1", []
+        workers = workers or os.cpu_count() or 1
+        
+        errors: List[Tuple[int, str]] = []
+        
+        def laporkan(baru: List[Tuple[int, str]]) -> None:
+            for nomor, pesan in sorted(baru):
+                errors.append((nomor, pesan))
+                if on_error is not None:
+                    on_error(nomor, pesan)
+        
+        try:
+            self._get_data()
+            versi_awal = None
+            baris_nim: Dict[str, int] = {}
+            accepted: List[Tuple[int, Dict]] = []
+            
+            for records, chunk_errors in self._iter_import_chunks(rows, workers, chunk_size):
+                # Gabungkan error worker dan error NIM duplikat sesuai nomor baris
+                duplicate_errors = []
+                with self._rwlock.baca():
+                    if versi_awal is None:
+                        versi_awal = self._dataset_version
+                    existing = self._seq_by_nim
+                    for nomor, record in records:
+                        nim = record["nim"]
+                        if nim in existing:
+                            duplicate_errors.append((nomor, f"NIM {nim} sudah terdaftar"))
+                        elif nim in baris_nim:
+                            duplicate_errors.append(
+                                (nomor, f"NIM {nim} duplikat dengan baris {baris_nim[nim]}")
+                            )
+                        else:
+                            baris_nim[nim] = nomor
+                            accepted.append((nomor, record))
+                laporkan(chunk_errors + duplicate_errors)
+            
+            if errors and not skip_invalid:
+                return (False, f"❌ Import dibatalkan: {len(errors)} baris tidak valid",
+                        errors)
+            
+            with self._rwlock.tulis():
+                data = self._get_data()
+                if accepted and self._dataset_version != versi_awal:
+                    # Data berubah selama validasi: cek ulang NIM terhadap data terbaru
+                    existing = self._seq_by_nim
+                    laporkan([(nomor, f"NIM {record['nim']} sudah terdaftar")
+                              for nomor, record in accepted if record["nim"] in existing])
+                    accepted = [(nomor, record) for nomor, record in accepted
+                                if record["nim"] not in existing]
+                    errors.sort()
+                    if errors and not skip_invalid:
+                        return (False,
+                                f"❌ Import dibatalkan: {len(errors)} baris tidak valid",
+                                errors)
+                if not accepted:
+                    return False, "❌ Tidak ada data valid untuk di-import", errors
+                
+                baru = [self._intern_record(record) for _, record in accepted]
+                self._commit(data + baru)
+                for record in baru:
+                    self._seq_by_nim[record["nim"]] = self._next_seq
+                    self._next_seq += 1
+                # Banyak record sekaligus: bangun ulang view lebih murah daripada insert satu per satu
+                for view in self._sorted_views.values():
+                    self._build_view(view)
+            
+            pesan = f"✅ {len(accepted)} mahasiswa berhasil di-import"
+            if errors:
+                pesan += f" ({len(errors)} baris dilewati)"
+            return True, pesan, errors
+        
+        except Exception as e:
+            return False, f"❌ Error saat import: {str(e)}", errors
+    
     # ========== READ OPERATION ==========
     
     def read_all_mahasiswa(self) -> List[Dict]:
@@ -228,10 +861,38 @@ class CRUDManager:
             List dari dictionary mahasiswa
         """
         try:
-            return self._load_from_file()
+            return list(self._get_data())
         except IOError:
             return []
     
+    def iter_mahasiswa(self) -> Iterator[MahasiswaProxy]:
+        """
+        Read: Iterasi semua mahasiswa sebagai MahasiswaProxy (lazy).
+        Record tidak disalin dan object model baru dibuat jika perilakunya
+        (misal info_display) dipanggil.
+        
+        Returns:
+            Iterator MahasiswaProxy sesuai urutan data
+        """
+        try:
+            data = self._get_data()
+        except IOError:
+            return iter(())
+        return (MahasiswaProxy(mahasiswa) for mahasiswa in data)
+    
+    def get_mahasiswa(self, nim: str) -> Optional[MahasiswaProxy]:
+        """
+        Read: Mahasiswa berdasarkan NIM sebagai MahasiswaProxy (lazy).
+        
+        Args:
+            nim: NIM yang dicari
+        
+        Returns:
+            MahasiswaProxy atau None jika tidak ditemukan
+        """
+        mahasiswa = self.read_mahasiswa_by_nim(nim)
+        return MahasiswaProxy(mahasiswa) if mahasiswa is not None else None
+    
     def read_mahasiswa_by_nim(self, nim: str) -> Optional[Dict]:
         """
         Read: Cari mahasiswa berdasarkan NIM.
@@ -243,7 +904,7 @@ class CRUDManager:
             Dictionary mahasiswa atau None jika tidak ditemukan
         """
         try:
-            data = self._load_from_file()
+            data = self._get_data()
             for mahasiswa in data:
                 if mahasiswa.get("nim") == nim:
                     return mahasiswa
@@ -251,8 +912,131 @@ class CRUDManager:
         except IOError:
             return None
     
+    def filter_mahasiswa(
+        self,
+        jurusan: List[str] = None,
+        status: List[str] = None
+    ) -> List[Dict]:
+        """
+        Read: Ambil mahasiswa dengan jurusan dan status tertentu.
+        
+        Nilai filter diterjemahkan sekali ke kode kolom dictionary-encoded,
+        lalu setiap baris dicek dengan membandingkan kode integer, bukan string.
+        
+        Args:
+            jurusan: Daftar jurusan yang diterima (None = semua)
+            status: Daftar status yang diterima (None = semua)
+        
+        Returns:
+            List dictionary mahasiswa sesuai urutan data
+        """
+        try:
+            data, table, _ = self._data_dan_tabel()
+        except IOError:
+            return []
+        
+        filters = []
+        for field, wanted in (("jurusan", jurusan), ("status", status)):
+            if wanted is None:
+                continue
+            wanted = set(wanted)
+            codes, values = table.codes(field)
+            allowed = {code for code, value in enumerate(values) if value in wanted}
+            filters.append((codes, allowed))
+        
+        return [
+            mahasiswa for row, mahasiswa in enumerate(data)
+            if all(codes[row] in allowed for codes, allowed in filters)
+        ]
+
+    def query_mahasiswa(
+        self,
+        jurusan: List[str] = None,
+        status: List[str] = None,
+        sort_key: str = None,
+        ascending: bool = True,
+        offset: int = 0,
+        limit: int = None
+    ) -> Tuple[List[Dict], int]:
+        """
+        Read: Satu halaman data dengan filter dan urutan, dievaluasi di
+        server sehingga UI hanya menerima record yang ditampilkan.
+
+        ===== ANALISIS =====
+        - Tanpa filter: slice data / halaman sorted view, O(offset + limit)
+        - Filter tanpa urutan: filter_mahasiswa (kode integer), O(n)
+        - Filter + urutan: telusuri sorted view sekali sambil menyaring dan
+          menghitung total, O(n); hanya record halaman yang dikumpulkan
+
+        Args:
+            jurusan: Daftar jurusan yang diterima (None = semua)
+            status: Daftar status yang diterima (None = semua)
+            sort_key: Kolom urutan (lihat KOLOM_SORTED_VIEW, None = urutan data)
+            ascending: Arah urutan
+            offset: Jumlah record yang dilewati
+            limit: Jumlah record maksimal (None = sampai akhir)
+
+        Returns:
+            Tuple (list dictionary mahasiswa pada halaman, total record yang cocok)
+
+        Raises:
+            ValueError: Jika sort_key tidak didukung
+        """
+        try:
+            data = self._get_data()
+        except IOError:
+            return [], 0
+        end = None if limit is None else offset + limit
+
+        if jurusan is None and status is None:
+            if sort_key is None:
+                return data[offset:end], len(data)
+            return self.get_sorted(sort_key, ascending, offset, limit), len(data)
+
+        if sort_key is None:
+            cocok = self.filter_mahasiswa(jurusan, status)
+            return cocok[offset:end], len(cocok)
+
+        syarat = [
+            (field, set(wanted))
+            for field, wanted in (("jurusan", jurusan), ("status", status))
+            if wanted is not None
+        ]
+        self.register_sorted_view(sort_key)
+        halaman: List[Dict] = []
+        total = 0
+        with self._rwlock.baca():
+            for mahasiswa in self._sorted_views[sort_key].iter_records(ascending):
+                if all(mahasiswa.get(field) in wanted for field, wanted in syarat):
+                    if total >= offset and (end is None or total < end):
+                        halaman.append(mahasiswa)
+                    total += 1
+        return halaman, total
+
+    # ========== OPTIMISTIC CONCURRENCY ==========
+    
+    @classmethod
+    def get_versi(cls, mahasiswa: Dict) -> int:
+        """
+        Versi record (etag). Simpan nilai ini saat data ditampilkan, lalu
+        kirim sebagai expected_versi ke update/delete: jika record sudah
+        diubah orang lain sejak itu, perubahan ditolak alih-alih menimpa.
+        """
+        return mahasiswa.get("versi", cls.VERSI_AWAL)
+    
+    @classmethod
+    def _cek_versi(cls, mahasiswa: Dict, expected_versi: Optional[int]) -> Optional[str]:
+        """Pesan konflik jika expected_versi diisi dan berbeda dari versi record."""
+        versi = cls.get_versi(mahasiswa)
+        if expected_versi is None or expected_versi == versi:
+            return None
+        return (f"{cls.PESAN_KONFLIK} data NIM {mahasiswa.get('nim')} sudah diubah pengguna lain "
+                f"(versi {versi}, Anda mengedit versi {expected_versi}). "
+                f"Muat ulang data lalu ulangi perubahan.")
+    
     # ========== UPDATE OPERATION ==========
     
+    @dengan_lock_tulis
     def update_mahasiswa(
         self,
         nim: str,
@@ -260,10 +1044,12 @@ class CRUDManager:
         jurusan: str = None,
         email: str = None,
         status: str = None,
-        ipk: float = None
+        ipk: float = None,
+        expected_versi: int = None
     ) -> tuple[bool, str]:
         """
         Update: Edit data mahasiswa berdasarkan NIM.
+        Setiap update berhasil menaikkan versi record.
         
         Args:
             nim: NIM mahasiswa yang akan diupdate
@@ -272,53 +1058,73 @@ class CRUDManager:
             email: Email baru (opsional)
             status: Status baru (opsional)
             ipk: IPK baru (opsional, untuk mahasiswa lama)
+            expected_versi: Versi record saat data ditampilkan (lihat
+                get_versi); update ditolak jika record sudah berubah
         
         Returns:
             Tuple (success: bool, message: str)
         """
         try:
-            data = self._load_from_file()
-            found = False
+            data = self._get_data()
             
-            for mahasiswa in data:
+            index = None
+            for i, mahasiswa in enumerate(data):
                 if mahasiswa.get("nim") == nim:
-                    found = True
-                    
-                    # Validasi dan update field yang diberikan
-                    if nama is not None:
-                        if not self.validasi_nama(nama):
-                            return False, "❌ Nama minimal 3 karakter"
-                        mahasiswa["nama"] = nama
-                    
-                    if jurusan is not None:
-                        if not self.validasi_jurusan(jurusan):
-                            return False, "❌ Jurusan tidak boleh kosong"
-                        mahasiswa["jurusan"] = jurusan
-                    
-                    if email is not None:
-                        if not self.validasi_email(email):
-                            return False, "❌ Format email tidak valid"
-                        mahasiswa["email"] = email
-                    
-                    if status is not None:
-                        status_valid = ["aktif", "tidak aktif", "lulus", "cuti"]
-                        if status.lower() not in status_valid:
-                            return False, f"❌ Status harus: {', '.join(status_valid)}"
-                        mahasiswa["status"] = status.lower()
-                    
-                    if ipk is not None:
-                        if "ipk" in mahasiswa:
-                            if not (0.0 <= ipk <= 4.0):
-                                return False, "❌ IPK harus antara 0.0 - 4.0"
-                            mahasiswa["ipk"] = round(ipk, 2)
-                    
+                    index = i
                     break
             
-            if not found:
+            if index is None:
                 return False, f"❌ Mahasiswa dengan NIM {nim} tidak ditemukan"
             
+            # Update dilakukan pada salinan; data asli tidak berubah jika
+            # validasi gagal atau penyimpanan error
+            old_mahasiswa = data[index]
+            konflik = self._cek_versi(old_mahasiswa, expected_versi)
+            if konflik:
+                return False, konflik
+            mahasiswa = dict(old_mahasiswa)
+            
+            # Validasi dan update field yang diberikan
+            if nama is not None:
+                if not self.validasi_nama(nama):
+                    return False, "❌ Nama minimal 3 karakter"
+                mahasiswa["nama"] = nama
+            
+            if jurusan is not None:
+                if not self.validasi_jurusan(jurusan):
+                    return False, "❌ Jurusan tidak boleh kosong"
+                mahasiswa["jurusan"] = jurusan
+            
+            if email is not None:
+                if not self.validasi_email(email):
+                    return False, "❌ Format email tidak valid"
+                mahasiswa["email"] = email
+            
+            if status is not None:
+                if status.lower() not in validasi.STATUS_VALID:
+                    return False, f"❌ Status harus: {', '.join(validasi.STATUS_VALID)}"
+                mahasiswa["status"] = status.lower()
+            
+            if ipk is not None:
+                if "ipk" in mahasiswa:
+                    if not (0.0 <= ipk <= 4.0):
+                        return False, "❌ IPK harus antara 0.0 - 4.0"
+                    mahasiswa["ipk"] = round(ipk, 2)
+            
             # Simpan perubahan
-            self._save_to_file(data)
+            mahasiswa["versi"] = self.get_versi(old_mahasiswa) + 1
+            self._intern_record(mahasiswa)
+            new_data = list(data)
+            new_data[index] = mahasiswa
+            self._commit(new_data)
+            
+            # Perbarui sorted view: entry lama diganti entry baru (posisi
+            # berpindah jika kunci urutnya berubah)
+            seq = self._seq_by_nim[nim]
+            for view in self._sorted_views.values():
+                view.remove(seq, old_mahasiswa)
+                view.insert(seq, mahasiswa)
+            
             return True, f"✅ Data mahasiswa berhasil diupdate"
         
         except Exception as e:
@@ -326,28 +1132,39 @@ class CRUDManager:
     
     # ========== DELETE OPERATION ==========
     
-    def delete_mahasiswa(self, nim: str) -> tuple[bool, str]:
+    @dengan_lock_tulis
+    def delete_mahasiswa(self, nim: str, expected_versi: int = None) -> tuple[bool, str]:
         """
         Delete: Hapus mahasiswa berdasarkan NIM.
         
         Args:
             nim: NIM mahasiswa yang akan dihapus
+            expected_versi: Versi record saat data ditampilkan (lihat
+                get_versi); delete ditolak jika record sudah berubah
         
         Returns:
             Tuple (success: bool, message: str)
         """
         try:
-            data = self._load_from_file()
-            initial_length = len(data)
+            data = self._get_data()
             
             # Filter: hapus mahasiswa dengan NIM yang cocok
-            data = [m for m in data if m.get("nim") != nim]
+            removed = [m for m in data if m.get("nim") == nim]
             
-            if len(data) == initial_length:
+            if not removed:
                 return False, f"❌ Mahasiswa dengan NIM {nim} tidak ditemukan"
             
+            konflik = self._cek_versi(removed[0], expected_versi)
+            if konflik:
+                return False, konflik
+            
             # Simpan data yang sudah dihapus
-            self._save_to_file(data)
+            self._commit([m for m in data if m.get("nim") != nim])
+            
+            seq = self._seq_by_nim.pop(nim)
+            for view in self._sorted_views.values():
+                for mahasiswa in removed:
+                    view.remove(seq, mahasiswa)
             return True, f"✅ Mahasiswa berhasil dihapus"
         
         except Exception as e:
@@ -355,15 +1172,22 @@ class CRUDManager:
     
     # ========== STATISTIK ==========
     
-    def get_statistik(self) -> Dict[str, Any]:
+    def get_statistik(self, table: MahasiswaTable = None) -> Dict[str, Any]:
         """
         Dapatkan statistik data mahasiswa.
         
+        Args:
+            table: MahasiswaTable opsional (misal dari get_table()); jika
+                diisi, statistik dihitung dari kolom tabel tersebut
+        
         Returns:
             Dictionary berisi berbagai statistik
         """
         try:
-            data = self._load_from_file()
+            if table is not None:
+                return self._statistik_tabel(table)
+            
+            data = self._get_data()
             
             if not data:
                 return {
@@ -373,37 +1197,29 @@ class CRUDManager:
                     "rata_ipk": 0.0
                 }
             
-            # Hitung statistik
-            total_mahasiswa = len(data)
-            total_per_jurusan = {}
-            total_per_status = {}
-            total_ipk = 0.0
-            count_ipk = 0
-            
-            for mahasiswa in data:
-                # Per jurusan
-                jurusan = mahasiswa.get("jurusan", "Unknown")
-                total_per_jurusan[jurusan] = total_per_jurusan.get(jurusan, 0) + 1
-                
-                # Per status
-                status = mahasiswa.get("status", "Unknown")
-                total_per_status[status] = total_per_status.get(status, 0) + 1
-                
-                # Rata-rata IPK
-                if "ipk" in mahasiswa:
-                    total_ipk += mahasiswa["ipk"]
-                    count_ipk += 1
-            
-            rata_ipk = (total_ipk / count_ipk) if count_ipk > 0 else 0.0
-            
-            return {
-                "total_mahasiswa": total_mahasiswa,
-                "total_per_jurusan": total_per_jurusan,
-                "total_per_status": total_per_status,
-                "rata_ipk": round(rata_ipk, 2),
-                "data_dengan_ipk": count_ipk
-            }
+            # Hitung statistik atas kode integer tabel kolumnar (cache per versi)
+            return self._statistik_tabel(self.get_table())
         
         except Exception as e:
             print(f"Error mendapatkan statistik: {str(e)}")
             return {}
+    
+    @staticmethod
+    def _statistik_tabel(table: MahasiswaTable) -> Dict[str, Any]:
+        """Statistik dari kolom MahasiswaTable: hitungan atas kode integer."""
+        total_ipk, count_ipk = table.ipk_summary()
+        per_kolom = {}
+        for kolom in ("jurusan", "status"):
+            counts = table.value_counts(kolom)
+            if None in counts:
+                # Record tanpa field ini dihitung sebagai "Unknown"
+                tanpa_nilai = counts.pop(None)
+                counts["Unknown"] = counts.get("Unknown", 0) + tanpa_nilai
+            per_kolom[kolom] = counts
+        return {
+            "total_mahasiswa": len(table),
+            "total_per_jurusan": per_kolom["jurusan"],
+            "total_per_status": per_kolom["status"],
+            "rata_ipk": round(total_ipk / count_ipk, 2) if count_ipk > 0 else 0.0,
+            "data_dengan_ipk": count_ipk
+        }
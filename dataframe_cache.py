@@ -0,0 +1,203 @@
+"""
+Module untuk DataFrame Cache - snapshot DataFrame dataset per versi.
+
+Halaman Streamlit sebelumnya membuat pd.DataFrame dari list dict di setiap
+render. Sekarang satu snapshot DataFrame dibangun sekali per dataset
+version langsung dari kolom MahasiswaTable, lalu dipakai bersama oleh
+semua halaman dan session; halaman hanya mengambil baris yang ditampilkan.
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from mahasiswa import MahasiswaTable
+from sinkronisasi import dengan_lock
+
+# Urutan kolom sama dengan MahasiswaTable.row() (dan record aslinya)
+KOLOM_DATAFRAME = (
+    "nama", "nim", "jurusan", "email", "tahun_masuk", "status", "tanggal_dibuat",
+    "program_orientasi", "ipk", "keterangan_ipk", "kategori", "versi",
+)
+
+# Kolom opsional: tidak dibuat jika tidak ada baris yang memiliki nilainya
+KOLOM_OPSIONAL = ("program_orientasi", "ipk", "keterangan_ipk", "kategori", "versi")
+
+
+def _kolom_kategori(table: MahasiswaTable, key: str) -> pd.Categorical:
+    """
+    Kolom dictionary-encoded sebagai pandas Categorical langsung dari kode
+    tabel (tanpa membaca string per baris). Kategori None menjadi NaN.
+    """
+    codes, values = table.codes(key)
+    codes = np.frombuffer(codes, dtype=np.uint16).astype(np.int32)
+    if None in values:
+        kategori = [value for value in values if value is not None]
+        peta = np.array([-1 if value is None else kategori.index(value) for value in values],
+                        dtype=np.int32)
+        return pd.Categorical.from_codes(peta[codes], categories=kategori)
+    return pd.Categorical.from_codes(codes, categories=values)
+
+
+def bangun_dataframe(table: MahasiswaTable) -> pd.DataFrame:
+    """
+    Bangun DataFrame dari MahasiswaTable.
+
+    ===== ANALISIS =====
+    Time Complexity: O(n) per kolom; kolom kategori hanya menyalin kode
+    Space Complexity: O(n) per kolom (jurusan/status/kategori/keterangan_ipk
+                      2-4 byte per baris sebagai Categorical)
+
+    Field di luar skema tabel (jarang, disimpan sparse) tidak ikut.
+
+    Args:
+        table: MahasiswaTable (lihat CRUDManager.get_table)
+
+    Returns:
+        DataFrame dengan kolom KOLOM_DATAFRAME (kolom opsional yang kosong dibuang)
+    """
+    kolom: Dict[str, object] = {}
+    for key in KOLOM_DATAFRAME:
+        if key in MahasiswaTable.KOLOM_KODE:
+            kolom[key] = _kolom_kategori(table, key)
+        elif key in ("tahun_masuk", "versi"):
+            kolom[key] = pd.array(table.column(key), dtype="Int64")
+        elif key == "ipk":
+            kolom[key] = pd.array(table.column(key), dtype="Float64")
+        elif key == "program_orientasi":
+            kolom[key] = pd.array(table.column(key), dtype="boolean")
+        else:
+            kolom[key] = table.column(key)
+
+    df = pd.DataFrame(kolom)
+    kosong = [key for key in KOLOM_OPSIONAL if df[key].isna().all()]
+    return df.drop(columns=kosong) if kosong else df
+
+
+class DataFrameSnapshot(NamedTuple):
+    """Snapshot DataFrame satu dataset version (read-only, dipakai bersama)."""
+    df: pd.DataFrame
+    posisi_nim: pd.Index      # NIM per baris df, untuk mencari posisi record
+    dataset_version: int
+    nbytes: int
+
+    @classmethod
+    def dari_tabel(cls, table: MahasiswaTable, dataset_version: int) -> "DataFrameSnapshot":
+        """Bangun snapshot dari tabel kolumnar satu dataset version."""
+        df = bangun_dataframe(table)
+        # Index object (string Python yang sama dengan tabel): hash lookup
+        # get_indexer ~3x lebih cepat daripada index string[pyarrow]
+        posisi_nim = pd.Index(table.column("nim"), dtype=object)
+        nbytes = int(df.memory_usage(index=True, deep=True).sum()) + posisi_nim.memory_usage()
+        return cls(df, posisi_nim, dataset_version, nbytes)
+
+    def baris(self, records: List[Dict], dataset_version: int) -> pd.DataFrame:
+        """
+        Sub-DataFrame untuk records (urutan records dipertahankan), dicari
+        lewat NIM. Hanya baris yang diminta yang disalin.
+
+        Jika records berasal dari dataset version lain (data berubah di
+        antara pembacaan) atau ada record yang tidak ada di snapshot,
+        DataFrame dibangun langsung dari records, sehingga isi baris selalu
+        sama dengan records.
+
+        Args:
+            records: List dictionary mahasiswa (misal satu halaman)
+            dataset_version: Versi dataset saat records dibaca (dibaca
+                sebelum records jika tidak diambil bersamaan)
+
+        Returns:
+            DataFrame dengan index 0..len(records)-1
+        """
+        if not records:
+            return self.df.iloc[:0]
+        if dataset_version == self.dataset_version and self.posisi_nim.is_unique:
+            posisi = self.posisi_nim.get_indexer([record["nim"] for record in records])
+            if (posisi >= 0).all():
+                return self.df.iloc[posisi].reset_index(drop=True)
+        return pd.DataFrame(records)
+
+
+class DataFrameCache:
+    """
+    Cache LRU berbatas memori untuk snapshot DataFrame.
+
+    Satu entry per file data (CRUDManager.file_path), berlaku untuk satu
+    dataset version. Versi baru menggantikan entry lama file yang sama;
+    jika total ukuran melebihi max_bytes, entry paling lama dipakai dibuang.
+
+    ===== ANALISIS DATAFRAME CACHE =====
+    - Hit: O(1) (satu pengecekan dataset version)
+    - Miss: O(n) membangun DataFrame dari kolom MahasiswaTable
+    - Space: ukuran DataFrame (memory_usage deep) per entry, total <= max_bytes
+
+    Thread-safe: satu cache bisa dipakai bersama oleh semua session.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Inisialisasi cache kosong.
+
+        Args:
+            max_bytes: Batas total ukuran snapshot yang disimpan
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, DataFrameSnapshot]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total ukuran snapshot yang tersimpan."""
+        return self._bytes
+
+    @dengan_lock
+    def get(self, crud) -> DataFrameSnapshot:
+        """
+        Snapshot DataFrame dataset crud saat ini; dibangun jika belum ada
+        untuk dataset version ini.
+
+        Args:
+            crud: CRUDManager
+
+        Returns:
+            DataFrameSnapshot (df jangan dimodifikasi)
+        """
+        dataset_version = crud.get_dataset_version()
+        key = crud.file_path
+        snapshot = self._entries.get(key)
+        if snapshot is not None and snapshot.dataset_version == dataset_version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+        self.misses += 1
+        # Tabel dan versinya diambil bersamaan: label snapshot selalu tepat
+        table, dataset_version = crud.read_table_snapshot()
+        snapshot = DataFrameSnapshot.dari_tabel(table, dataset_version)
+        self._put(key, snapshot)
+        return snapshot
+
+    def _put(self, key: str, snapshot: DataFrameSnapshot) -> None:
+        """Simpan snapshot, lalu evict entry paling lama sampai <= max_bytes."""
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key).nbytes
+        if snapshot.nbytes > self.max_bytes:
+            return
+        self._entries[key] = snapshot
+        self._bytes += snapshot.nbytes
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
@@ -0,0 +1,53 @@
+"""
+Module untuk saklar mode instrumentasi algoritma sorting & searching.
+
+- Mode edukasi (instrumented, default): algoritma menghitung jumlah
+  perbandingan secara persis di dalam loop
+- Mode produksi: algoritma memakai jalur cepat tanpa counter (misal
+  sorted() bawaan Python) dengan urutan hasil yang sama; jumlah
+  perbandingan dikembalikan sebagai None
+
+Mode disimpan di ContextVar sehingga setiap thread (misal setiap session
+Streamlit) punya mode sendiri.
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_INSTRUMENTED: ContextVar[bool] = ContextVar("instrumented", default=True)
+
+
+def is_instrumented() -> bool:
+    """True jika algoritma harus menghitung perbandingan (mode edukasi)."""
+    return _INSTRUMENTED.get()
+
+
+def set_instrumented(enabled: bool) -> None:
+    """
+    Atur mode instrumentasi untuk thread/context saat ini.
+
+    Args:
+        enabled: True untuk mode edukasi, False untuk mode produksi
+    """
+    _INSTRUMENTED.set(bool(enabled))
+
+
+@contextmanager
+def mode_instrumentasi(enabled: bool) -> Iterator[None]:
+    """
+    Jalankan blok kode dengan mode instrumentasi tertentu, lalu kembalikan
+    mode sebelumnya.
+
+    Contoh:
+        with mode_instrumentasi(False):
+            hasil, _ = AlgoritmaSorting.merge_sort(data, "nama")
+    """
+    token = _INSTRUMENTED.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _INSTRUMENTED.reset(token)
@@ -6,8 +6,10 @@ Developer: Ahmad Rasyid - Teknik Informatika
 Date: 2025-12-15
 """
 
+from array import array
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
 
 class Mahasiswa:
@@ -21,8 +23,21 @@ class Mahasiswa:
     - Python secara otomatis mengelola reference counting dan garbage collection
     - Ketika kita assign: mahasiswa = Mahasiswa(...), 'mahasiswa' adalah referensi ke object
     - Tidak ada arithmetic pada reference seperti pointer increment (++p) di C++
+    
+    Atribut disimpan di __slots__ (bukan __dict__ per object) sehingga satu
+    object jauh lebih kecil; nama slot privat tetap di-mangle oleh Python.
     """
     
+    __slots__ = ("__nama", "__nim", "__jurusan", "__email",
+                 "__tahun_masuk", "__status", "__tanggal_dibuat")
+    
+    # Field yang dikembalikan info() / view(), sesuai urutan
+    INFO_FIELDS = ("nama", "nim", "jurusan", "email",
+                   "tahun_masuk", "status", "tanggal_dibuat")
+    
+    # Nilai status yang valid (setter status & validasi.py)
+    STATUS_VALID = ("aktif", "tidak aktif", "lulus", "cuti")
+    
     # Class variable untuk tracking total mahasiswa
     total_mahasiswa = 0
     
@@ -51,6 +66,171 @@ class Mahasiswa:
         # Increment total mahasiswa
         Mahasiswa.total_mahasiswa += 1
     
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "Mahasiswa":
+        """
+        Bangun kembali object dari dict tersimpan (hasil info()), termasuk
+        tanggal_dibuat aslinya. __init__ tidak dipanggil: data tersimpan
+        sudah valid dan total_mahasiswa hanya menghitung object baru.
+        
+        Jika dipanggil dari Mahasiswa, subclass dipilih dari "kategori".
+        
+        Args:
+            record: Dictionary mahasiswa
+        
+        Returns:
+            Object Mahasiswa, MahasiswaBaru atau MahasiswaLama
+        """
+        if cls is Mahasiswa:
+            cls = KELAS_PER_KATEGORI.get(record.get("kategori"), Mahasiswa)
+        return cls._bangun(record)
+    
+    @classmethod
+    def _bangun(cls, record: Mapping, tahun_default: int = None,
+                tanggal_default: str = None) -> "Mahasiswa":
+        """
+        Isi slot object baru dari record tanpa validasi. Default tahun &
+        tanggal hanya dihitung dengan datetime.now() jika tidak diberikan
+        dan record tidak memilikinya.
+        """
+        obj = cls.__new__(cls)
+        obj.__nama = record["nama"]
+        obj.__nim = record["nim"]
+        obj.__jurusan = record["jurusan"]
+        obj.__email = record["email"]
+        obj.__tahun_masuk = (record.get("tahun_masuk") or tahun_default
+                             or datetime.now().year)
+        status = record.get("status", "aktif")
+        obj.__status = status.lower() if isinstance(status, str) else status
+        obj.__tanggal_dibuat = (record.get("tanggal_dibuat") or tanggal_default
+                                or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        obj._load_extra(record)
+        return obj
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping], batch_size: int = 1024,
+                     validate: bool = True) -> Iterator["Mahasiswa"]:
+        """
+        Batch factory: bangun object dari banyak record secara lazy.
+        
+        Record diproses per batch:
+        - Satu datetime.now() per batch untuk tahun_masuk / tanggal_dibuat
+          yang kosong (bukan satu per object)
+        - Validasi per kolom untuk seluruh batch sekaligus (validate_batch),
+          bukan lewat setter per object
+        - Subclass dipilih lewat lookup KELAS_PER_KATEGORI (jika dipanggil
+          dari Mahasiswa), seperti from_dict()
+        
+        Object di-yield satu per satu, sehingga memori yang dipakai hanya
+        O(batch_size) selain object yang disimpan pemanggil. Seperti
+        from_dict(), __init__ tidak dipanggil dan total_mahasiswa tidak berubah.
+        
+        ===== ANALISIS =====
+        Time Complexity: O(n)
+        Space Complexity: O(batch_size)
+        
+        Args:
+            records: Iterable dict / Mapping mahasiswa
+            batch_size: Jumlah record per batch
+            validate: False untuk data yang sudah pasti valid (misal dari disk)
+        
+        Returns:
+            Iterator object Mahasiswa, MahasiswaBaru atau MahasiswaLama
+        
+        Raises:
+            ValueError: Jika ada record tidak valid di sebuah batch
+                (object batch tersebut tidak di-yield)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size minimal 1")
+        batch: List[Mapping] = []
+        offset = 0
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield from cls._bangun_batch(batch, offset, validate)
+                offset += len(batch)
+                batch = []
+        if batch:
+            yield from cls._bangun_batch(batch, offset, validate)
+    
+    @classmethod
+    def _bangun_batch(cls, batch: List[Mapping], offset: int,
+                      validate: bool) -> Iterator["Mahasiswa"]:
+        """Validasi lalu bangun satu batch dengan satu timestamp."""
+        now = datetime.now()
+        tahun = now.year
+        tanggal = now.strftime("%Y-%m-%d %H:%M:%S")
+        if validate:
+            cls.validate_batch(batch, offset, tahun)
+        
+        if cls is Mahasiswa:
+            kelas_per_kategori = KELAS_PER_KATEGORI
+            for record in batch:
+                kelas = kelas_per_kategori.get(record.get("kategori"), Mahasiswa)
+                yield kelas._bangun(record, tahun, tanggal)
+        else:
+            bangun = cls._bangun
+            for record in batch:
+                yield bangun(record, tahun, tanggal)
+    
+    @classmethod
+    def validate_batch(cls, batch: List[Mapping], offset: int = 0,
+                       tahun_sekarang: int = None) -> None:
+        """
+        Validasi sekumpulan record per kolom dengan aturan validasi.py
+        (validasi.validasi_batch), sama seperti create/import di CRUDManager:
+        nama minimal 3 karakter, format NIM dan email, jurusan tidak kosong,
+        status valid (tanpa membedakan huruf besar/kecil, seperti setter),
+        tahun masuk 1990..tahun sekarang dan IPK 0.0..4.0 jika ada.
+        
+        Args:
+            batch: List record
+            offset: Nomor record pertama batch (untuk pesan error)
+            tahun_sekarang: Batas atas tahun masuk (default: tahun ini)
+        
+        Raises:
+            ValueError: Berisi setiap kolom yang gagal beserta nomor record
+        """
+        # Import lokal: validasi meng-import module ini (STATUS_VALID)
+        import validasi
+        
+        masks = validasi.validasi_batch(validasi.kolom_dari_records(batch), tahun_sekarang)
+        errors = []
+        for kolom, mask in masks.items():
+            invalid = mask.nonzero()[0].tolist()
+            if invalid:
+                nomor = ", ".join(str(offset + i) for i in invalid[:5])
+                lebih = f" (+{len(invalid) - 5} lainnya)" if len(invalid) > 5 else ""
+                errors.append(f"{kolom} tidak valid pada record {nomor}{lebih}")
+        
+        if errors:
+            raise ValueError("; ".join(errors))
+    
+    def _load_extra(self, record: Dict[str, Any]) -> None:
+        """Hook untuk subclass: isi atribut tambahan saat from_dict()."""
+    
+    @classmethod
+    def new_record(cls, nama: str, nim: str, jurusan: str, email: str,
+                   tahun_masuk: int = None, status: str = "aktif",
+                   tanggal_dibuat: str = None) -> Dict[str, Any]:
+        """
+        Buat dict record baru (sama dengan info() object yang baru dibuat)
+        tanpa membuat object. Dipakai CRUDManager saat menyimpan data.
+        
+        Args:
+            tanggal_dibuat: Timestamp yang dipakai (default: sekarang)
+        """
+        return {
+            "nama": nama,
+            "nim": nim,
+            "jurusan": jurusan,
+            "email": email,
+            "tahun_masuk": tahun_masuk or datetime.now().year,
+            "status": status,
+            "tanggal_dibuat": tanggal_dibuat or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
     # ========== GETTER & SETTER (Property Encapsulation) ==========
     
     @property
@@ -121,9 +301,8 @@ class Mahasiswa:
     @status.setter
     def status(self, value: str) -> None:
         """Setter untuk status mahasiswa."""
-        status_valid = ["aktif", "tidak aktif", "lulus", "cuti"]
-        if value.lower() not in status_valid:
-            raise ValueError(f"Status harus salah satu dari: {', '.join(status_valid)}")
+        if value.lower() not in self.STATUS_VALID:
+            raise ValueError(f"Status harus salah satu dari: {', '.join(self.STATUS_VALID)}")
         self.__status = value.lower()
     
     @property
@@ -161,6 +340,13 @@ class Mahasiswa:
             "tanggal_dibuat": self.__tanggal_dibuat
         }
     
+    def view(self) -> "MahasiswaView":
+        """
+        View read-only (zero-copy) dengan isi yang sama seperti info().
+        Nilai dibaca langsung dari object saat diakses, tanpa membuat dict baru.
+        """
+        return MahasiswaView(self)
+    
     def info_display(self) -> str:
         """Method untuk menampilkan info dalam format readable."""
         return (
@@ -179,6 +365,13 @@ class MahasiswaBaru(Mahasiswa):
     Digunakan untuk mahasiswa baru dengan atribut tambahan.
     """
     
+    __slots__ = ("program_orientasi",)
+    
+    INFO_FIELDS = Mahasiswa.INFO_FIELDS + ("program_orientasi", "kategori")
+    
+    # Kategori sama untuk semua object: disimpan di class, bukan per object
+    kategori = "Mahasiswa Baru"
+    
     def __init__(self, nama: str, nim: str, jurusan: str, email: str,
                  tahun_masuk: int = None, program_orientasi: bool = True):
         """
@@ -188,6 +381,20 @@ class MahasiswaBaru(Mahasiswa):
         super().__init__(nama, nim, jurusan, email, tahun_masuk, status="aktif")
         self.program_orientasi = program_orientasi
     
+    def _load_extra(self, record: Dict[str, Any]) -> None:
+        self.program_orientasi = record.get("program_orientasi", True)
+    
+    @classmethod
+    def new_record(cls, nama: str, nim: str, jurusan: str, email: str,
+                   tahun_masuk: int = None, program_orientasi: bool = True,
+                   tanggal_dibuat: str = None) -> Dict[str, Any]:
+        """Dict record MahasiswaBaru tanpa membuat object (lihat Mahasiswa.new_record)."""
+        record = Mahasiswa.new_record(nama, nim, jurusan, email, tahun_masuk,
+                                      "aktif", tanggal_dibuat)
+        record["program_orientasi"] = program_orientasi
+        record["kategori"] = cls.kategori
+        return record
+    
     def info(self) -> Dict[str, Any]:
         """
         Polymorphism: Override method info() dari parent class.
@@ -195,7 +402,7 @@ class MahasiswaBaru(Mahasiswa):
         """
         info_parent = super().info()
         info_parent["program_orientasi"] = self.program_orientasi
-        info_parent["kategori"] = "Mahasiswa Baru"
+        info_parent["kategori"] = self.kategori
         return info_parent
     
     def info_display(self) -> str:
@@ -211,6 +418,12 @@ class MahasiswaLama(Mahasiswa):
     Digunakan untuk mahasiswa lama dengan atribut IPK.
     """
     
+    __slots__ = ("_ipk",)
+    
+    INFO_FIELDS = Mahasiswa.INFO_FIELDS + ("ipk", "keterangan_ipk", "kategori")
+    
+    kategori = "Mahasiswa Lama"
+    
     def __init__(self, nama: str, nim: str, jurusan: str, email: str,
                  tahun_masuk: int = None, ipk: float = 0.0, status: str = "aktif"):
         """
@@ -219,6 +432,21 @@ class MahasiswaLama(Mahasiswa):
         super().__init__(nama, nim, jurusan, email, tahun_masuk, status)
         self._ipk = ipk  # Atribut protected (single underscore)
     
+    def _load_extra(self, record: Dict[str, Any]) -> None:
+        self._ipk = record.get("ipk", 0.0)
+    
+    @classmethod
+    def new_record(cls, nama: str, nim: str, jurusan: str, email: str,
+                   tahun_masuk: int = None, ipk: float = 0.0, status: str = "aktif",
+                   tanggal_dibuat: str = None) -> Dict[str, Any]:
+        """Dict record MahasiswaLama tanpa membuat object (lihat Mahasiswa.new_record)."""
+        record = Mahasiswa.new_record(nama, nim, jurusan, email, tahun_masuk,
+                                      status, tanggal_dibuat)
+        record["ipk"] = ipk
+        record["keterangan_ipk"] = cls.keterangan_untuk(ipk)
+        record["kategori"] = cls.kategori
+        return record
+    
     @property
     def ipk(self) -> float:
         """Getter untuk IPK."""
@@ -233,15 +461,25 @@ class MahasiswaLama(Mahasiswa):
     
     def get_keterangan_ipk(self) -> str:
         """Method untuk mendapatkan keterangan berdasarkan IPK."""
-        if self._ipk >= 3.5:
+        return self.keterangan_untuk(self._ipk)
+    
+    @staticmethod
+    def keterangan_untuk(ipk: float) -> str:
+        """Keterangan untuk nilai IPK tertentu."""
+        if ipk >= 3.5:
             return "Cumlaude"
-        elif self._ipk >= 3.0:
+        elif ipk >= 3.0:
             return "Sangat Memuaskan"
-        elif self._ipk >= 2.5:
+        elif ipk >= 2.5:
             return "Memuaskan"
         else:
             return "Cukup"
     
+    @property
+    def keterangan_ipk(self) -> str:
+        """Keterangan IPK sebagai property (dipakai oleh view())."""
+        return self.get_keterangan_ipk()
+    
     def info(self) -> Dict[str, Any]:
         """
         Polymorphism: Override method info() dengan tambahan IPK.
@@ -249,7 +487,7 @@ class MahasiswaLama(Mahasiswa):
         info_parent = super().info()
         info_parent["ipk"] = self._ipk
         info_parent["keterangan_ipk"] = self.get_keterangan_ipk()
-        info_parent["kategori"] = "Mahasiswa Lama"
+        info_parent["kategori"] = self.kategori
         return info_parent
     
     def info_display(self) -> str:
@@ -258,3 +496,385 @@ class MahasiswaLama(Mahasiswa):
         return (f"{info_parent}\n"
                 f"📊 IPK: {self._ipk}\n"
                 f"🏆 Keterangan: {self.get_keterangan_ipk()}")
+
+
+# Subclass untuk setiap nilai "kategori" pada dict tersimpan
+KELAS_PER_KATEGORI = {
+    MahasiswaBaru.kategori: MahasiswaBaru,
+    MahasiswaLama.kategori: MahasiswaLama,
+}
+
+
+class MahasiswaView(Mapping):
+    """
+    Mapping read-only di atas object Mahasiswa (seperti MappingProxyType,
+    tetapi untuk object berbasis __slots__ yang tidak punya __dict__).
+    
+    Tidak ada data yang disalin: view["nama"] membaca property object saat
+    itu juga, sehingga perubahan pada object langsung terlihat di view.
+    Cocok untuk sorting/tampilan yang hanya membaca data.
+    """
+    
+    __slots__ = ("_mahasiswa",)
+    
+    def __init__(self, mahasiswa: Mahasiswa):
+        self._mahasiswa = mahasiswa
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._mahasiswa.INFO_FIELDS:
+            raise KeyError(key)
+        return getattr(self._mahasiswa, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mahasiswa.INFO_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(self._mahasiswa.INFO_FIELDS)
+    
+    def __repr__(self) -> str:
+        return f"MahasiswaView({dict(self)!r})"
+
+
+class MahasiswaProxy(Mapping):
+    """
+    Proxy lazy untuk satu record tersimpan (dict), tanpa menyalin data.
+    
+    - Akses field (proxy["nama"] atau proxy.nama) langsung membaca record
+    - Perilaku model (info_display(), get_keterangan_ipk(), dll) memicu
+      hydration: object subclass yang sesuai dibuat sekali dengan
+      Mahasiswa.from_dict lalu disimpan untuk pemanggilan berikutnya
+    
+    Sehingga menampilkan daftar mahasiswa tidak membuat object model sama
+    sekali. Proxy read-only: perubahan data dilakukan lewat CRUDManager.
+    """
+    
+    __slots__ = ("_record", "_obj")
+    
+    def __init__(self, record: Dict[str, Any]):
+        self._record = record
+        self._obj: Optional[Mahasiswa] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._record[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._record)
+    
+    def __len__(self) -> int:
+        return len(self._record)
+    
+    @property
+    def is_hydrated(self) -> bool:
+        """True jika object model sudah dibuat."""
+        return self._obj is not None
+    
+    def hydrate(self) -> Mahasiswa:
+        """Object Mahasiswa/MahasiswaBaru/MahasiswaLama untuk record ini (dibuat sekali)."""
+        if self._obj is None:
+            self._obj = Mahasiswa.from_dict(self._record)
+        return self._obj
+    
+    def __getattr__(self, name: str) -> Any:
+        # Dipanggil hanya jika atribut tidak ada di proxy
+        if name.startswith("_"):
+            raise AttributeError(name)
+        record = self._record
+        if name in record:
+            return record[name]
+        return getattr(self.hydrate(), name)
+    
+    def __repr__(self) -> str:
+        return f"MahasiswaProxy({self._record!r})"
+
+
+# ========== COLUMNAR STORAGE ==========
+
+class _KolomKode:
+    """
+    Kolom dictionary-encoded: setiap nilai disimpan sekali di daftar
+    kategori, baris hanya menyimpan kode integer (array 'H', 2 byte).
+    None juga bisa menjadi kategori (field opsional).
+    """
+    
+    __slots__ = ("codes", "values", "_index")
+    
+    def __init__(self):
+        self.codes = array('H')
+        self.values: List[Any] = []
+        self._index: Dict[Any, int] = {}
+    
+    def code_of(self, value: Any) -> int:
+        """Kode untuk value; kategori baru ditambahkan jika belum ada."""
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def lookup(self, value: Any) -> Optional[int]:
+        """Kode untuk value, atau None jika value tidak pernah muncul."""
+        return self._index.get(value)
+    
+    def append(self, value: Any) -> None:
+        self.codes.append(self.code_of(value))
+    
+    def __getitem__(self, row: int) -> Any:
+        return self.values[self.codes[row]]
+
+
+class MahasiswaTable:
+    """
+    Container kolumnar (struct-of-arrays) untuk data mahasiswa.
+    
+    Setiap field disimpan sebagai satu kolom, bukan satu dict per record:
+    - nama, nim, email, tanggal_dibuat: list string (None jika
+      tanggal_dibuat tidak ada)
+    - jurusan, status, kategori, keterangan_ipk: dictionary-encoded
+      (kode array 'H' + daftar kategori, None untuk field yang tidak ada)
+    - tahun_masuk: array('H'), ipk: array('d') dan program_orientasi: bitmap
+      nilai, ketiganya dengan validity bitmap (1 bit per baris) karena
+      record lama bisa tidak memiliki field ini
+    - versi (versi record untuk optimistic concurrency): array('I'),
+      0 berarti record tidak punya field versi
+    
+    Agregasi (jumlah per jurusan/status, rata-rata IPK) dan sorting cukup
+    membaca satu kolom yang rapat di memory. Baris hanya diwujudkan menjadi
+    dict (row) atau object Mahasiswa (table[i]) ketika diminta.
+    
+    Field yang tidak ada pada record aslinya juga tidak muncul di row(),
+    sehingga round-trip record -> tabel -> record tidak mengubah data.
+    """
+    
+    KOLOM_STRING = ("nama", "nim", "email", "tanggal_dibuat")
+    KOLOM_KODE = ("jurusan", "status", "kategori", "keterangan_ipk")
+    
+    def __init__(self):
+        """Inisialisasi tabel kosong."""
+        self._strings: Dict[str, List[str]] = {name: [] for name in self.KOLOM_STRING}
+        self._kode: Dict[str, _KolomKode] = {name: _KolomKode() for name in self.KOLOM_KODE}
+        self._tahun_masuk = array('H')
+        self._tahun_valid = bytearray()
+        self._ipk = array('d')
+        self._ipk_valid = bytearray()
+        self._orientasi = bytearray()
+        self._orientasi_valid = bytearray()
+        self._versi = array('I')
+        # Field lain di luar skema disimpan jarang (sparse) per baris
+        self._extra: Dict[int, Dict[str, Any]] = {}
+        self._len = 0
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> "MahasiswaTable":
+        """
+        Bangun tabel dari dict mahasiswa (format data_mahasiswa.json).
+        
+        Args:
+            records: Iterable dictionary mahasiswa
+        
+        Returns:
+            MahasiswaTable berisi semua record
+        """
+        table = cls()
+        for record in records:
+            table.append(record)
+        return table
+    
+    # ========== BITMAP ==========
+    
+    @staticmethod
+    def _set_bit(bitmap: bytearray, row: int, value: bool) -> None:
+        if row >> 3 >= len(bitmap):
+            bitmap.append(0)
+        if value:
+            bitmap[row >> 3] |= 1 << (row & 7)
+    
+    @staticmethod
+    def _get_bit(bitmap: bytearray, row: int) -> bool:
+        return bool(bitmap[row >> 3] & (1 << (row & 7)))
+    
+    # ========== TULIS ==========
+    
+    def append(self, record: Mapping) -> None:
+        """
+        Tambahkan satu record di akhir tabel.
+        
+        Raises:
+            KeyError: Jika field wajib (nama, nim, email) tidak ada
+        """
+        row = self._len
+        for name in self.KOLOM_STRING:
+            self._strings[name].append(record.get(name) if name == "tanggal_dibuat"
+                                       else record[name])
+        # Record lama bisa tanpa jurusan (statistik: "Unknown", seperti status)
+        self._kode["jurusan"].append(record.get("jurusan"))
+        self._kode["status"].append(record.get("status"))
+        self._kode["kategori"].append(record.get("kategori"))
+        self._kode["keterangan_ipk"].append(record.get("keterangan_ipk"))
+        
+        has_tahun = record.get("tahun_masuk") is not None
+        self._tahun_masuk.append(record["tahun_masuk"] if has_tahun else 0)
+        self._set_bit(self._tahun_valid, row, has_tahun)
+        
+        has_ipk = "ipk" in record
+        self._ipk.append(record["ipk"] if has_ipk else 0.0)
+        self._set_bit(self._ipk_valid, row, has_ipk)
+        
+        has_orientasi = "program_orientasi" in record
+        self._set_bit(self._orientasi_valid, row, has_orientasi)
+        self._set_bit(self._orientasi, row, has_orientasi and record["program_orientasi"])
+        self._versi.append(record.get("versi") or 0)
+        
+        extra = {key: value for key, value in record.items() if key not in _FIELD_TABEL}
+        if extra:
+            self._extra[row] = extra
+        self._len += 1
+    
+    # ========== BACA ==========
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def _check_row(self, row: int) -> int:
+        if row < 0:
+            row += self._len
+        if not 0 <= row < self._len:
+            raise IndexError("Index baris di luar jangkauan tabel")
+        return row
+    
+    def ipk_valid(self, row: int) -> bool:
+        """True jika baris memiliki nilai IPK."""
+        return self._get_bit(self._ipk_valid, self._check_row(row))
+    
+    def value(self, key: str, row: int) -> Any:
+        """
+        Nilai satu field pada satu baris (None untuk field opsional yang kosong).
+        
+        Raises:
+            KeyError: Jika field tidak dikenal
+        """
+        row = self._check_row(row)
+        if key in self._strings:
+            return self._strings[key][row]
+        if key in self._kode:
+            return self._kode[key][row]
+        if key == "tahun_masuk":
+            return self._tahun_masuk[row] if self._get_bit(self._tahun_valid, row) else None
+        if key == "ipk":
+            return self._ipk[row] if self._get_bit(self._ipk_valid, row) else None
+        if key == "program_orientasi":
+            if not self._get_bit(self._orientasi_valid, row):
+                return None
+            return self._get_bit(self._orientasi, row)
+        if key == "versi":
+            return self._versi[row] or None
+        if row in self._extra and key in self._extra[row]:
+            return self._extra[row][key]
+        raise KeyError(key)
+    
+    def column(self, key: str) -> List[Any]:
+        """
+        Seluruh nilai satu field sesuai urutan baris (list baru).
+        Untuk field opsional, baris tanpa nilai berisi None.
+        """
+        if key in self._strings:
+            return list(self._strings[key])
+        if key in self._kode:
+            kolom = self._kode[key]
+            return [kolom.values[code] for code in kolom.codes]
+        if key == "tahun_masuk":
+            valid = self._tahun_valid
+            return [tahun if valid[row >> 3] & (1 << (row & 7)) else None
+                    for row, tahun in enumerate(self._tahun_masuk)]
+        return [self.value(key, row) for row in range(self._len)]
+    
+    def codes(self, key: str) -> Tuple[array, List[Any]]:
+        """
+        Kode dan daftar kategori kolom dictionary-encoded (tanpa salinan).
+        
+        Raises:
+            KeyError: Jika kolom tidak dictionary-encoded
+        """
+        kolom = self._kode[key]
+        return kolom.codes, kolom.values
+    
+    def row(self, row: int) -> Dict[str, Any]:
+        """Wujudkan satu baris sebagai dict (sama seperti record aslinya)."""
+        row = self._check_row(row)
+        record = {
+            "nama": self._strings["nama"][row],
+            "nim": self._strings["nim"][row],
+            "jurusan": self._kode["jurusan"][row],
+            "email": self._strings["email"][row],
+        }
+        if record["jurusan"] is None:
+            del record["jurusan"]
+        if self._get_bit(self._tahun_valid, row):
+            record["tahun_masuk"] = self._tahun_masuk[row]
+        status = self._kode["status"][row]
+        if status is not None:
+            record["status"] = status
+        tanggal_dibuat = self._strings["tanggal_dibuat"][row]
+        if tanggal_dibuat is not None:
+            record["tanggal_dibuat"] = tanggal_dibuat
+        if self._get_bit(self._orientasi_valid, row):
+            record["program_orientasi"] = self._get_bit(self._orientasi, row)
+        if self._get_bit(self._ipk_valid, row):
+            record["ipk"] = self._ipk[row]
+        for key in ("keterangan_ipk", "kategori"):
+            value = self._kode[key][row]
+            if value is not None:
+                record[key] = value
+        if self._versi[row]:
+            record["versi"] = self._versi[row]
+        if row in self._extra:
+            record.update(self._extra[row])
+        return record
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Seluruh baris sebagai list dict."""
+        return [self.row(i) for i in range(self._len)]
+    
+    def __getitem__(self, row: int) -> Mahasiswa:
+        """table[i]: wujudkan baris menjadi object Mahasiswa (subclass sesuai kategori)."""
+        return Mahasiswa.from_dict(self.row(row))
+    
+    def __iter__(self) -> Iterator[Mahasiswa]:
+        # Baris tabel sudah valid: batch factory tanpa validasi ulang
+        return Mahasiswa.from_records(
+            (self.row(row) for row in range(self._len)), validate=False
+        )
+    
+    # ========== AGREGASI ==========
+    
+    def value_counts(self, key: str) -> Dict[Any, int]:
+        """
+        Jumlah baris per nilai kolom dictionary-encoded. Penghitungan
+        dilakukan atas kode integer; string hanya disentuh k kali.
+        """
+        codes, values = self.codes(key)
+        counts = [0] * len(values)
+        for code in codes:
+            counts[code] += 1
+        return {values[code]: count for code, count in enumerate(counts) if count}
+    
+    def ipk_summary(self) -> Tuple[float, int]:
+        """(jumlah IPK, banyak baris yang memiliki IPK) memakai validity bitmap."""
+        total = 0.0
+        count = 0
+        ipk = self._ipk
+        for byte_index, byte in enumerate(self._ipk_valid):
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    total += ipk[base + bit]
+                    count += 1
+        return total, count
+
+
+# Field yang disimpan dalam kolom tabel; field lain masuk _extra
+_FIELD_TABEL = frozenset(
+    MahasiswaTable.KOLOM_STRING + MahasiswaTable.KOLOM_KODE
+    + ("tahun_masuk", "ipk", "program_orientasi", "versi")
+)
@@ -0,0 +1,193 @@
+"""
+Module untuk sinkronisasi antar thread dan antar process pada manager
+yang dipakai bersama.
+
+Satu CRUDManager / AuthManager dipakai oleh semua session Streamlit dalam
+satu process (lihat st.cache_resource di app.py), dan beberapa worker
+process bisa memakai file JSON yang sama:
+- ReadWriteLock: banyak pembaca berjalan bersamaan, penulis eksklusif;
+  penulis pertama (terluar) juga memegang file lock fcntl.flock
+- tulis_file_atomik: file ditulis ke file sementara lalu os.replace,
+  sehingga pembaca (process mana pun) tidak pernah melihat file setengah jadi
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+import functools
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, Optional, TypeVar, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: tidak ada flock, hanya lock antar thread
+    fcntl = None
+
+F = TypeVar("F", bound=Callable)
+
+
+@contextmanager
+def kunci_file(path: str) -> Iterator[None]:
+    """
+    File lock eksklusif antar process (fcntl.flock) pada file path.
+    Tanpa fcntl (Windows) blok dijalankan tanpa lock antar process.
+
+    Lock dipasang pada file terpisah (misal "data.json.lock") karena file
+    data diganti dengan os.replace dan lock pada inode lama tidak berlaku.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def tulis_file_atomik(path: str, isi: Union[str, bytes]) -> None:
+    """
+    Tulis isi ke path secara atomik: file sementara di folder yang sama
+    lalu os.replace. Jika penulisan gagal, file lama tidak berubah.
+    isi bertipe str ditulis sebagai teks UTF-8, bytes ditulis apa adanya.
+
+    Raises:
+        IOError: Jika file tidak bisa ditulis
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if isinstance(isi, bytes):
+            with open(temp_path, "wb") as f:
+                f.write(isi)
+        else:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(isi)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class ReadWriteLock:
+    """
+    Reader-writer lock dengan prioritas penulis.
+
+    - baca(): boleh dipegang banyak thread sekaligus
+    - tulis(): eksklusif; pembaca baru menunggu jika ada penulis yang antre
+      sehingga penulis tidak kelaparan
+    - Reentrant: penulis boleh memanggil tulis()/baca() lagi, pembaca boleh
+      memanggil baca() lagi. Naik dari baca() ke tulis() tidak didukung
+      (RuntimeError), karena dua pembaca yang naik bersamaan akan deadlock
+    - Jika lock_path diisi, tulis() terluar juga memegang kunci_file(lock_path)
+      sehingga penulis di process lain ikut menunggu
+    """
+
+    def __init__(self, lock_path: Optional[str] = None):
+        """
+        Args:
+            lock_path: File untuk fcntl.flock antar process (None = hanya thread)
+        """
+        self.lock_path = lock_path
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    def _read_depth(self) -> int:
+        return getattr(self._local, "depth", 0)
+
+    @contextmanager
+    def baca(self) -> Iterator[None]:
+        """Lock bersama untuk membaca state in-memory."""
+        me = threading.get_ident()
+        depth = self._read_depth()
+        with self._cond:
+            if self._writer != me and depth == 0:
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if self._writer != me and depth == 0:
+                with self._cond:
+                    self._readers -= 1
+                    if self._readers == 0:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def tulis(self) -> Iterator[None]:
+        """Lock eksklusif untuk mengubah state (dan file, jika lock_path diisi)."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                if self._read_depth():
+                    raise RuntimeError("Lock baca tidak bisa dinaikkan menjadi lock tulis")
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._writers_waiting -= 1
+                self._writer = me
+                self._writer_depth = 1
+            outermost = self._writer_depth == 1
+        try:
+            with kunci_file(self.lock_path) if outermost and self.lock_path else nullcontext():
+                yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+def dengan_lock(method: F) -> F:
+    """
+    Decorator: jalankan method sambil memegang self._lock.
+
+    Lock harus reentrant (threading.RLock) karena method terkunci boleh
+    memanggil method terkunci lain pada object yang sama.
+
+    Contoh:
+        class Manager:
+            def __init__(self):
+                self._lock = threading.RLock()
+
+            @dengan_lock
+            def simpan(self, data):
+                ...
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def dengan_lock_baca(method: F) -> F:
+    """Decorator: jalankan method sambil memegang self._rwlock.baca()."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._rwlock.baca():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def dengan_lock_tulis(method: F) -> F:
+    """Decorator: jalankan method sambil memegang self._rwlock.tulis()."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._rwlock.tulis():
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,218 @@
+"""
+Module untuk Sort Cache - menyimpan permutasi hasil sorting.
+Sorting ulang atas data yang sama cukup menerapkan permutasi O(n).
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from sinkronisasi import dengan_lock
+
+
+class SortCache:
+    """
+    Cache LRU berbatas memori untuk permutasi hasil sorting.
+
+    Kunci cache: (algoritma, key, ascending, dataset_version). Yang disimpan
+    hanya permutasi index (array 'q', 8 byte per record), bukan salinan
+    data, sehingga ukuran entry mudah dihitung untuk eviction.
+
+    Reuse lintas algoritma (hanya untuk permintaan algoritma stabil):
+    - Hasil algoritma stabil lain dengan key & urutan sama identik
+    - Hasil stabil urutan sebaliknya dibalik, lalu setiap kelompok nilai
+      sama dibalik lagi agar tetap stabil (sama seperti Merge Sort descending)
+
+    ===== ANALISIS SORT CACHE =====
+    - Lookup: O(1) untuk hit langsung, O(jumlah entry) untuk reuse stabil
+    - Menerapkan permutasi: O(n), tanpa perbandingan
+    - Space: O(n) per permutasi berbeda, total dibatasi max_bytes (entry hasil
+      reuse stabil memakai array yang sama dan tidak dihitung dua kali)
+
+    Thread-safe: satu cache bisa dipakai bersama oleh semua session.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, id_key: str = "nim"):
+        """
+        Inisialisasi cache kosong.
+
+        Args:
+            max_bytes: Batas total ukuran permutasi yang disimpan
+            id_key: Atribut unik record untuk memetakan hasil ke index data
+        """
+        self.max_bytes = max_bytes
+        self.id_key = id_key
+        self._entries: "OrderedDict[Tuple, Tuple[array, bool, Any]]" = OrderedDict()
+        # Jumlah entry per permutasi (id array); byte dihitung sekali per array
+        self._refs: Dict[int, int] = {}
+        self._bytes = 0
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total ukuran permutasi yang tersimpan."""
+        return self._bytes
+
+    def _sync_version(self, dataset_version: int) -> None:
+        """Buang semua entry jika dataset berubah (entry lama tidak akan hit lagi)."""
+        if dataset_version != self._version:
+            self._entries.clear()
+            self._refs.clear()
+            self._bytes = 0
+            self._version = dataset_version
+
+    def _tambah_ref(self, permutation: array) -> None:
+        """Catat satu entry baru untuk permutasi; byte ditambah jika array belum tersimpan."""
+        refs = self._refs.get(id(permutation), 0)
+        if refs == 0:
+            self._bytes += permutation.itemsize * len(permutation)
+        self._refs[id(permutation)] = refs + 1
+
+    def _lepas_ref(self, permutation: array) -> None:
+        """Lepas satu entry permutasi; byte dikurangi jika tidak ada entry lain yang memakainya."""
+        refs = self._refs.pop(id(permutation)) - 1
+        if refs:
+            self._refs[id(permutation)] = refs
+        else:
+            self._bytes -= permutation.itemsize * len(permutation)
+
+    @dengan_lock
+    def get(
+        self,
+        algoritma: str,
+        key: str,
+        ascending: bool,
+        dataset_version: int,
+        data: List[Dict],
+        stable: bool = True
+    ) -> Optional[Tuple[List[Dict], Dict]]:
+        """
+        Ambil hasil sorting dari cache.
+
+        Args:
+            algoritma: Nama algoritma (misal "merge_sort")
+            key: Atribut sorting
+            ascending: Arah urutan
+            dataset_version: Versi dataset dari CRUDManager
+            data: Data yang sama dengan saat hasil disimpan
+            stable: True jika algoritma yang diminta stabil
+
+        Returns:
+            (sorted_data, info) atau None jika miss. info berisi "sumber"
+            ("langsung", "stabil" atau "dibalik") dan "metric" yang disimpan
+            (hanya untuk hit langsung, selain itu None)
+        """
+        self._sync_version(dataset_version)
+
+        exact = (algoritma, key, ascending)
+        if exact in self._entries:
+            self._entries.move_to_end(exact)
+            permutation, _, metric = self._entries[exact]
+            self.hits += 1
+            return self._apply(data, permutation), {"sumber": "langsung", "metric": metric}
+
+        if stable:
+            for sumber, order in (("stabil", ascending), ("dibalik", not ascending)):
+                for cache_key, (permutation, entry_stable, _) in self._entries.items():
+                    if not entry_stable or cache_key[1:] != (key, order):
+                        continue
+                    self._entries.move_to_end(cache_key)
+                    if sumber == "dibalik":
+                        permutation = self._reverse_stable(data, permutation, key)
+                    self.put(algoritma, key, ascending, dataset_version,
+                             permutation, stable)
+                    self.hits += 1
+                    return self._apply(data, permutation), {"sumber": sumber, "metric": None}
+
+        self.misses += 1
+        return None
+
+    @dengan_lock
+    def put(
+        self,
+        algoritma: str,
+        key: str,
+        ascending: bool,
+        dataset_version: int,
+        permutation: array,
+        stable: bool = True,
+        metric: Any = None
+    ) -> None:
+        """
+        Simpan permutasi hasil sorting, lalu evict entry paling lama
+        dipakai sampai total ukuran <= max_bytes.
+
+        Args:
+            permutation: array('q') index data dalam urutan hasil
+            stable: True jika algoritma stabil (boleh dipakai ulang lintas algoritma)
+            metric: Jumlah perbandingan / metric bucket saat hasil dihitung
+        """
+        self._sync_version(dataset_version)
+        size = permutation.itemsize * len(permutation)
+        if size > self.max_bytes:
+            return
+
+        cache_key = (algoritma, key, ascending)
+        # Tambah dulu baru lepas: jika array yang sama disimpan ulang, bytenya tetap
+        self._tambah_ref(permutation)
+        if cache_key in self._entries:
+            self._lepas_ref(self._entries.pop(cache_key)[0])
+        self._entries[cache_key] = (permutation, stable, metric)
+
+        while self._bytes > self.max_bytes:
+            _, (evicted, _, _) = self._entries.popitem(last=False)
+            self._lepas_ref(evicted)
+
+    def put_result(
+        self,
+        algoritma: str,
+        key: str,
+        ascending: bool,
+        dataset_version: int,
+        data: List[Dict],
+        sorted_data: List[Dict],
+        stable: bool = True,
+        metric: Any = None
+    ) -> None:
+        """
+        Simpan hasil sorting (list record terurut) sebagai permutasi.
+        Record dipetakan ke index data melalui id_key yang unik.
+        """
+        index_by_id = {item[self.id_key]: i for i, item in enumerate(data)}
+        permutation = array('q', (index_by_id[item[self.id_key]] for item in sorted_data))
+        self.put(algoritma, key, ascending, dataset_version, permutation, stable, metric)
+
+    @staticmethod
+    def _apply(data: List[Dict], permutation: array) -> List[Dict]:
+        """Terapkan permutasi ke data. O(n)."""
+        return [data[i] for i in permutation]
+
+    @staticmethod
+    def _reverse_stable(data: List[Dict], permutation: array, key: str) -> array:
+        """
+        Balik permutasi stabil ke arah sebaliknya dengan tetap stabil:
+        urutan dibalik, lalu setiap kelompok nilai sama dibalik kembali
+        sehingga record bernilai sama tetap mengikuti urutan data. O(n).
+        """
+        reversed_perm = array('q', reversed(permutation))
+        n = len(reversed_perm)
+        start = 0
+        while start < n:
+            value = data[reversed_perm[start]][key]
+            end = start + 1
+            while end < n and data[reversed_perm[end]][key] == value:
+                end += 1
+            if end - start > 1:
+                reversed_perm[start:end] = array('q', reversed(reversed_perm[start:end]))
+            start = end
+        return reversed_perm
@@ -0,0 +1,176 @@
+"""
+Module untuk Sorted View - urutan data yang dipelihara secara incremental.
+Struktur data: list of chunks terurut (mirip B-tree satu level / sortedcontainers).
+
+Developer: Ahmad Rasyid - Teknik Informatika
+Date: 2025-12-15
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+class SortedView:
+    """
+    Materialized sorted view untuk satu kolom data mahasiswa.
+
+    Setiap entry adalah tuple (nilai_kunci, seq, record). seq adalah nomor
+    urut record dalam dataset sehingga entry selalu unik dan nilai yang sama
+    diurutkan sesuai urutan data (stabil, sama seperti Merge Sort).
+
+    ===== ANALISIS SORTED VIEW =====
+    - Build: O(n log n) sekali
+    - Insert / Remove: O(log n) pencarian + O(load) geser dalam satu chunk
+    - Baca urutan lengkap: O(n), satu halaman: O(offset + limit)
+
+    Data disimpan dalam beberapa chunk berukuran maksimal 2 * load. Chunk
+    yang terlalu besar dipecah dua, chunk kosong dihapus.
+    """
+
+    def __init__(self, key: str, load: int = 500):
+        """
+        Inisialisasi sorted view kosong.
+
+        Args:
+            key: Atribut record yang menjadi kunci urutan
+            load: Ukuran target setiap chunk
+        """
+        self.key = key
+        self._load = load
+        self._chunks: List[List[Tuple[Any, int, Dict]]] = []
+        self._maxes: List[Tuple[Any, int]] = []
+        self._len = 0
+
+    def build(self, records: Iterable[Tuple[int, Dict]]) -> None:
+        """
+        Bangun ulang view dari awal.
+
+        Args:
+            records: Iterable (seq, record)
+        """
+        entries = sorted(
+            ((record[self.key], seq, record) for seq, record in records),
+            key=lambda entry: (entry[0], entry[1])
+        )
+        self._chunks = [
+            entries[i:i + self._load] for i in range(0, len(entries), self._load)
+        ]
+        self._maxes = [(chunk[-1][0], chunk[-1][1]) for chunk in self._chunks]
+        self._len = len(entries)
+
+    def insert(self, seq: int, record: Dict) -> None:
+        """Tambahkan record ke posisi terurutnya. O(log n)."""
+        value = record[self.key]
+        entry = (value, seq, record)
+        self._len += 1
+
+        if not self._chunks:
+            self._chunks.append([entry])
+            self._maxes.append((value, seq))
+            return
+
+        pos = bisect_left(self._maxes, (value, seq))
+        if pos == len(self._maxes):
+            # Lebih besar dari semua entry: masuk ke chunk terakhir
+            pos -= 1
+            self._chunks[pos].append(entry)
+            self._maxes[pos] = (value, seq)
+        else:
+            insort(self._chunks[pos], entry, key=lambda e: (e[0], e[1]))
+
+        self._split(pos)
+
+    def remove(self, seq: int, record: Dict) -> None:
+        """
+        Hapus entry record dari view. O(log n).
+
+        Raises:
+            KeyError: Jika entry tidak ada di view
+        """
+        target = (record[self.key], seq)
+        pos = bisect_left(self._maxes, target)
+        if pos < len(self._chunks):
+            chunk = self._chunks[pos]
+            idx = bisect_left(chunk, target, key=lambda e: (e[0], e[1]))
+            if idx < len(chunk) and (chunk[idx][0], chunk[idx][1]) == target:
+                del chunk[idx]
+                self._len -= 1
+                if not chunk:
+                    del self._chunks[pos]
+                    del self._maxes[pos]
+                elif idx == len(chunk):
+                    self._maxes[pos] = (chunk[-1][0], chunk[-1][1])
+                return
+        raise KeyError(f"Entry {target} tidak ada di sorted view '{self.key}'")
+
+    def _split(self, pos: int) -> None:
+        """Pecah chunk yang melebihi 2 * load menjadi dua."""
+        chunk = self._chunks[pos]
+        if len(chunk) > 2 * self._load:
+            half = chunk[self._load:]
+            del chunk[self._load:]
+            self._chunks.insert(pos + 1, half)
+            self._maxes[pos] = (chunk[-1][0], chunk[-1][1])
+            self._maxes.insert(pos + 1, (half[-1][0], half[-1][1]))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def iter_records(self, ascending: bool = True) -> Iterator[Dict]:
+        """
+        Iterasi record sesuai urutan. O(n) untuk seluruh data.
+
+        Untuk descending, nilai yang sama tetap mengikuti urutan data
+        (stabil), sama seperti hasil Merge Sort descending.
+        """
+        if ascending:
+            for chunk in self._chunks:
+                for entry in chunk:
+                    yield entry[2]
+            return
+
+        group: List[Dict] = []
+        group_value = None
+        for chunk in reversed(self._chunks):
+            for entry in reversed(chunk):
+                if group and entry[0] != group_value:
+                    yield from reversed(group)
+                    group = []
+                group_value = entry[0]
+                group.append(entry[2])
+        yield from reversed(group)
+
+    def page(self, offset: int = 0, limit: int = None, ascending: bool = True) -> List[Dict]:
+        """
+        Ambil satu halaman hasil urutan tanpa menyalin seluruh data.
+
+        Args:
+            offset: Jumlah record yang dilewati
+            limit: Jumlah record maksimal (None = sampai akhir)
+            ascending: Arah urutan
+
+        Returns:
+            List record pada halaman tersebut
+        """
+        if ascending and offset > 0:
+            # Lompat langsung ke chunk yang memuat offset
+            result: List[Dict] = []
+            for chunk in self._chunks:
+                if offset >= len(chunk):
+                    offset -= len(chunk)
+                    continue
+                for entry in chunk[offset:]:
+                    if limit is not None and len(result) >= limit:
+                        return result
+                    result.append(entry[2])
+                offset = 0
+            return result
+
+        result = []
+        for index, record in enumerate(self.iter_records(ascending)):
+            if index < offset:
+                continue
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(record)
+        return result
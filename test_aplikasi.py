@@ -5,10 +5,46 @@ Bisa dijalankan untuk verifikasi bahwa semua modul berfungsi dengan baik.
 Developer: Ahmad Rasyid - Teknik Informatika
 """
 
-from mahasiswa import Mahasiswa, MahasiswaBaru, MahasiswaLama
+import io
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+import pandas as pd
+
+from mahasiswa import (
+    Mahasiswa, MahasiswaBaru, MahasiswaLama, MahasiswaView, MahasiswaTable, MahasiswaProxy
+)
 from algoritma_sorting import AlgoritmaSorting
 from algoritma_searching import AlgoritmaSearching
 from crud_manager import CRUDManager
+from auth_manager import AuthManager
+import validasi
+import aset
+from algoritma_vectorized import AlgoritmaVectorized
+from sort_cache import SortCache
+from dataframe_cache import DataFrameCache
+from instrumentasi import is_instrumented, mode_instrumentasi
+from sinkronisasi import ReadWriteLock
+
+
+@contextmanager
+def _temp_json_path() -> Iterator[str]:
+    """Path file JSON sementara yang belum ada; file dan {path}.lock dihapus sesudahnya."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    os.remove(path)
+    try:
+        yield path
+    finally:
+        for leftover in (path, f"{path}.lock"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
 
 
 def test_oop_encapsulation():
@@ -140,6 +176,978 @@ def test_crud_operations():
     print("\n✅ CRUD test PASSED\n")
 
 
+def test_sorted_views():
+    """Test Sorted View yang dipelihara incremental oleh CRUDManager."""
+    print("=" * 60)
+    print("TEST 17: Incremental Sorted Views")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path)
+        crud.register_sorted_view("nama")
+        crud.register_sorted_view("jurusan")
+        
+        crud.create_mahasiswa("Citra Dewi", "30000000", "Teknik Sipil", "citra@domain.com", 2022)
+        crud.create_mahasiswa("Andi Saputra", "10000000", "Teknik Elektro", "andi@domain.com", 2023)
+        crud.create_mahasiswa("Budi Santoso", "20000000", "Akuntansi", "budi@domain.com", 2024)
+        version = crud.get_dataset_version()
+        
+        # Update yang mengubah kunci urut harus memindahkan posisi di view
+        crud.update_mahasiswa("10000000", nama="Zaki Saputra")
+        crud.delete_mahasiswa("30000000")
+        assert crud.get_dataset_version() > version
+        
+        data = crud.read_all_mahasiswa()
+        for key in ("nama", "jurusan"):
+            for ascending in (True, False):
+                expected, _ = AlgoritmaSorting.merge_sort(data, key, ascending)
+                assert crud.get_sorted(key, ascending) == expected
+        
+        names = [m["nama"] for m in crud.get_sorted("nama")]
+        print(f"\n✓ View nama: {names}")
+        assert names == ["Budi Santoso", "Zaki Saputra"]
+        assert crud.get_sorted("nama", offset=1, limit=1)[0]["nama"] == "Zaki Saputra"
+    
+    print("\n✅ Sorted Views test PASSED\n")
+
+
+def test_vectorized_engine():
+    """Test engine vectorized menghasilkan output yang sama dengan versi edukasi."""
+    print("=" * 60)
+    print("TEST 18: Vectorized Engine (NumPy/Pandas)")
+    print("=" * 60)
+    
+    jurusan = ["Teknik Sipil", "Akuntansi", "Teknik Informatika"]
+    test_data = [
+        {"nama": f"Mhs {(i * 37) % 50:02d}", "nim": f"{10000000 + (i * 7919) % 200}",
+         "jurusan": jurusan[i % 3], "email": f"mhs{i}@Domain.com",
+         "tahun_masuk": 2020 + i % 5, "status": "aktif"}
+        for i in range(200)
+    ]
+    engine = AlgoritmaVectorized(test_data)
+    
+    for key in ("nama", "nim", "jurusan", "tahun_masuk"):
+        for ascending in (True, False):
+            expected, _ = AlgoritmaSorting.merge_sort(test_data, key, ascending)
+            assert engine.sort(key, ascending) == expected
+    print("\n✓ Sort identik dengan Merge Sort (stabil, asc/desc)")
+    
+    for value in (test_data[150]["nim"], "99999999"):
+        expected, _ = AlgoritmaSearching.linear_search_exact(test_data, "nim", value)
+        assert engine.search_exact("nim", value) == expected
+    for value in ("MHS15@", "tidak-ada"):
+        expected, _ = AlgoritmaSearching.linear_search(test_data, "email", value)
+        assert engine.search_substring("email", value) == expected
+    print("✓ Exact & substring search identik dengan Linear Search")
+    
+    print("\n✅ Vectorized Engine test PASSED\n")
+
+
+def test_sort_cache():
+    """Test cache permutasi hasil sorting."""
+    print("=" * 60)
+    print("TEST 19: Sort Cache")
+    print("=" * 60)
+    
+    test_data = [
+        {"nama": f"Mhs {i:03d}", "nim": f"{10000000 + i}",
+         "jurusan": ["TI", "SI", "TE"][(i * 7) % 3]}
+        for i in range(60)
+    ]
+    cache = SortCache()
+    
+    assert cache.get("merge_sort", "jurusan", True, 1, test_data) is None
+    result, comparisons = AlgoritmaSorting.merge_sort(test_data, "jurusan", True)
+    cache.put_result("merge_sort", "jurusan", True, 1, test_data, result,
+                     metric=comparisons)
+    
+    cached, info = cache.get("merge_sort", "jurusan", True, 1, test_data)
+    assert cached == result and info == {"sumber": "langsung", "metric": comparisons}
+    
+    # Algoritma stabil lain memakai hasil yang sama
+    cached, info = cache.get("counting_sort", "jurusan", True, 1, test_data)
+    assert cached == result and info["sumber"] == "stabil"
+    # Entry reuse memakai permutasi yang sama: byte tidak dihitung dua kali
+    assert len(cache) == 2 and cache.size_bytes == 8 * len(test_data)
+    
+    # Urutan sebaliknya: dibalik per kelompok, tetap stabil
+    expected, _ = AlgoritmaSorting.merge_sort(test_data, "jurusan", False)
+    cached, info = cache.get("merge_sort", "jurusan", False, 1, test_data)
+    assert cached == expected and info["sumber"] == "dibalik"
+    print(f"\n✓ Hit langsung, reuse stabil & dibalik: {cache.hits} hit")
+    
+    # Algoritma tidak stabil hanya boleh hit langsung
+    assert cache.get("shell_sort", "jurusan", True, 1, test_data, stable=False) is None
+    
+    # Dataset berubah: cache versi lama dibuang
+    assert cache.get("merge_sort", "jurusan", True, 2, test_data) is None
+    assert len(cache) == 0
+    
+    # Eviction berdasarkan memori (60 record * 8 byte = 480 byte per entry)
+    small = SortCache(max_bytes=1000)
+    for key in ("nama", "nim", "jurusan"):
+        result, _ = AlgoritmaSorting.merge_sort(test_data, key, True)
+        small.put_result("merge_sort", key, True, 1, test_data, result)
+    assert len(small) == 2 and small.size_bytes <= 1000
+    assert small.get("merge_sort", "nama", True, 1, test_data) is None
+    print(f"✓ Eviction LRU: {len(small)} entry, {small.size_bytes} byte")
+    
+    print("\n✅ Sort Cache test PASSED\n")
+
+
+def test_instrumentation_toggle():
+    """Test mode produksi (tanpa counter) menghasilkan urutan yang sama."""
+    print("=" * 60)
+    print("TEST 20: Instrumentation Toggle")
+    print("=" * 60)
+    
+    test_data = [
+        {"nama": f"Mhs {(i * 13) % 20:02d}", "nim": f"{10000000 + (i * 7919) % 100}",
+         "jurusan": ["TI", "SI", "TE"][i % 3], "ipk": round(2 + (i * 7 % 20) / 10, 1)}
+        for i in range(100)
+    ]
+    sorting = AlgoritmaSorting()
+    
+    for ascending in (True, False):
+        expected, comparisons = sorting.merge_sort(test_data, "nama", ascending)
+        assert comparisons > 0
+        with mode_instrumentasi(False):
+            assert not is_instrumented()
+            for sort in (sorting.bubble_sort, sorting.merge_sort, sorting.parallel_merge_sort):
+                result, comparisons = sort(test_data, "nama", ascending)
+                assert result == expected and comparisons is None
+            result, comparisons = sorting.shell_sort(test_data, "nama", ascending, "ciura")
+            assert [m["nama"] for m in result] == [m["nama"] for m in expected]
+            assert comparisons is None
+        assert is_instrumented()
+    print("\n✓ Sorting mode produksi: urutan sama, perbandingan = None")
+    
+    for group_by in (None, "jurusan"):
+        expected, _ = sorting.top_k(test_data, "ipk", 5, False, group_by)
+        with mode_instrumentasi(False):
+            assert sorting.top_k(test_data, "ipk", 5, False, group_by) == (expected, None)
+    
+    sorted_data, _ = sorting.merge_sort(test_data, "nim", True)
+    target = test_data[42]["nim"]
+    expected_linear = AlgoritmaSearching.linear_search(test_data, "nama", "mhs 07")[0]
+    expected_exact = AlgoritmaSearching.linear_search_exact(test_data, "nim", target)[0]
+    with mode_instrumentasi(False):
+        assert AlgoritmaSearching.linear_search(test_data, "nama", "mhs 07") == (expected_linear, None)
+        assert AlgoritmaSearching.linear_search_exact(test_data, "nim", target) == (expected_exact, None)
+        index, comparisons = AlgoritmaSearching.binary_search(sorted_data, "nim", target)
+        assert sorted_data[index]["nim"] == target and comparisons is None
+        assert AlgoritmaSearching.binary_search(sorted_data, "nim", "1") == (None, None)
+    print("✓ Top-K & searching mode produksi: hasil sama, perbandingan = None")
+    
+    print("\n✅ Instrumentation Toggle test PASSED\n")
+
+
+def test_mahasiswa_slots_view():
+    """Test model __slots__ dan view read-only."""
+    print("=" * 60)
+    print("TEST 21: __slots__ Model & Read-only View")
+    print("=" * 60)
+    
+    ml = MahasiswaLama("Citra Dewi", "11223344", "Teknik Sipil",
+                       "citra@domain.com", 2022, ipk=3.85)
+    mb = MahasiswaBaru("Ani Wijaya", "87654321", "Teknik Elektro", "ani@domain.com", 2025)
+    
+    for m in (ml, mb, Mahasiswa("Budi", "12345678", "IF", "budi@domain.com")):
+        assert not hasattr(m, "__dict__")
+        view = m.view()
+        assert isinstance(view, MahasiswaView) and dict(view) == m.info()
+    print("\n✓ Tanpa __dict__, view() == info() untuk semua subclass")
+    
+    view = ml.view()
+    ml.nama = "Citra Lestari"
+    assert view["nama"] == "Citra Lestari"
+    try:
+        view["nama"] = "X"
+        assert False, "View harus read-only"
+    except TypeError:
+        print("✓ View zero-copy mengikuti object dan read-only")
+    try:
+        ml.alamat = "Jakarta"
+        assert False, "Atribut baru seharusnya ditolak"
+    except AttributeError:
+        print("✓ Atribut di luar __slots__ ditolak")
+    
+    # View bisa langsung dipakai algoritma yang membaca dict
+    result, _ = AlgoritmaSorting.merge_sort([ml.view(), mb.view()], "nama", True)
+    assert [m["nama"] for m in result] == ["Ani Wijaya", "Citra Lestari"]
+    
+    print("\n✅ __slots__ Model test PASSED\n")
+
+
+def test_mahasiswa_table():
+    """Test container kolumnar MahasiswaTable."""
+    print("=" * 60)
+    print("TEST 22: Columnar MahasiswaTable")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path)
+        crud.create_mahasiswa("Citra Dewi", "30000000", "Teknik Sipil", "citra@domain.com",
+                              2022, kategori="lama", ipk=3.85)
+        crud.create_mahasiswa("Andi Saputra", "10000000", "Teknik Elektro", "andi@domain.com",
+                              2025, kategori="baru")
+        crud.create_mahasiswa("Budi Santoso", "20000000", "Teknik Sipil", "budi@domain.com",
+                              2024, status="cuti")
+        data = crud.read_all_mahasiswa()
+        
+        table = crud.get_table()
+        assert len(table) == 3 and table.to_records() == data
+        assert crud.get_table() is table
+        print(f"\n✓ Round-trip {len(table)} record, kode jurusan: {table.codes('jurusan')[1]}")
+        
+        # Baris diwujudkan menjadi subclass yang sesuai
+        assert isinstance(table[0], MahasiswaLama) and table[0].get_keterangan_ipk() == "Cumlaude"
+        assert isinstance(table[1], MahasiswaBaru) and type(table[2]) is Mahasiswa
+        assert table.value("ipk", 2) is None and not table.ipk_valid(2)
+        
+        assert crud.get_statistik(table) == crud.get_statistik()
+        assert table.value_counts("jurusan") == {"Teknik Sipil": 2, "Teknik Elektro": 1}
+        print(f"✓ Statistik dari kolom: {crud.get_statistik(table)['total_per_jurusan']}")
+        
+        for key in ("nama", "tahun_masuk", "jurusan"):
+            for ascending in (True, False):
+                assert AlgoritmaSorting.merge_sort(table, key, ascending) == \
+                    AlgoritmaSorting.merge_sort(data, key, ascending)
+        assert AlgoritmaSorting.counting_sort(table, "jurusan")[0] == \
+            AlgoritmaSorting.counting_sort(data, "jurusan")[0]
+        assert AlgoritmaSorting.is_low_cardinality(table, "status")
+        print("✓ Sorting langsung atas tabel sama dengan sorting list dict")
+        
+        crud.delete_mahasiswa("20000000")
+        assert len(crud.get_table()) == 2
+        
+        # Record lama tanpa status/tahun_masuk/tanggal_dibuat dan IPK presisi
+        # penuh kembali persis seperti aslinya
+        legacy = [
+            {"nama": "Dedi Lama", "nim": "40000000", "jurusan": "Teknik Sipil",
+             "email": "dedi@domain.com", "ipk": 3.14159},
+            {"nama": "Eka Lama", "nim": "50000000", "jurusan": "Teknik Sipil",
+             "email": "eka@domain.com", "status": "aktif", "tahun_masuk": 2020},
+        ]
+        table = MahasiswaTable.from_records(legacy)
+        assert table.to_records() == legacy
+        assert table.value("tahun_masuk", 0) is None and table.value("ipk", 0) == 3.14159
+        statistik = CRUDManager._statistik_tabel(table)
+        assert statistik["total_per_status"] == {"Unknown": 1, "aktif": 1}
+        print(f"✓ Record tanpa field opsional lossless: {statistik['total_per_status']}")
+        
+        # File berisi record tanpa jurusan: statistik tetap dihitung ("Unknown")
+        tanpa_jurusan = {"nama": "Fajar Lama", "nim": "60000000", "email": "fajar@domain.com"}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([tanpa_jurusan], f)
+        statistik = CRUDManager(path).get_statistik()
+        assert statistik["total_mahasiswa"] == 1
+        assert statistik["total_per_jurusan"] == {"Unknown": 1}
+        assert MahasiswaTable.from_records([tanpa_jurusan]).to_records() == [tanpa_jurusan]
+        print(f"✓ Record tanpa jurusan: {statistik['total_per_jurusan']}")
+    
+    print("\n✅ MahasiswaTable test PASSED\n")
+
+
+def test_dictionary_encoding():
+    """Test interning & code table untuk kolom yang nilainya berulang."""
+    print("=" * 60)
+    print("TEST 23: Dictionary Encoding")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        jurusan_list = ["Teknik Informatika", "Sistem Informasi"]
+        records = [
+            {"nama": f"Mahasiswa {i}", "nim": f"{10000000 + i}",
+             "jurusan": jurusan_list[i % 2], "email": f"mhs{i}@kampus.ac.id",
+             "tahun_masuk": 2022, "status": "aktif" if i % 3 else "cuti",
+             "tanggal_dibuat": "2025-12-15 00:00:00"}
+            for i in range(30)
+        ]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(records, f)
+        
+        # File list biasa dibaca, nilai berulang memakai objek string yang sama
+        crud = CRUDManager(path, encode_on_disk=True)
+        data = crud.read_all_mahasiswa()
+        assert data == records
+        assert data[0]["jurusan"] is data[2]["jurusan"]
+        report = crud.get_encoding_report()
+        assert report["per_kolom"]["jurusan"]["unik"] == 2 and report["byte_dihemat"] > 0
+        assert crud.get_encoding_report() is report  # di-cache per dataset version
+        print(f"\n✓ Interning: {report['byte_dihemat']} byte dihemat")
+        
+        # Simpan ulang dalam format code table
+        crud.create_mahasiswa("Budi Santoso", "20000000", "Sistem Informasi",
+                              "budi@kampus.ac.id", 2024)
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        assert payload["format"] == CRUDManager.FORMAT_KODE
+        assert payload["kode"]["jurusan"] == jurusan_list
+        assert payload["kode"]["email_domain"] == ["kampus.ac.id"]
+        assert payload["records"][-1]["email"] == ["budi", 0]
+        ulang = crud.get_encoding_report()
+        assert ulang is not report and ulang["per_kolom"]["jurusan"]["nilai"] == 31
+        
+        reloaded = CRUDManager(path).read_all_mahasiswa()
+        assert reloaded == crud.read_all_mahasiswa()
+        print(f"✓ Code table di disk: {payload['kode']['status']}")
+        
+        # Filter membandingkan kode, hasil sama dengan filter string
+        result = crud.filter_mahasiswa(jurusan=["Sistem Informasi"], status=["cuti"])
+        expected = [m for m in reloaded
+                    if m["jurusan"] == "Sistem Informasi" and m["status"] == "cuti"]
+        assert result == expected and len(result) == 5
+        assert crud.filter_mahasiswa() == reloaded
+        print(f"✓ Filter berbasis kode: {len(result)} mahasiswa")
+    
+    print("\n✅ Dictionary Encoding test PASSED\n")
+
+
+def test_lazy_hydration():
+    """Test proxy lazy: object model hanya dibuat saat perilakunya dipakai."""
+    print("=" * 60)
+    print("TEST 24: Lazy Hydration")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path)
+        total_awal = Mahasiswa.total_mahasiswa
+        crud.create_mahasiswa("Citra Dewi", "30000000", "Teknik Sipil", "citra@domain.com",
+                              2022, kategori="lama", ipk=3.2)
+        crud.create_mahasiswa("Andi Saputra", "10000000", "Teknik Elektro", "andi@domain.com",
+                              2025, kategori="baru")
+        # create_mahasiswa tidak lagi membuat object model
+        assert Mahasiswa.total_mahasiswa == total_awal
+        
+        proxies = list(crud.iter_mahasiswa())
+        names = [p.nama for p in proxies]
+        assert names == ["Citra Dewi", "Andi Saputra"]
+        assert all(not p.is_hydrated for p in proxies)
+        assert dict(proxies[0]) == crud.read_all_mahasiswa()[0]
+        print(f"\n✓ Listing {len(proxies)} proxy tanpa object model: {names}")
+        
+        lama = crud.get_mahasiswa("30000000")
+        assert isinstance(lama, MahasiswaProxy)
+        assert lama["keterangan_ipk"] == "Sangat Memuaskan" and not lama.is_hydrated
+        assert lama.get_keterangan_ipk() == "Sangat Memuaskan" and lama.is_hydrated
+        assert isinstance(lama.hydrate(), MahasiswaLama)
+        assert lama.hydrate().tanggal_dibuat == lama["tanggal_dibuat"]
+        assert "Program Orientasi" in crud.get_mahasiswa("10000000").info_display()
+        assert crud.get_mahasiswa("99999999") is None
+        print("✓ Hydration saat get_keterangan_ipk() / info_display() dipanggil")
+    
+    print("\n✅ Lazy Hydration test PASSED\n")
+
+
+def test_batch_factory():
+    """Test Mahasiswa.from_records: dispatch subclass, satu timestamp, validasi batch."""
+    print("=" * 60)
+    print("TEST 25: Batch Factory from_records")
+    print("=" * 60)
+    
+    records = [
+        MahasiswaLama.new_record("Citra Dewi", "30000000", "Teknik Sipil",
+                                 "citra@domain.com", 2022, 3.6, "aktif", "2025-01-01 08:00:00"),
+        {"nama": "Andi Saputra", "nim": "10000000", "jurusan": "Teknik Elektro",
+         "email": "andi@domain.com", "kategori": "Mahasiswa Baru", "program_orientasi": False},
+        {"nama": "Budi Santoso", "nim": "20000000", "jurusan": "Akuntansi",
+         "email": "budi@domain.com", "tahun_masuk": 2021, "status": "cuti"},
+    ]
+    total_awal = Mahasiswa.total_mahasiswa
+    
+    factory = Mahasiswa.from_records(records, batch_size=2)
+    assert not isinstance(factory, list)
+    objects = list(factory)
+    assert [type(m) for m in objects] == [MahasiswaLama, MahasiswaBaru, Mahasiswa]
+    assert objects[0].get_keterangan_ipk() == "Cumlaude"
+    assert objects[0].tanggal_dibuat == "2025-01-01 08:00:00"
+    assert objects[1].program_orientasi is False
+    assert objects[1].tahun_masuk == datetime.now().year
+    assert objects[2].status == "cuti"
+    assert Mahasiswa.total_mahasiswa == total_awal
+    print(f"\n✓ Dispatch subclass: {[type(m).__name__ for m in objects]}")
+    
+    # Satu timestamp per batch untuk record tanpa tanggal_dibuat
+    tanpa_tanggal = [dict(records[2], nim=str(40000000 + i)) for i in range(100)]
+    stamps = {m.tanggal_dibuat for m in Mahasiswa.from_records(tanpa_tanggal, batch_size=100)}
+    assert len(stamps) == 1
+    print(f"✓ Satu timestamp untuk 100 record: {stamps.pop()}")
+    
+    # Validasi per kolom: error memuat nomor record, batch tidak di-yield
+    invalid = records + [
+        {"nama": " ", "nim": "50000000", "jurusan": "X", "email": "x@domain.com",
+         "status": "drop out"},
+        {"nama": "Eko", "nim": "60000000", "jurusan": "X", "email": "e@domain.com",
+         "tahun_masuk": 1980},
+    ]
+    factory = Mahasiswa.from_records(invalid, batch_size=3)
+    assert len([next(factory) for _ in range(3)]) == 3
+    try:
+        next(factory)
+        assert False, "Record tidak valid harus ditolak"
+    except ValueError as e:
+        pesan = str(e)
+        assert "nama tidak valid pada record 3" in pesan
+        assert "status tidak valid pada record 3" in pesan
+        assert "tahun_masuk tidak valid pada record 4" in pesan
+        assert "email" not in pesan
+        print(f"✓ Validasi batch: {pesan}")
+    
+    # Aturan sama dengan validasi.py / CRUDManager: status tidak peka huruf
+    # besar (seperti setter), NIM harus angka
+    kapital = [dict(records[2], status="Cuti"), dict(records[2], nim="2000000A")]
+    assert CRUDManager.validasi_batch(kapital)["baris_error"] == [1]
+    assert list(Mahasiswa.from_records(kapital[:1]))[0].status == "cuti"
+    try:
+        Mahasiswa.validate_batch(kapital)
+        assert False, "NIM bukan angka harus ditolak"
+    except ValueError as e:
+        assert str(e) == "nim tidak valid pada record 1"
+    
+    # Subclass tertentu: tanpa dispatch kategori
+    assert all(type(m) is MahasiswaLama for m in MahasiswaLama.from_records(records))
+    
+    table = MahasiswaTable.from_records(records)
+    assert [(type(m), m.nim, m.status) for m in table] == \
+        [(type(m), m.nim, m.status) for m in objects]
+    print("✓ MahasiswaTable di-iterasi lewat batch factory")
+    
+    print("\n✅ Batch Factory test PASSED\n")
+
+
+def test_batch_validation():
+    """Test validasi batch per kolom: hasil sama dengan validasi satu per satu."""
+    print("=" * 60)
+    print("TEST 26: Batch Validation")
+    print("=" * 60)
+    
+    nims = ["12345678", "abc12345", "123", " 123456789012 ", None, "1234567890123"]
+    emails = ["budi@domain.com", "invalid@.com", "nodomain.com", " a.b-c@x.co ", 42, "a@b"]
+    masks = validasi.validasi_batch({"nim": nims, "email": emails, "tidak_ada": [0] * 6})
+    assert set(masks) == {"nim", "email"}
+    assert masks["nim"].tolist() == [not CRUDManager.validasi_nim(v) for v in nims]
+    assert masks["email"].tolist() == [not CRUDManager.validasi_email(v) for v in emails]
+    assert masks["nim"].tolist() == [False, True, True, False, True, True]
+    print(f"\n✓ Mask NIM  : {masks['nim'].tolist()}")
+    print(f"✓ Mask email: {masks['email'].tolist()}")
+    
+    try:
+        validasi.validasi_batch({"nim": nims, "email": emails[:2]})
+        assert False, "Panjang kolom berbeda harus ditolak"
+    except ValueError:
+        pass
+    
+    records = [
+        {"nama": "Budi Santoso", "nim": "12345678", "jurusan": "Akuntansi",
+         "email": "budi@domain.com", "status": "aktif"},
+        {"nama": "Al", "nim": "87654321", "jurusan": "Akuntansi",
+         "email": "al@domain.com"},
+        {"nama": "Citra Dewi", "nim": "11223344", "jurusan": " ",
+         "email": "citra@domain.com", "status": "drop out"},
+    ]
+    hasil = CRUDManager.validasi_batch(records)
+    assert hasil["baris_error"] == [1, 2]
+    assert hasil["per_kolom"]["nama"].tolist() == [False, True, False]
+    assert hasil["per_kolom"]["status"].tolist() == [False, False, True]
+    print(f"✓ CRUDManager.validasi_batch baris error: {hasil['baris_error']}")
+    
+    with _temp_json_path() as path:
+        auth = AuthManager(path)
+        ok, _ = auth.register("dewi", "rahasia123", "Dewi Lestari", "dewi@x")
+        assert not ok
+        ok, _ = auth.register("dewi", "rahasia123", "Dewi Lestari", "dewi@kampus.ac.id")
+        assert ok
+        print("✓ AuthManager.register memakai aturan email yang sama")
+    
+    print("\n✅ Batch Validation test PASSED\n")
+
+
+def test_parallel_import():
+    """Test import pipeline: validasi paralel per chunk, error urut, satu commit."""
+    print("=" * 60)
+    print("TEST 27: Parallel Import Pipeline")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path)
+        crud.create_mahasiswa("Budi Santoso", "12345678", "Akuntansi", "budi@domain.com", 2022)
+        crud.register_sorted_view("nama")
+        
+        rows = [
+            {"nama": "Citra Dewi", "nim": "30000000", "jurusan": "Teknik Sipil",
+             "email": "citra@domain.com", "tahun_masuk": 2022, "kategori": "lama", "ipk": 3.6},
+            {"nama": "Al", "nim": "abc", "jurusan": "Teknik Sipil", "email": "al@domain.com"},
+            {"nama": "Budi Lain", "nim": "12345678", "jurusan": "Akuntansi",
+             "email": "budi2@domain.com"},
+            {"nama": " Andi Saputra ", "nim": "10000000", "jurusan": "Teknik Elektro",
+             "email": "andi@domain.com", "kategori": "baru", "status": "AKTIF"},
+            {"nama": "Citra Kedua", "nim": "30000000", "jurusan": "Teknik Sipil",
+             "email": "citra2@domain.com"},
+        ]
+        
+        streamed = []
+        ok, msg, errors = crud.import_mahasiswa(
+            rows, workers=2, chunk_size=2, on_error=lambda n, m: streamed.append(n)
+        )
+        assert not ok and len(crud.read_all_mahasiswa()) == 1
+        assert streamed == [1, 2, 4] and [n for n, _ in errors] == streamed
+        assert "NIM 12345678 sudah terdaftar" in errors[1][1]
+        assert "duplikat dengan baris 0" in errors[2][1]
+        print(f"\n✓ {msg}")
+        for nomor, pesan in errors:
+            print(f"  baris {nomor}: {pesan}")
+        
+        version = crud.get_dataset_version()
+        ok, msg, _ = crud.import_mahasiswa(rows, workers=1, skip_invalid=True)
+        assert ok, msg
+        assert crud.get_dataset_version() == version + 1
+        data = crud.read_all_mahasiswa()
+        assert [m["nim"] for m in data] == ["12345678", "30000000", "10000000"]
+        assert data[1]["keterangan_ipk"] == "Cumlaude"
+        assert data[2]["nama"] == "Andi Saputra" and data[2]["kategori"] == "Mahasiswa Baru"
+        assert [m["nama"] for m in crud.get_sorted("nama")] == \
+            ["Andi Saputra", "Budi Santoso", "Citra Dewi"]
+        print(f"✓ {msg}; sorted view ikut diperbarui")
+        
+        # Validasi berjalan tanpa lock tulis: pembaca lain tidak menunggu,
+        # dan record yang dibuat selama validasi tidak tertimpa commit import
+        tidak_menunggu = []
+        
+        def rows_lambat():
+            yield {"nama": "Dewi Lestari", "nim": "40000000", "jurusan": "Akuntansi",
+                   "email": "dewi@domain.com"}
+            pembaca = threading.Thread(target=crud.read_snapshot)
+            pembaca.start()
+            pembaca.join(timeout=5)
+            tidak_menunggu.append(not pembaca.is_alive())
+            yield {"nama": "Eko Prasetyo", "nim": "50000000", "jurusan": "Akuntansi",
+                   "email": "eko@domain.com"}
+            # NIM baris 0 didaftarkan setelah chunk-nya dicek
+            crud.create_mahasiswa("Dewi Lain", "40000000", "Akuntansi", "dewi2@domain.com", 2023)
+        
+        ok, msg, errors = crud.import_mahasiswa(rows_lambat(), workers=1, chunk_size=1,
+                                                skip_invalid=True)
+        assert tidak_menunggu == [True], "Pembaca tidak boleh menunggu validasi import"
+        assert ok and errors == [(0, "NIM 40000000 sudah terdaftar")], (msg, errors)
+        data = crud.read_all_mahasiswa()
+        assert [m["nama"] for m in data[-2:]] == ["Dewi Lain", "Eko Prasetyo"]
+        print(f"✓ Pembaca tidak menunggu validasi; NIM dicek ulang saat commit: {msg}")
+    
+    print("\n✅ Parallel Import test PASSED\n")
+
+
+def test_shared_manager_threads():
+    """Test satu CRUDManager dipakai bersama banyak thread (session)."""
+    print("=" * 60)
+    print("TEST 28: Shared Manager Thread Safety")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path)
+        crud.register_sorted_view("nim")
+        sessions, per_session = 8, 15
+        failures = []
+        
+        def session(s: int) -> None:
+            for i in range(per_session):
+                nim = f"{s:02d}{i:06d}"
+                ok, msg = crud.create_mahasiswa(f"Mahasiswa {nim}", nim, "Akuntansi",
+                                                f"m{nim}@domain.com", 2023)
+                if not ok:
+                    failures.append(msg)
+                crud.get_sorted("nim", limit=5)
+        
+        threads = [threading.Thread(target=session, args=(s,)) for s in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        total = sessions * per_session
+        assert not failures, failures[:3]
+        assert len(crud.read_all_mahasiswa()) == total
+        assert len(CRUDManager(path).read_all_mahasiswa()) == total
+        nims = [m["nim"] for m in crud.get_sorted("nim")]
+        assert nims == sorted(nims) and len(set(nims)) == total
+        print(f"\n✓ {sessions} thread x {per_session} create: {total} record, tidak ada yang hilang")
+        
+        # Baca dari view yang sudah terdaftar tidak mengambil lock tulis:
+        # tetap jalan walau ada pembaca lain yang sedang memegang lock baca
+        hasil_baca = []
+        pembaca_lain = crud._rwlock.baca()
+        pembaca_lain.__enter__()
+        try:
+            thread = threading.Thread(target=lambda: hasil_baca.append((
+                crud.get_sorted("nim", limit=3),
+                crud.query_mahasiswa(status=["aktif"], sort_key="nim", limit=3),
+            )))
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive(), "Pembacaan sorted view tidak boleh menunggu pembaca lain"
+        finally:
+            pembaca_lain.__exit__(None, None, None)
+        thread.join()
+        assert len(hasil_baca[0][0]) == 3 and hasil_baca[0][1][1] == total
+        print("✓ get_sorted / query_mahasiswa berjalan bersamaan dengan pembaca lain")
+        
+        # read_snapshot: pasangan (data, versi) konsisten walau ada penulis.
+        # Setiap create menambah satu record dan satu versi, jadi selisih
+        # versi - jumlah record harus tetap
+        selisih = set()
+        selesai = threading.Event()
+        
+        def pembaca() -> None:
+            while not selesai.is_set():
+                data, version = crud.read_snapshot()
+                selisih.add(version - len(data))
+        
+        readers = [threading.Thread(target=pembaca) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for i in range(30):
+            nim = f"77{i:06d}"
+            crud.create_mahasiswa(f"Mahasiswa {nim}", nim, "Akuntansi", f"m{nim}@domain.com", 2023)
+        selesai.set()
+        for thread in readers:
+            thread.join()
+        assert len(selisih) == 1, selisih
+        print("✓ read_snapshot: data dan dataset version selalu dari versi yang sama")
+        
+        # Sort cache bersama juga aman dipakai banyak thread
+        cache = SortCache()
+        data, version = crud.read_snapshot()
+        
+        def sort_session() -> None:
+            for ascending in (True, False) * 10:
+                if cache.get("merge_sort", "nama", ascending, version, data) is None:
+                    result, _ = AlgoritmaSorting.merge_sort(data, "nama", ascending)
+                    cache.put_result("merge_sort", "nama", ascending, version, data, result)
+        
+        threads = [threading.Thread(target=sort_session) for _ in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(cache) == 2 and cache.hits + cache.misses == sessions * 20
+        print(f"✓ Sort cache bersama: {cache.hits} hit, {cache.misses} miss")
+    
+    print("\n✅ Shared Manager test PASSED\n")
+
+
+def _create_di_process(path: str, prefix: int, jumlah: int) -> int:
+    """Worker process untuk test file lock: manager sendiri, file yang sama."""
+    crud = CRUDManager(path)
+    berhasil = 0
+    for i in range(jumlah):
+        nim = f"9{prefix:02d}{i:05d}"
+        ok, _ = crud.create_mahasiswa(f"Proses {nim}", nim, "Akuntansi",
+                                      f"p{nim}@domain.com", 2024)
+        berhasil += ok
+    return berhasil
+
+
+def test_concurrency_stress():
+    """Stress test 32 thread: baca bersamaan, tulis berurutan, tidak ada yang hilang."""
+    print("=" * 60)
+    print("TEST 29: Concurrency Stress (32 thread + 2 process)")
+    print("=" * 60)
+    
+    # Semantik ReadWriteLock: pembaca bersamaan, penulis eksklusif
+    lock = ReadWriteLock()
+    events = []
+    with lock.baca():
+        def baca() -> None:
+            with lock.baca():
+                events.append("baca")
+        
+        reader_thread = threading.Thread(target=baca)
+        reader_thread.start()
+        reader_thread.join(1)
+        assert events == ["baca"], "Pembaca lain harus bisa masuk bersamaan"
+        writer_done = threading.Event()
+        
+        def tulis() -> None:
+            with lock.tulis():
+                events.append("tulis")
+            writer_done.set()
+        
+        writer_thread = threading.Thread(target=tulis)
+        writer_thread.start()
+        assert not writer_done.wait(0.1), "Penulis harus menunggu pembaca"
+        try:
+            with lock.tulis():
+                pass
+            assert False, "Naik dari baca ke tulis harus ditolak"
+        except RuntimeError:
+            pass
+    assert writer_done.wait(1) and events == ["baca", "tulis"]
+    writer_thread.join()
+    print("\n✓ ReadWriteLock: penulis menunggu pembaca, upgrade baca->tulis ditolak")
+    
+    with _temp_json_path() as path, _temp_json_path() as users_path:
+        crud = CRUDManager(path)
+        auth = AuthManager(users_path)
+        writers, readers, per_writer = 16, 16, 10
+        failures = []
+        
+        def writer(w: int) -> None:
+            for i in range(per_writer):
+                nim = f"{w:02d}{i:06d}"
+                ok, msg = crud.create_mahasiswa(f"Mahasiswa {nim}", nim, "Akuntansi",
+                                                f"m{nim}@domain.com", 2023)
+                ok2, msg2 = crud.update_mahasiswa(nim, status="cuti")
+                if not (ok and ok2):
+                    failures.append(msg if not ok else msg2)
+            ok, msg = auth.register(f"staff{w:02d}", "rahasia123", f"Staff {w:02d}",
+                                    f"staff{w:02d}@kampus.ac.id")
+            if not ok:
+                failures.append(msg)
+        
+        def reader() -> None:
+            for _ in range(per_writer * 2):
+                nims = [m["nim"] for m in crud.get_sorted("nim")]
+                if nims != sorted(nims):
+                    failures.append("sorted view tidak konsisten")
+                crud.get_statistik()
+                ok, _, _ = auth.login("admin", "admin123")
+                if not ok:
+                    failures.append("login gagal saat ada penulis")
+        
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+        threads += [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        total = writers * per_writer
+        assert not failures, failures[:3]
+        data = CRUDManager(path).read_all_mahasiswa()
+        assert len(data) == total and all(m["status"] == "cuti" for m in data)
+        assert len(auth.get_all_users()) == 2 + writers
+        print(f"✓ {len(threads)} thread: {total} create + {total} update, "
+              f"{writers} register, tanpa kehilangan data")
+        
+        # Dua process dengan manager masing-masing menulis ke file yang sama
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            hasil = list(executor.map(_create_di_process, [path, path], [1, 2], [20, 20]))
+        assert hasil == [20, 20]
+        assert len(crud.read_all_mahasiswa()) == total + 40
+        print(f"✓ 2 process x 20 create lewat fcntl.flock: {len(crud.read_all_mahasiswa())} record")
+    
+    print("\n✅ Concurrency Stress test PASSED\n")
+
+
+def test_optimistic_concurrency():
+    """Test versi per record: update/delete dengan versi lama ditolak."""
+    print("=" * 60)
+    print("TEST 30: Optimistic Concurrency (Versi Record)")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path, encode_on_disk=True)
+        crud.create_mahasiswa("Budi Santoso", "12345678", "Akuntansi", "budi@domain.com", 2022)
+        budi = crud.get_mahasiswa("12345678")
+        assert crud.get_versi(budi) == 1
+        
+        # Dua admin membuka data yang sama (versi 1)
+        ok, msg = crud.update_mahasiswa("12345678", nama="Budi S.", expected_versi=1)
+        assert ok, msg
+        ok, msg = crud.update_mahasiswa("12345678", status="cuti", expected_versi=1)
+        assert not ok and "Konflik" in msg and "versi 2" in msg
+        assert msg.startswith(CRUDManager.PESAN_KONFLIK)
+        print(f"\n✓ Update kedua ditolak: {msg}")
+        
+        data = CRUDManager(path).read_all_mahasiswa()
+        assert data[0]["nama"] == "Budi S." and data[0]["status"] == "aktif"
+        assert data[0]["versi"] == 2
+        assert crud.get_table().value("versi", 0) == 2
+        assert crud.get_table().row(0)["versi"] == 2
+        
+        ok, msg = crud.delete_mahasiswa("12345678", expected_versi=1)
+        assert not ok and "Konflik" in msg
+        ok, msg = crud.update_mahasiswa("12345678", status="cuti")
+        assert ok and crud.get_versi(crud.get_mahasiswa("12345678")) == 3
+        ok, msg = crud.delete_mahasiswa("12345678", expected_versi=3)
+        assert ok, msg
+        print("✓ Delete dengan versi lama ditolak, dengan versi terbaru berhasil")
+        
+        # Record lama tanpa field versi dianggap versi awal
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"nama": "Lama", "nim": "87654321", "jurusan": "Akuntansi",
+                        "email": "lama@domain.com", "tahun_masuk": 2020,
+                        "status": "aktif", "tanggal_dibuat": "2020-01-01 00:00:00"}], f)
+        assert crud.get_versi(crud.get_mahasiswa("87654321")) == CRUDManager.VERSI_AWAL
+        ok, msg = crud.update_mahasiswa("87654321", status="lulus", expected_versi=1)
+        assert ok and crud.read_all_mahasiswa()[0]["versi"] == 2
+        print("✓ Record tanpa versi dianggap versi 1")
+    
+    print("\n✅ Optimistic Concurrency test PASSED\n")
+
+
+def test_asset_pipeline():
+    """Test aset gambar diproses sekali per mtime dan ditulis ke static/."""
+    print("=" * 60)
+    print("TEST 31: Pipeline Aset Gambar (Cache per mtime)")
+    print("=" * 60)
+    
+    folder_static_asli = aset.FOLDER_STATIC
+    with tempfile.TemporaryDirectory() as tmp:
+        aset.FOLDER_STATIC = os.path.join(tmp, "static")
+        try:
+            sumber = os.path.join(tmp, "background.jpg")
+            with open("assets/background.jpg", "rb") as f:
+                asli = f.read()
+            with open(sumber, "wb") as f:
+                f.write(asli)
+            
+            bg = aset.muat_aset(sumber, lebar_maks=400)
+            assert bg is aset.muat_aset(sumber, lebar_maks=400)
+            assert bg.mime == "image/jpeg" and len(bg.data) < len(asli)
+            assert bg.data_uri.startswith("data:image/jpeg;base64,")
+            with open(os.path.join(aset.FOLDER_STATIC, bg.nama_file), "rb") as f:
+                assert f.read() == bg.data
+            assert bg.url == f"/app/static/{bg.nama_file}?v={bg.versi}"
+            print(f"\n✓ Varian {bg.nama_file}: {len(asli):,} -> {len(bg.data):,} bytes")
+            
+            logo = aset.muat_aset("assets/logo.png", lebar_maks=300)
+            from PIL import Image
+            with Image.open(io.BytesIO(logo.data)) as img:
+                assert img.width == 300
+            print(f"✓ Logo diperkecil ke lebar 300 px ({len(logo.data):,} bytes)")
+            
+            # File sumber diganti: mtime berubah, aset diproses ulang
+            stat = os.stat(sumber)
+            os.utime(sumber, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            bg_baru = aset.muat_aset(sumber, lebar_maks=400)
+            assert bg_baru is not bg and bg_baru.versi != bg.versi
+            print("✓ Perubahan mtime memicu proses ulang")
+            
+            assert aset.muat_aset(os.path.join(tmp, "tidak_ada.jpg")) is None
+            # Ada (os.stat berhasil) tetapi tidak bisa dibuka sebagai file
+            assert aset.muat_aset(tmp) is None
+            print("✓ File tidak ada / tidak bisa dibaca menghasilkan None")
+        finally:
+            aset.FOLDER_STATIC = folder_static_asli
+            aset._proses_aset.cache_clear()
+    
+    print("\n✅ Asset Pipeline test PASSED\n")
+
+
+def test_paginated_query():
+    """Test query_mahasiswa: filter, urutan, dan halaman dievaluasi di server."""
+    print("=" * 60)
+    print("TEST 32: Query Berhalaman (Server-side Pagination)")
+    print("=" * 60)
+    
+    with _temp_json_path() as path:
+        crud = CRUDManager(path)
+        rows = [
+            {"nama": f"Mahasiswa {(i * 7) % 50:02d}", "nim": f"{20000000 + i}",
+             "jurusan": ["Akuntansi", "Hukum", "Teknik Sipil"][i % 3],
+             "email": f"m{i}@domain.com", "tahun_masuk": 2020 + i % 4,
+             "status": ["aktif", "cuti"][i % 2]}
+            for i in range(50)
+        ]
+        ok, msg, _ = crud.import_mahasiswa(rows, workers=1)
+        assert ok, msg
+        semua = crud.read_all_mahasiswa()
+        
+        halaman, total = crud.query_mahasiswa(offset=10, limit=5)
+        assert total == 50 and halaman == semua[10:15]
+        print(f"\n✓ Tanpa filter/urutan: halaman = slice data ({total} total)")
+        
+        urut = sorted(semua, key=lambda m: m["nama"], reverse=True)
+        halaman, total = crud.query_mahasiswa(sort_key="nama", ascending=False, offset=45, limit=10)
+        assert total == 50 and [m["nama"] for m in halaman] == [m["nama"] for m in urut[45:]]
+        print("✓ Urutan dari sorted view, halaman terakhir terpotong")
+        
+        cocok = [m for m in semua if m["jurusan"] in ("Hukum", "Akuntansi") and m["status"] == "cuti"]
+        halaman, total = crud.query_mahasiswa(["Hukum", "Akuntansi"], ["cuti"], offset=3, limit=4)
+        assert total == len(cocok) and halaman == cocok[3:7]
+        
+        cocok_urut = sorted(cocok, key=lambda m: m["tahun_masuk"])
+        halaman, total = crud.query_mahasiswa(
+            ["Hukum", "Akuntansi"], ["cuti"], sort_key="tahun_masuk", offset=2, limit=5
+        )
+        assert total == len(cocok) and halaman == cocok_urut[2:7]
+        print(f"✓ Filter (+ urutan) dievaluasi sebelum halaman dipotong ({total} cocok)")
+        
+        assert crud.query_mahasiswa(["Kedokteran"], offset=0, limit=10) == ([], 0)
+        try:
+            crud.query_mahasiswa(sort_key="ipk")
+            assert False, "sort_key tidak valid harus ditolak"
+        except ValueError:
+            pass
+        print("✓ Filter tanpa hasil dan kolom urutan tidak valid ditangani")
+    
+    print("\n✅ Paginated Query test PASSED\n")
+
+
+def test_dataframe_cache():
+    """Test snapshot DataFrame: dibangun sekali per versi, kategori, eviction."""
+    print("=" * 60)
+    print("TEST 33: DataFrame Snapshot Cache")
+    print("=" * 60)
+    
+    with _temp_json_path() as path, _temp_json_path() as path_lain:
+        crud = CRUDManager(path)
+        rows = [
+            {"nama": "Andi Saputra", "nim": "10000001", "jurusan": "Teknik Sipil",
+             "email": "andi@domain.com", "kategori": "baru", "program_orientasi": True},
+            {"nama": "Citra Dewi", "nim": "10000002", "jurusan": "Akuntansi",
+             "email": "citra@domain.com", "kategori": "lama", "ipk": 3.6, "status": "cuti"},
+            {"nama": "Budi Santoso", "nim": "10000003", "jurusan": "Teknik Sipil",
+             "email": "budi@domain.com"},
+        ]
+        ok, msg, _ = crud.import_mahasiswa(rows, workers=1)
+        assert ok, msg
+        
+        cache = DataFrameCache()
+        snapshot = cache.get(crud)
+        assert cache.get(crud) is snapshot and (cache.hits, cache.misses) == (1, 1)
+        df = snapshot.df
+        assert str(df["jurusan"].dtype) == "category" and str(df["status"].dtype) == "category"
+        
+        expected = pd.DataFrame(crud.read_all_mahasiswa())
+        assert sorted(df.columns) == sorted(expected.columns)
+        for kolom in df.columns:
+            aktual = [None if pd.isna(v) else v for v in df[kolom].astype(object)]
+            harapan = [None if pd.isna(v) else v for v in expected[kolom].astype(object)]
+            assert aktual == harapan, kolom
+        print(f"\n✓ Snapshot sama dengan pd.DataFrame(records), {snapshot.nbytes:,} bytes")
+        
+        versi = crud.get_dataset_version()
+        urut = crud.get_sorted("nama")
+        hasil = snapshot.baris(urut, versi)
+        assert list(hasil["nim"]) == [m["nim"] for m in urut]
+        assert list(hasil.index) == [0, 1, 2]
+        asing = {"nama": "Asing", "nim": "99999999", "jurusan": "Hukum"}
+        assert list(snapshot.baris([asing], versi)["nim"]) == ["99999999"]
+        print("✓ baris(): urutan record dipertahankan, record di luar snapshot ditangani")
+        
+        crud.update_mahasiswa("10000003", status="lulus")
+        # Records versi baru dengan snapshot lama: isi baris dari records
+        data, versi_baru = crud.read_snapshot()
+        assert "lulus" in list(snapshot.baris(data, versi_baru)["status"])
+        assert "lulus" not in list(snapshot.df["status"])
+        baru = cache.get(crud)
+        assert baru is not snapshot and len(cache) == 1
+        assert list(baru.df["status"]) == ["aktif", "cuti", "lulus"]
+        print("✓ Dataset version baru menggantikan snapshot lama")
+        
+        # Batas memori: hanya snapshot yang paling baru dipakai yang tersisa
+        crud_lain = CRUDManager(path_lain)
+        crud_lain.create_mahasiswa("Dewi Lestari", "20000001", "Hukum", "dewi@domain.com", 2021)
+        cache.max_bytes = baru.nbytes + 1
+        cache.get(crud_lain)
+        assert len(cache) == 1 and cache.size_bytes <= cache.max_bytes
+        print("✓ Eviction LRU menjaga total ukuran <= max_bytes")
+    
+    print("\n✅ DataFrame Cache test PASSED\n")
+
+
 def test_sorting_algorithms():
     """Test Sorting Algorithms."""
     print("=" * 60)
@@ -166,6 +1174,10 @@ def test_sorting_algorithms():
     result, comparisons = sorting.merge_sort(test_data, "nama", True)
     print(f"  Comparisons: {comparisons}")
     print(f"  Result: {result[0]['nama']} → {result[1]['nama']} → {result[2]['nama']}")
+    # List dict tidak disalin: hasil berisi referensi record yang sama
+    records = [m.info() for m in test_data]
+    assert sorted(map(id, sorting.merge_sort(records, "nama", True)[0])) == \
+        sorted(map(id, records))
     
     # Test Shell Sort
     print("\n✓ Shell Sort:")
@@ -185,6 +1197,268 @@ def test_sorting_algorithms():
     print("\n✅ Sorting test PASSED\n")
 
 
+def test_merge_sort_bottom_up():
+    """Test Bottom-Up Merge Sort (run alami, stabilitas)."""
+    print("=" * 60)
+    print("TEST 14: Bottom-Up Merge Sort")
+    print("=" * 60)
+    
+    cases = {
+        "terurut": [{"nim": f"{10000000 + i}", "urutan": i} for i in range(100)],
+        "terbalik": [{"nim": f"{10000100 - i}", "urutan": i} for i in range(100)],
+        "duplikat": [{"nim": f"{10000000 + (i * 7) % 5}", "urutan": i} for i in range(100)],
+    }
+    
+    for label, test_data in cases.items():
+        for ascending in (True, False):
+            result, comparisons = AlgoritmaSorting.merge_sort(test_data, "nim", ascending)
+            expected = sorted(test_data, key=lambda m: m["nim"], reverse=not ascending)
+            print(f"✓ {label:9} ascending={ascending}: {comparisons} perbandingan")
+            assert result == expected, "Merge sort harus stabil"
+    
+    # Data yang sudah terurut cukup diperiksa satu kali (satu run alami)
+    _, comparisons = AlgoritmaSorting.merge_sort(cases["terurut"], "nim", True)
+    assert comparisons == 99
+    
+    print("\n✅ Bottom-Up Merge Sort test PASSED\n")
+
+
+def test_shell_gap_sequences():
+    """Test Shell Sort dengan berbagai gap sequence."""
+    print("=" * 60)
+    print("TEST 15: Shell Sort Gap Sequences")
+    print("=" * 60)
+    
+    test_data = [{"nim": f"{10000000 + (i * 7919) % 1000}"} for i in range(1000)]
+    expected = sorted(m["nim"] for m in test_data)
+    
+    for sequence in ["shell", "knuth", "sedgewick", "tokuda", "ciura"]:
+        result, comparisons = AlgoritmaSorting.shell_sort(test_data, "nim", True, sequence)
+        big_o = AlgoritmaSorting.get_big_o_notation("shell_sort", sequence)
+        print(f"✓ {big_o['nama']:22} avg {big_o['average_case']:20} {comparisons} perbandingan")
+        assert [m["nim"] for m in result] == expected
+    
+    try:
+        AlgoritmaSorting.shell_sort(test_data, "nim", True, "fibonacci")
+        assert False, "Gap sequence tidak dikenal harus ditolak"
+    except ValueError:
+        print("✓ Gap sequence tidak dikenal ditolak")
+    
+    print("\n✅ Shell Sort Gap Sequences test PASSED\n")
+
+
+def test_auto_sort():
+    """Test Auto Sort (pemilihan engine adaptif)."""
+    print("=" * 60)
+    print("TEST 16: Auto Sort")
+    print("=" * 60)
+    
+    acak = [{"nim": f"{10000000 + (i * 7919) % 3000}", "jurusan": ["TI", "SI"][i % 2]}
+            for i in range(3000)]
+    hampir_terurut = sorted(acak[:500], key=lambda m: m["nim"])
+    hampir_terurut[10], hampir_terurut[11] = hampir_terurut[11], hampir_terurut[10]
+    
+    # Elemen "turtle": satu nilai terkecil di akhir data terurut
+    turtle = [{"nama": f"Mahasiswa {i:04d}"} for i in range(999)] + [{"nama": "Aan"}]
+    
+    cases = [
+        (acak[:5], "nim", "merge_sort"),
+        (acak, "jurusan", "counting_sort"),
+        (hampir_terurut, "nim", "merge_sort"),
+        (turtle, "nama", "merge_sort"),
+        (acak, "nim", "merge_sort"),
+    ]
+    for test_data, key, expected_engine in cases:
+        result, comparisons, keputusan = AlgoritmaSorting.auto_sort(test_data, key)
+        print(f"✓ n={len(test_data)}, key={key}: {keputusan['engine']} - {keputusan['alasan']}")
+        assert keputusan["engine"] == expected_engine
+        assert result == sorted(test_data, key=lambda m: m[key])
+    
+    # Tidak pernah O(n²): data terurut + turtle tetap ~n perbandingan
+    _, comparisons, _ = AlgoritmaSorting.auto_sort(turtle, "nama")
+    assert comparisons <= 2 * len(turtle), comparisons
+    print(f"✓ Turtle: {comparisons} perbandingan (Bubble Sort: 499500)")
+    
+    try:
+        AlgoritmaSorting.bubble_sort(acak * 2, "nim")
+        assert False, "Bubble Sort harus menolak data di atas BATAS_QUADRATIC"
+    except ValueError as e:
+        print(f"✓ Size guard: {e}")
+    
+    print("\n✅ Auto Sort test PASSED\n")
+
+
+def test_parallel_merge_sort():
+    """Test Parallel Merge Sort."""
+    print("=" * 60)
+    print("TEST 9: Parallel Merge Sort")
+    print("=" * 60)
+    
+    test_data = [
+        {"nama": f"Mahasiswa {i % 50:02d}", "nim": f"{10000000 + i}"}
+        for i in range(400)
+    ]
+    
+    sorting = AlgoritmaSorting()
+    
+    for ascending in (True, False):
+        expected, _ = sorting.merge_sort(test_data, "nama", ascending)
+        result, comparisons = sorting.parallel_merge_sort(
+            test_data, "nama", ascending, workers=2, min_chunk_size=100
+        )
+        print(f"\n✓ ascending={ascending}: {comparisons} perbandingan")
+        assert result == expected, "Hasil parallel harus sama (dan stabil) dengan merge sort"
+    
+    print("\n✅ Parallel Merge Sort test PASSED\n")
+
+
+def test_external_merge_sort():
+    """Test External Merge Sort."""
+    print("=" * 60)
+    print("TEST 10: External Merge Sort")
+    print("=" * 60)
+    
+    test_data = [
+        {"nama": f"Alumni {(i * 37) % 300:03d}", "nim": f"{20000000 + i}",
+         "status": "lulus" if i % 3 else "aktif"}
+        for i in range(300)
+    ]
+    
+    with _temp_json_path() as path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(test_data, f, indent=2)
+        
+        output = io.StringIO()
+        stats = AlgoritmaSorting.external_merge_sort(
+            path, output, "nama", True,
+            memory_limit=2000, max_fan_in=3,
+            predicate=lambda m: m["status"] == "lulus"
+        )
+        result = [json.loads(line) for line in output.getvalue().splitlines()]
+    
+    expected = sorted(
+        [m for m in test_data if m["status"] == "lulus"], key=lambda m: m["nama"]
+    )
+    print(f"\n✓ Record: {stats['jumlah_record']}, Run: {stats['jumlah_run']}, "
+          f"Pass: {stats['jumlah_pass']}")
+    assert result == expected
+    assert stats["jumlah_run"] > 3 and stats["jumlah_pass"] > 2
+    
+    # File code table (encode_on_disk=True) dibaca dan di-decode secara streaming
+    encoded_data = [
+        dict(m, jurusan=("Teknik Sipil", "Sistem Informasi")[i % 2],
+             email=f"alumni{i}@domain.com")
+        for i, m in enumerate(test_data)
+    ]
+    with _temp_json_path() as path:
+        CRUDManager(path, encode_on_disk=True)._save_to_file(encoded_data)
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["format"] == CRUDManager.FORMAT_KODE
+        output = io.StringIO()
+        AlgoritmaSorting.external_merge_sort(path, output, "nama", False, memory_limit=2000)
+        result = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert result == sorted(encoded_data, key=lambda m: m["nama"], reverse=True)
+    print(f"✓ File {CRUDManager.FORMAT_KODE}: {len(result)} record di-decode dan terurut")
+    
+    print("\n✅ External Merge Sort test PASSED\n")
+
+
+def test_radix_sort():
+    """Test Radix Sort untuk NIM."""
+    print("=" * 60)
+    print("TEST 11: Radix Sort (NIM)")
+    print("=" * 60)
+    
+    test_data = [
+        {"nama": "A", "nim": "241011400010"},
+        {"nama": "B", "nim": "99887766"},
+        {"nama": "C", "nim": "12345678"},
+        {"nama": "D", "nim": "241011400000"},
+        {"nama": "E", "nim": "99887766"},
+    ]
+    
+    for ascending in (True, False):
+        expected, _ = AlgoritmaSorting.merge_sort(test_data, "nim", ascending)
+        result, metric = AlgoritmaSorting.radix_sort(test_data, "nim", ascending)
+        print(f"\n✓ ascending={ascending}: {[m['nama'] for m in result]} | {metric}")
+        assert result == expected
+        assert metric == {"jumlah_pass": 12, "operasi_bucket": 60}
+    
+    try:
+        AlgoritmaSorting.radix_sort(test_data, "nama")
+        assert False, "Kunci non-angka harus ditolak"
+    except ValueError as e:
+        print(f"\n✓ Non-numeric key ditolak: {e}")
+    
+    # Digit Unicode non-ASCII (full-width, superscript) juga ditolak
+    for nim in ("1234567８", "1234567²"):
+        try:
+            AlgoritmaSorting.radix_sort(test_data + [{"nama": "F", "nim": nim}], "nim")
+            assert False, f"NIM {nim!r} harus ditolak"
+        except ValueError:
+            pass
+    
+    print("\n✅ Radix Sort test PASSED\n")
+
+
+def test_counting_sort():
+    """Test Counting Sort untuk kunci dengan sedikit nilai berbeda."""
+    print("=" * 60)
+    print("TEST 12: Counting Sort (Low Cardinality)")
+    print("=" * 60)
+    
+    jurusan = ["TI", "SI", "TE", "TI", "AK", "SI", "TI"]
+    test_data = [
+        {"nama": f"Mhs {i}", "jurusan": j} for i, j in enumerate(jurusan)
+    ]
+    value_counts = {"TI": 3, "SI": 2, "TE": 1, "AK": 1}
+    
+    print(f"\n✓ Low cardinality (jurusan): "
+          f"{AlgoritmaSorting.is_low_cardinality(test_data, 'jurusan', 4)}")
+    assert AlgoritmaSorting.is_low_cardinality(test_data, "jurusan", 4)
+    assert not AlgoritmaSorting.is_low_cardinality(test_data, "nama", 4)
+    
+    for ascending in (True, False):
+        expected, _ = AlgoritmaSorting.merge_sort(test_data, "jurusan", ascending)
+        result, metric = AlgoritmaSorting.counting_sort(test_data, "jurusan", ascending)
+        with_counts, _ = AlgoritmaSorting.counting_sort(
+            test_data, "jurusan", ascending, value_counts
+        )
+        print(f"✓ ascending={ascending}: {[m['nama'] for m in result]} | {metric}")
+        assert result == expected and with_counts == expected
+    
+    print("\n✅ Counting Sort test PASSED\n")
+
+
+def test_top_k():
+    """Test Top-K partial sort."""
+    print("=" * 60)
+    print("TEST 13: Top-K (Bounded Heap)")
+    print("=" * 60)
+    
+    test_data = [
+        {"nama": "A", "jurusan": "TI", "ipk": 3.2},
+        {"nama": "B", "jurusan": "SI", "ipk": 3.9},
+        {"nama": "C", "jurusan": "TI", "ipk": 3.9},
+        {"nama": "D", "jurusan": "TI"},
+        {"nama": "E", "jurusan": "SI", "ipk": 2.8},
+        {"nama": "F", "jurusan": "TI", "ipk": 3.5},
+    ]
+    
+    result, comparisons = AlgoritmaSorting.top_k(test_data, "ipk", 3)
+    print(f"\n✓ Top 3 IPK: {[m['nama'] for m in result]} ({comparisons} perbandingan)")
+    assert [m["nama"] for m in result] == ["B", "C", "F"]
+    
+    grouped, _ = AlgoritmaSorting.top_k(test_data, "ipk", 1, group_by="jurusan")
+    print(f"✓ Top 1 per jurusan: { {j: [m['nama'] for m in v] for j, v in grouped.items()} }")
+    assert {j: [m["nama"] for m in v] for j, v in grouped.items()} == {"TI": ["C"], "SI": ["B"]}
+    
+    lowest, _ = AlgoritmaSorting.top_k(test_data, "ipk", 2, ascending=True)
+    assert [m["nama"] for m in lowest] == ["E", "A"]
+    
+    print("\n✅ Top-K test PASSED\n")
+
+
 def test_searching_algorithms():
     """Test Searching Algorithms."""
     print("=" * 60)
@@ -341,6 +1615,31 @@ def main():
         test_searching_algorithms()
         test_error_handling()
         test_object_references()
+        test_parallel_merge_sort()
+        test_external_merge_sort()
+        test_radix_sort()
+        test_counting_sort()
+        test_top_k()
+        test_merge_sort_bottom_up()
+        test_shell_gap_sequences()
+        test_auto_sort()
+        test_sorted_views()
+        test_vectorized_engine()
+        test_sort_cache()
+        test_instrumentation_toggle()
+        test_mahasiswa_slots_view()
+        test_mahasiswa_table()
+        test_dictionary_encoding()
+        test_lazy_hydration()
+        test_batch_factory()
+        test_batch_validation()
+        test_parallel_import()
+        test_shared_manager_threads()
+        test_concurrency_stress()
+        test_optimistic_concurrency()
+        test_asset_pipeline()
+        test_paginated_query()
+        test_dataframe_cache()
         
         print("\n" + "=" * 60)
         print("✅ ALL TESTS PASSED!")